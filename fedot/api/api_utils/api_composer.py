@@ -60,9 +60,10 @@ class ApiComposer(ApiMetrics, ApiInitialAssumptions):
 
         composer_params_dict = dict(max_depth=None, max_arity=None, pop_size=None, num_of_generations=None,
                                     available_operations=None, composer_metric=None, validation_blocks=None,
-                                    cv_folds=None, genetic_scheme=None, history_folder=None)
+                                    cv_folds=None, genetic_scheme=None, history_folder=None,
+                                    fidelity_levels=None)
 
-        tuner_params_dict = dict(with_tuning=False, tuner_metric=None)
+        tuner_params_dict = dict(with_tuning=False, tuner_metric=None, tuner_n_jobs=1)
 
         dict_list = [api_params_dict, composer_params_dict, tuner_params_dict]
         for i, dct in enumerate(dict_list):
@@ -172,6 +173,7 @@ class ApiComposer(ApiMetrics, ApiInitialAssumptions):
                                    num_of_generations=composer_params['num_of_generations'],
                                    cv_folds=composer_params['cv_folds'],
                                    validation_blocks=composer_params['validation_blocks'],
+                                   fidelity_levels=composer_params.get('fidelity_levels'),
                                    timeout=datetime.timedelta(minutes=timeout_for_composing))
 
         genetic_scheme_type = GeneticSchemeTypesEnum.parameter_free
@@ -246,7 +248,8 @@ class ApiComposer(ApiMetrics, ApiInitialAssumptions):
                                                                           iterations=iterations,
                                                                           timeout=timeout_for_tuning,
                                                                           cv_folds=folds,
-                                                                          validation_blocks=vb_number)
+                                                                          validation_blocks=vb_number,
+                                                                          n_jobs=tuning_params.get('tuner_n_jobs', 1))
 
         api_params['logger'].message('Model composition finished')
 
@@ -35,8 +35,10 @@ class Fedot:
             'timeout' - composing time (minutes)
             'available_operations' - list of model names to use
             'with_tuning' - allow huperparameters tuning for the model
+            'tuner_n_jobs' - number of tuning trials evaluated simultaneously (-1 means all the available cores)
             'cv_folds' - number of folds for cross-validation
             'validation_blocks' - number of validation blocks for time series forecasting
+            'fidelity_levels' - fractions of the data (e.g. [0.1, 0.3]) for the successive halving evaluation
             'initial_pipeline' - initial assumption for composing
             'genetic_scheme' - name of the genetic scheme
             'history_folder' - name of the folder for composing history
@@ -1,61 +1,184 @@
 import glob
 import os
+import pickle
 import shelve
-import uuid
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Optional
 
 from fedot.core.utils import default_fedot_data_dir
 
 CachedState = namedtuple('CachedState', 'operation')
 
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 ** 2
+DEFAULT_FITNESS_CACHE_SIZE = 1000
+
 
 class OperationsCache:
-    def __init__(self, db_path=None, clear_exiting=True):
-        if not db_path:
-            self.db_path = f'{str(default_fedot_data_dir())}/tmp_{str(uuid.uuid4())}'
-        else:
-            self.db_path = db_path
+    """
+    Two-tier storage of the fitted operations: the in-process LRU storage bounded by size in bytes
+    and the optional on-disk storage that keeps the operations evicted from memory.
+    The operations are identified by the digest of the node subtree description and
+    the fingerprint of the data used for fitting.
+
+    :param db_path: path to the on-disk storage. The on-disk storage is not used if None
+    :param clear_exiting: flag to remove the existing on-disk storage
+    :param max_bytes: maximal size of the operations stored in memory (bytes)
+    """
+
+    def __init__(self, db_path: Optional[str] = None, clear_exiting: bool = True,
+                 max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+
+        self._memory_storage = OrderedDict()
+        self._disk_storage = None
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
         if clear_exiting:
             self.clear()
 
-    def save_node(self, node):
+    def save_node(self, node, data_fingerprint: Optional[Hashable] = None):
+        """
+        :param node: node with the fitted operation
+        :param data_fingerprint: characteristics of the data used for the node fitting
+        """
         if node.fitted_operation is not None:
-            _save_cache_for_node(self.db_path, node.descriptive_id,
-                                 CachedState(node.fitted_operation))
+            self._save(_cache_key(node, data_fingerprint), CachedState(node.fitted_operation))
 
-    def save_pipeline(self, pipeline):
+    def save_pipeline(self, pipeline, data_fingerprint: Optional[Hashable] = None):
+        """
+        :param pipeline: pipeline with the fitted nodes
+        :param data_fingerprint: characteristics of the data used for the pipeline fitting
+        """
         for node in pipeline.nodes:
-            _save_cache_for_node(self.db_path, node.descriptive_id,
-                                 CachedState(node.fitted_operation))
+            self.save_node(node, data_fingerprint)
+
+    def get(self, node, data_fingerprint: Optional[Hashable] = None) -> Optional[CachedState]:
+        """
+        :param node: node to find the fitted operation for
+        :param data_fingerprint: characteristics of the data the operation must be fitted on
+        """
+        key = _cache_key(node, data_fingerprint)
+        pickled_state = self._memory_storage.get(key)
+        if pickled_state is not None:
+            self._memory_storage.move_to_end(key)
+        elif self.db_path is not None:
+            pickled_state = self._get_disk_storage().get(key)
+            if pickled_state is not None:
+                self._save_to_memory(key, pickled_state)
+
+        if pickled_state is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(pickled_state)
+
+    @property
+    def hit_ratio(self) -> float:
+        requests_num = self.hits + self.misses
+        return self.hits / requests_num if requests_num else 0.
 
     def clear(self, tmp_only=False):
-        if not tmp_only:
-            for ext in ['bak', 'dir', 'dat']:
+        self._memory_storage.clear()
+        self.bytes_held = 0
+        self.close()
+        if not tmp_only and self.db_path is not None:
+            for ext in ['bak', 'dir', 'dat', 'db']:
                 if os.path.exists(f'{self.db_path}.{ext}'):
                     os.remove(f'{self.db_path}.{ext}')
+            if os.path.exists(self.db_path):
+                os.remove(self.db_path)
         folder_path = f'{str(default_fedot_data_dir())}/tmp_*'
         clear_folder(folder_path)
 
-    def get(self, node):
-        found_operation = _load_cache_for_node(self.db_path, node.descriptive_id)
-        # TODO: Add node and node from cache "fitted on data" field comparison
-        return found_operation
-
-
-def _save_cache_for_node(db_path: str, structural_id: str,
-                         cache_from_node: CachedState):
-    if cache_from_node.operation is not None:
-        # if node successfully fitted
-        with shelve.open(db_path) as cache:
-            cache[structural_id] = cache_from_node
-
-
-def _load_cache_for_node(db_path: str, structural_id: str):
-    with shelve.open(db_path) as cache:
-        cached_state = cache.get(structural_id, None)
-
-    return cached_state
+    def close(self):
+        """ Close the on-disk storage if it is opened """
+        if self._disk_storage is not None:
+            self._disk_storage.close()
+            self._disk_storage = None
+
+    def _save(self, key: str, cached_state: CachedState):
+        if key in self._memory_storage:
+            # the operation fitted on the same data is already saved
+            self._memory_storage.move_to_end(key)
+            return
+        self._save_to_memory(key, pickle.dumps(cached_state, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _save_to_memory(self, key: str, pickled_state: bytes):
+        if len(pickled_state) > self.max_bytes:
+            self._save_to_disk(key, pickled_state)
+            return
+        self._memory_storage[key] = pickled_state
+        self.bytes_held += len(pickled_state)
+        while self.bytes_held > self.max_bytes:
+            evicted_key, evicted_state = self._memory_storage.popitem(last=False)
+            self.bytes_held -= len(evicted_state)
+            self.evictions += 1
+            self._save_to_disk(evicted_key, evicted_state)
+
+    def _save_to_disk(self, key: str, pickled_state: bytes):
+        if self.db_path is not None:
+            self._get_disk_storage()[key] = pickled_state
+
+    def _get_disk_storage(self):
+        if self._disk_storage is None:
+            self._disk_storage = shelve.open(self.db_path)
+        return self._disk_storage
+
+    def __len__(self):
+        return len(self._memory_storage)
+
+    def __getstate__(self):
+        # the opened on-disk storage can not be pickled
+        state = dict(self.__dict__)
+        state['_disk_storage'] = None
+        return state
+
+
+class FitnessCache:
+    """
+    Bounded LRU storage for the fitness of already evaluated pipelines
+
+    :param max_size: maximal number of stored fitness values. The cache is disabled if it is 0
+    """
+
+    def __init__(self, max_size: int = DEFAULT_FITNESS_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._storage = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if key in self._storage:
+            self.hits += 1
+            self._storage.move_to_end(key)
+            return self._storage[key]
+        self.misses += 1
+        return None
+
+    def save(self, key: Hashable, fitness: Any):
+        if self.max_size <= 0:
+            return
+        self._storage[key] = fitness
+        self._storage.move_to_end(key)
+        if len(self._storage) > self.max_size:
+            # remove the least recently used value
+            self._storage.popitem(last=False)
+
+    def clear(self):
+        self._storage.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._storage)
+
+
+def _cache_key(node, data_fingerprint: Optional[Hashable]) -> str:
+    return f'{node.descriptive_digest}_{data_fingerprint}'
 
 
 def clear_folder(folder_path: str):
@@ -1,7 +1,5 @@
-from copy import deepcopy
 from typing import Optional
 
-from fedot.core.optimisers.adapters import PipelineAdapter
 from fedot.core.optimisers.graph import OptGraph
 from fedot.core.pipelines.validation import validate
 
@@ -10,8 +8,10 @@ def constraint_function(graph: OptGraph,
                         params: Optional['GraphGenerationParams'] = None):
     try:
         rules = params.rules_for_constraint if params else None
-        object_for_validation = params.adapter.restore(deepcopy(graph))
-        validate(object_for_validation, rules, params.advisor.task)
+        task = params.advisor.task if params else None
+        adapter = params.adapter if params else None
+        # The graph is restored by the validation only once and only for the rules which require it
+        validate(graph, rules, task, adapter=adapter)
         return True
     except ValueError:
         return False
@@ -8,26 +8,30 @@ from typing import Any, Callable, List, Optional, Tuple, Union
 from deap import tools
 
 from fedot.core.composer.advisor import PipelineChangeAdvisor
-from fedot.core.composer.cache import OperationsCache
+from fedot.core.composer.cache import DEFAULT_FITNESS_CACHE_SIZE, FitnessCache, OperationsCache
 from fedot.core.composer.composer import Composer, ComposerRequirements
 from fedot.core.composer.gp_composer.specific_operators import boosting_mutation, parameter_change_mutation
+from fedot.core.composer.metrics_evaluator import MetricsEvaluator
 from fedot.core.data.data import InputData
-from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.data_split import data_subsample, train_test_data_setup
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.log import Log, default_log
 from fedot.core.optimisers.adapters import PipelineAdapter
 from fedot.core.optimisers.gp_comp.gp_optimiser import GPGraphOptimiser, GPGraphOptimiserParameters, \
     GraphGenerationParams
+from fedot.core.optimisers.gp_comp.individual import FULL_FIDELITY
+from fedot.core.optimisers.gp_comp.multi_fidelity import MultiFidelityObjective
 from fedot.core.optimisers.gp_comp.operators.inheritance import GeneticSchemeTypesEnum
 from fedot.core.optimisers.gp_comp.operators.mutation import MutationStrengthEnum, single_add_mutation, \
     single_change_mutation, single_drop_mutation, single_edge_mutation, MutationTypesEnum
 from fedot.core.optimisers.gp_comp.operators.regularization import RegularizationTypesEnum
 from fedot.core.optimisers.gp_comp.param_free_gp_optimiser import GPGraphParameterFreeOptimiser
+from fedot.core.optimisers.utils.population_utils import data_characteristics
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.validation import validate, ts_rules, common_rules
 from fedot.core.repository.operation_types_repository import OperationTypesRepository, get_operations_for_task
 from fedot.core.repository.quality_metrics_repository import (ClassificationMetricsEnum, MetricsEnum,
-                                                              MetricsRepository, RegressionMetricsEnum)
+                                                              RegressionMetricsEnum)
 from fedot.core.repository.tasks import Task, TaskTypesEnum
 from fedot.core.validation.compose.tabular import table_metric_calculation
 from fedot.core.validation.compose.time_series import ts_metric_calculation
@@ -57,6 +61,15 @@ class GPComposerRequirements(ComposerRequirements):
     :attribute mutation_strength: strength of mutation in tree (using in certain mutation types)
     :attribute start_depth: start value of tree depth
     :attribute validation_blocks: number of validation blocks for time series validation
+    :attribute cv_n_jobs: number of cross validation folds evaluated simultaneously,
+        -1 means using all the available cores
+    :attribute fidelity_levels: fractions of the training data (e.g. [0.1, 0.3]) used for the successive halving
+        evaluation of the new pipelines: all of them are evaluated on the smallest part of the data, and only
+        the best part of them is evaluated on each next part and finally on the full data.
+        None means the evaluation of all the pipelines on the full data. The pipelines which are not evaluated
+        on the full data are not ranked better than the evaluated ones by the primary metric
+        and are not added to the archive of the best pipelines
+    :attribute fidelity_promotion_rate: fraction of the pipelines evaluated on each next part of the data
     """
     pop_size: Optional[int] = 20
     num_of_generations: Optional[int] = 20
@@ -65,6 +78,14 @@ class GPComposerRequirements(ComposerRequirements):
     mutation_strength: MutationStrengthEnum = MutationStrengthEnum.mean
     start_depth: int = None
     validation_blocks: int = None
+    cv_n_jobs: int = 1
+    fidelity_levels: Optional[List[float]] = None
+    fidelity_promotion_rate: float = 1 / 3
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.fidelity_levels is not None and not all(0 < level <= FULL_FIDELITY for level in self.fidelity_levels):
+            raise ValueError(f'Fidelity levels must belong to the interval (0; 1], got {self.fidelity_levels}')
 
 
 class GPComposer(Composer):
@@ -86,6 +107,7 @@ class GPComposer(Composer):
                          initial_pipeline=initial_pipeline)
 
         self.cache = OperationsCache()
+        self.fitness_cache = FitnessCache()
 
         self.optimiser = optimiser
         self.cache_path = None
@@ -126,12 +148,20 @@ class GPComposer(Composer):
         data.shuffle()
 
         if self.composer_requirements.cv_folds is not None:
-            objective_function_for_pipeline = self._cv_validation_metric_build(data)
+            objective_data = data
+            objective_for_data = self._cv_validation_metric_build
         else:
             self.log.info("Hold out validation for graph composing was applied.")
             split_ratio = sample_split_ratio_for_tasks[data.task.task_type]
-            train_data, test_data = train_test_data_setup(data, split_ratio)
-            objective_function_for_pipeline = partial(self.composer_metric, self.metrics, train_data, test_data)
+            objective_data, test_data = train_test_data_setup(data, split_ratio)
+
+            def objective_for_data(train_data):
+                return partial(self.composer_metric, self.metrics, train_data, test_data)
+
+        if self.composer_requirements.fidelity_levels:
+            objective_function_for_pipeline = self._multi_fidelity_objective_build(objective_for_data, objective_data)
+        else:
+            objective_function_for_pipeline = objective_for_data(objective_data)
 
         if self.cache_path is None:
             self.cache.clear()
@@ -139,10 +169,15 @@ class GPComposer(Composer):
             self.cache.clear(tmp_only=True)
             self.cache = OperationsCache(self.cache_path, clear_exiting=not self.use_existing_cache)
 
+        self.fitness_cache.clear()
+
         best_pipeline = self.optimiser.optimise(objective_function_for_pipeline,
                                                 on_next_iteration_callback=on_next_iteration_callback)
 
         self.log.info('GP composition finished')
+        self.log.info(f'Fitness cache hits: {self.fitness_cache.hits}, misses: {self.fitness_cache.misses}')
+        self.log.info(f'Operations cache hit ratio: {round(self.cache.hit_ratio, 3)}, '
+                      f'evictions: {self.cache.evictions}')
         self.cache.clear()
         if is_tune:
             self.tune_pipeline(best_pipeline, data, self.composer_requirements.timeout)
@@ -163,49 +198,67 @@ class GPComposer(Composer):
                                                 self.composer_requirements.cv_folds,
                                                 self.composer_requirements.validation_blocks,
                                                 self.metrics,
-                                                log=self.log)
+                                                log=self.log,
+                                                n_jobs=self.composer_requirements.cv_n_jobs)
         else:
             self.log.info("KFolds cross validation for pipeline composing was applied.")
             metric_function_for_nodes = partial(table_metric_calculation, data,
                                                 self.composer_requirements.cv_folds,
                                                 self.metrics,
-                                                log=self.log)
+                                                log=self.log,
+                                                n_jobs=self.composer_requirements.cv_n_jobs)
 
         return metric_function_for_nodes
 
+    def _multi_fidelity_objective_build(self, objective_for_data: Callable,
+                                        data: Union[InputData, MultiModalData]) -> MultiFidelityObjective:
+        """ Prepare the objective function calculated on the parts of the data of the different size.
+        For the hold-out validation the training data is reduced (the validation data is the same
+        for all the levels, so the metrics are comparable), for the cross validation the whole data is reduced """
+        levels = sorted(set(self.composer_requirements.fidelity_levels) - {FULL_FIDELITY})
+        self.log.info(f'Multi-fidelity evaluation on the fractions of the data {levels} was applied.')
+
+        objectives = [(level, objective_for_data(data_subsample(data, level))) for level in levels]
+        objectives.append((FULL_FIDELITY, objective_for_data(data)))
+        return MultiFidelityObjective(objectives, self.composer_requirements.fidelity_promotion_rate)
+
     def composer_metric(self, metrics,
                         train_data: Union[InputData, MultiModalData],
                         test_data: Union[InputData, MultiModalData],
                         pipeline: Pipeline) -> Optional[Tuple[Any]]:
         try:
-            validate(pipeline, task=train_data.task)
-            pipeline.log = self.log
-
             if type(metrics) is not list:
                 metrics = [metrics]
 
+            train_fingerprint = data_characteristics(train_data, self.log)
+            fitness_key = self._fitness_cache_key(metrics, train_fingerprint, test_data, pipeline)
+            cached_metrics = self.fitness_cache.get(fitness_key)
+            self._update_fitness_cache_stats()
+            if cached_metrics is not None:
+                self.log.debug(f'Pipeline {pipeline.root_node.descriptive_id} metrics obtained from cache')
+                return cached_metrics
+
+            validate(pipeline, task=train_data.task)
+            pipeline.log = self.log
+
             if self.cache is not None:
-                # TODO improve cache
-                pipeline.fit_from_cache(self.cache)
+                pipeline.fit_from_cache(self.cache, train_data)
 
             if not pipeline.is_fitted:
                 self.log.debug(f'Pipeline {pipeline.root_node.descriptive_id} fit started')
                 pipeline.fit(input_data=train_data,
                              time_constraint=self.composer_requirements.max_pipeline_fit_time)
                 try:
-                    self.cache.save_pipeline(pipeline)
+                    self.cache.save_pipeline(pipeline, train_fingerprint)
                 except Exception as ex:
                     self.log.info(f'Cache can not be saved: {ex}. Continue.')
 
-            evaluated_metrics = ()
-            for metric in metrics:
-                if callable(metric):
-                    metric_func = metric
-                else:
-                    metric_func = MetricsRepository().metric_by_id(metric)
-                evaluated_metrics = evaluated_metrics + (metric_func(pipeline, reference_data=test_data),)
+            metrics_evaluator = MetricsEvaluator(metrics)
+            evaluated_metrics = metrics_evaluator.evaluate(pipeline, reference_data=test_data)
 
-            self.log.debug(f'Pipeline {pipeline.root_node.descriptive_id} with metrics: {list(evaluated_metrics)}')
+            self.log.debug(f'Pipeline {pipeline.root_node.descriptive_id} with metrics: {list(evaluated_metrics)}, '
+                           f'predict calls avoided: {metrics_evaluator.avoided_predicts}')
+            self.fitness_cache.save(fitness_key, evaluated_metrics)
 
             # enforce memory cleaning
             pipeline.unfit()
@@ -216,6 +269,19 @@ class GPComposer(Composer):
 
         return evaluated_metrics
 
+    def _fitness_cache_key(self, metrics, train_fingerprint: tuple,
+                           test_data: Union[InputData, MultiModalData], pipeline: Pipeline) -> tuple:
+        """ The key defines the pipeline structure, the set of metrics and the data used for evaluation """
+        return (pipeline.root_node.descriptive_digest,
+                tuple(str(metric) for metric in metrics),
+                train_fingerprint,
+                data_characteristics(test_data, self.log))
+
+    def _update_fitness_cache_stats(self):
+        if self.optimiser is not None:
+            self.history.fitness_cache_hits = self.fitness_cache.hits
+            self.history.fitness_cache_misses = self.fitness_cache.misses
+
     @staticmethod
     def tune_pipeline(pipeline: Pipeline, data: InputData, time_limit):
         raise NotImplementedError()
@@ -276,6 +342,10 @@ class GPComposerBuilder:
         self._composer.use_existing_cache = use_existing
         return self
 
+    def with_fitness_cache(self, max_size: int = DEFAULT_FITNESS_CACHE_SIZE):
+        self._composer.fitness_cache = FitnessCache(max_size)
+        return self
+
     def set_default_composer_params(self):
         """ Method set metrics and composer requirements """
         if not self._composer.composer_requirements:
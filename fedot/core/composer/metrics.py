@@ -1,5 +1,6 @@
 import sys
 from abc import abstractmethod
+from copy import copy
 
 import numpy as np
 from sklearn.metrics import (accuracy_score, f1_score, log_loss, mean_absolute_error, mean_absolute_percentage_error,
@@ -7,6 +8,7 @@ from sklearn.metrics import (accuracy_score, f1_score, log_loss, mean_absolute_e
                              silhouette_score, roc_curve, auc)
 from sklearn.preprocessing import OneHotEncoder
 from fedot.core.data.data import InputData, OutputData
+from fedot.core.log import default_log
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.tasks import TaskTypesEnum
@@ -45,24 +47,68 @@ class QualityMetric:
     @classmethod
     def get_value(cls, pipeline: Pipeline, reference_data: InputData,
                   validation_blocks: int = None) -> float:
+        try:
+            prediction = cls.get_prediction(pipeline, reference_data, validation_blocks)
+        except Exception as ex:
+            default_log(__name__).warn(f'Pipeline prediction for the metric evaluation failed: {ex}')
+            return cls.default_value
+        return cls.get_value_by_prediction(prediction, reference_data, validation_blocks)
+
+    @classmethod
+    def get_value_by_prediction(cls, prediction: OutputData, reference_data: InputData,
+                                validation_blocks: int = None) -> float:
+        """ Get metric value based on the already obtained output of the pipeline
+
+        :param prediction: output of the pipeline obtained with get_prediction method of the metric
+        :param reference_data: InputData for validation
+        :param validation_blocks: number of validation blocks for time series in-sample validation
+        """
         metric = cls.default_value
         try:
             if validation_blocks is None:
-                # Time series or regression classical hold-out validation
-                results, reference_data = cls._simple_prediction(pipeline, reference_data)
+                # Time series or regression classical hold-out validation.
+                # The prediction may be shared between several metrics, so it is not changed inplace
+                results, reference_data = cls._convert_for_simple_validation(copy(prediction),
+                                                                             copy(reference_data))
             else:
                 # Perform time series in-sample validation
-                reference_data, results = cls._in_sample_prediction(pipeline, reference_data, validation_blocks)
+                reference_data, results = cls._convert_for_in_sample_validation(prediction, reference_data,
+                                                                                validation_blocks)
             metric = cls.metric(reference_data, results)
         except Exception as ex:
             print(f'Metric evaluation error: {ex}')
         return metric
 
+    @classmethod
+    def get_prediction(cls, pipeline: Pipeline, reference_data: InputData,
+                       validation_blocks: int = None) -> OutputData:
+        """ Obtain the output of the pipeline required for the metric evaluation.
+        The output depends only on the output_mode of the metric and the number of validation blocks
+
+        :param pipeline: fitted pipeline
+        :param reference_data: InputData for validation
+        :param validation_blocks: number of validation blocks for time series in-sample validation
+        """
+        if validation_blocks is None:
+            return pipeline.predict(reference_data, output_mode=cls.output_mode)
+
+        # Get number of validation blocks per each fold
+        horizon = reference_data.task.task_params.forecast_length * validation_blocks
+        predicted_values = in_sample_ts_forecast(pipeline=pipeline,
+                                                 input_data=reference_data,
+                                                 horizon=horizon)
+        return OutputData(idx=np.arange(0, len(predicted_values)), features=predicted_values,
+                          predict=predicted_values, task=reference_data.task, target=predicted_values,
+                          data_type=DataTypesEnum.ts)
+
     @classmethod
     def _simple_prediction(cls, pipeline: Pipeline, reference_data: InputData):
         """ Method prepares data for metric evaluation and perform simple validation """
         results = pipeline.predict(reference_data, output_mode=cls.output_mode)
+        return cls._convert_for_simple_validation(results, reference_data)
 
+    @classmethod
+    def _convert_for_simple_validation(cls, results: OutputData, reference_data: InputData):
         # Define conditions for target and predictions transforming
         is_regression = reference_data.task.task_type == TaskTypesEnum.regression
         is_multi_target = len(np.array(results.predict).shape) > 1
@@ -96,6 +142,11 @@ class QualityMetric:
     def get_value_with_penalty(cls, pipeline: Pipeline, reference_data: InputData,
                                validation_blocks: int = None) -> float:
         quality_metric = cls.get_value(pipeline, reference_data)
+        return cls.add_penalty(quality_metric, pipeline)
+
+    @classmethod
+    def add_penalty(cls, quality_metric: float, pipeline: Pipeline) -> float:
+        """ Add the penalty for the structural complexity of the pipeline to the value of the metric """
         structural_metric = StructuralComplexity.get_value(pipeline)
 
         penalty = abs(structural_metric * quality_metric * cls.max_penalty_part)
@@ -104,27 +155,18 @@ class QualityMetric:
         return metric_with_penalty
 
     @staticmethod
-    def _in_sample_prediction(pipeline, data, validation_blocks):
-        """ Performs in-sample pipeline validation for time series prediction """
-
-        # Get number of validation blocks per each fold
+    def _convert_for_in_sample_validation(prediction: OutputData, data: InputData, validation_blocks: int):
+        """ Prepares the results of in-sample pipeline validation for time series prediction """
         horizon = data.task.task_params.forecast_length * validation_blocks
 
-        predicted_values = in_sample_ts_forecast(pipeline=pipeline,
-                                                 input_data=data,
-                                                 horizon=horizon)
-
         # Clip actual data by the forecast horizon length
         actual_values = data.target[-horizon:]
 
-        # Wrap target and prediction arrays into OutputData and InputData
-        results = OutputData(idx=np.arange(0, len(predicted_values)), features=predicted_values,
-                             predict=predicted_values, task=data.task, target=predicted_values,
-                             data_type=DataTypesEnum.ts)
+        # Wrap target array into InputData
         reference_data = InputData(idx=np.arange(0, len(actual_values)), features=actual_values,
                                    task=data.task, target=actual_values, data_type=DataTypesEnum.ts)
 
-        return reference_data, results
+        return reference_data, prediction
 
     @staticmethod
     @abstractmethod
@@ -0,0 +1,117 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from fedot.core.composer.metrics import QualityMetric
+from fedot.core.data.data import InputData
+from fedot.core.log import default_log
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.quality_metrics_repository import MetricsEnum, MetricsRepository
+
+
+class MetricsEvaluator:
+    """
+    Class for the calculation of several metrics for the fitted pipeline. The quality metrics
+    from the repository share the output of the pipeline: the nodes of the pipeline are executed
+    once for all the metrics, only the root node is executed again for every additional output mode
+    (e.g. labels for F1 and probabilities for ROC AUC). The penalty variants of the metrics use
+    the same output. Custom callable metrics are calculated as usual.
+
+    :param metrics: ids of the metrics from the repository or callable objects
+
+    .. note::
+        avoided_predicts stores the number of predictions of the pipeline
+        saved by sharing the outputs between the metrics
+    """
+
+    def __init__(self, metrics: Sequence[Union[MetricsEnum, Callable]]):
+        self.metrics = metrics
+        self.metric_functions = [metric if callable(metric) else MetricsRepository().metric_by_id(metric)
+                                 for metric in metrics]
+        self.avoided_predicts = 0
+
+    def evaluate(self, pipeline: Pipeline, reference_data: InputData,
+                 validation_blocks: Optional[int] = None) -> Tuple[float, ...]:
+        """
+        Calculate the values of all the metrics
+
+        :param pipeline: fitted pipeline
+        :param reference_data: InputData for validation
+        :param validation_blocks: number of validation blocks for time series in-sample validation
+        :return: values of the metrics in the same order as the metrics
+        """
+        shared_metrics = [_shared_quality_metric(metric_func, validation_blocks)
+                          for metric_func in self.metric_functions]
+        predictions = self._shared_predictions(pipeline, reference_data,
+                                               [metric for metric in shared_metrics if metric is not None])
+
+        evaluated_metrics = []
+        for metric_func, shared_metric in zip(self.metric_functions, shared_metrics):
+            if shared_metric is None:
+                kwargs = {} if validation_blocks is None else {'validation_blocks': validation_blocks}
+                evaluated_metrics.append(metric_func(pipeline, reference_data=reference_data, **kwargs))
+                continue
+
+            metric_cls, metric_blocks, with_penalty = shared_metric
+            prediction = predictions[_prediction_key(metric_cls, metric_blocks)]
+            if prediction is None:
+                metric_value = metric_cls.default_value
+            else:
+                metric_value = metric_cls.get_value_by_prediction(prediction, reference_data, metric_blocks)
+            if with_penalty:
+                metric_value = metric_cls.add_penalty(metric_value, pipeline)
+            evaluated_metrics.append(metric_value)
+        return tuple(evaluated_metrics)
+
+    def _shared_predictions(self, pipeline: Pipeline, reference_data: InputData,
+                            shared_metrics: List[Tuple[Type[QualityMetric], Optional[int], bool]]) -> Dict:
+        """ Obtain the outputs of the pipeline required for the metrics. The output is None
+        if the prediction failed, the metrics are equal to their default values then """
+        predictions = {}
+        hold_out_modes = []
+        for metric_cls, metric_blocks, _ in shared_metrics:
+            key = _prediction_key(metric_cls, metric_blocks)
+            if key in predictions or key in hold_out_modes:
+                continue
+            if metric_blocks is None:
+                hold_out_modes.append(metric_cls.output_mode)
+            else:
+                predictions[key] = _safe_prediction(metric_cls.get_prediction, pipeline,
+                                                    reference_data, metric_blocks)
+
+        if hold_out_modes:
+            outputs = _safe_prediction(pipeline.predict_for_output_modes, reference_data, hold_out_modes)
+            for output_mode in hold_out_modes:
+                predictions[output_mode] = None if outputs is None else outputs[output_mode]
+
+        performed_predicts = len(predictions) - len(hold_out_modes) + min(len(hold_out_modes), 1)
+        self.avoided_predicts += len(shared_metrics) - performed_predicts
+        return predictions
+
+
+def _shared_quality_metric(metric_func: Callable, validation_blocks: Optional[int]) \
+        -> Optional[Tuple[Type[QualityMetric], Optional[int], bool]]:
+    """ Returns the class of the quality metric, the number of validation blocks used by the metric
+    and the flag of the penalty or None if the metric is not able to use the shared prediction """
+    metric_cls = getattr(metric_func, '__self__', None)
+    if not (isinstance(metric_cls, type) and issubclass(metric_cls, QualityMetric)):
+        return None
+
+    metric_func_name = getattr(metric_func, '__name__', None)
+    if metric_func_name == QualityMetric.get_value.__name__:
+        return metric_cls, validation_blocks, False
+    if metric_func_name == QualityMetric.get_value_with_penalty.__name__:
+        # The penalty variant is always calculated on hold-out prediction
+        return metric_cls, None, True
+    return None
+
+
+def _prediction_key(metric_cls: Type[QualityMetric], validation_blocks: Optional[int]):
+    # In-sample forecast does not depend on the output mode
+    return metric_cls.output_mode if validation_blocks is None else validation_blocks
+
+
+def _safe_prediction(predict_func: Callable, *args):
+    try:
+        return predict_func(*args)
+    except Exception as ex:
+        default_log(__name__).warn(f'Pipeline prediction for the metric evaluation failed: {ex}')
+        return None
@@ -3,7 +3,6 @@ from typing import List, Optional, TYPE_CHECKING, Union
 from uuid import uuid4
 
 from fedot.core.dag.graph_operator import GraphOperator
-from fedot.core.visualisation.graph_viz import GraphVisualiser
 
 if TYPE_CHECKING:
     from fedot.core.dag.graph_node import GraphNode
@@ -73,6 +72,8 @@ class Graph:
         self.operator.delete_subtree(subroot)
 
     def show(self, path: str = None):
+        from fedot.core.visualisation.graph_viz import GraphVisualiser
+
         GraphVisualiser().visualise(self, path)
 
     def __eq__(self, other) -> bool:
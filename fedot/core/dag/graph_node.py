@@ -34,6 +34,10 @@ class GraphNode:
     def descriptive_id(self):
         return self._operator.descriptive_id()
 
+    @property
+    def descriptive_digest(self):
+        return self._operator.descriptive_digest()
+
     def ordered_subnodes_hierarchy(self, visited=None) -> List['GraphNode']:
         return self._operator.ordered_subnodes_hierarchy(visited)
 
@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from fedot.core.dag.graph_node import GraphNode
 from fedot.core.pipelines.convert import graph_structure_as_nx_graph
@@ -8,6 +8,11 @@ from fedot.core.pipelines.convert import graph_structure_as_nx_graph
 class GraphOperator:
     def __init__(self, graph=None):
         self._graph = graph
+        # Index of the children of the nodes and the roots of the graph.
+        # It is rebuilt only if the structure of the graph has been changed
+        self._children_index: Dict[GraphNode, List[GraphNode]] = {}
+        self._roots: List[GraphNode] = []
+        self._indexed_structure = None
 
     def delete_node(self, node: GraphNode):
         def make_secondary_node_as_primary(node_child, new_type):
@@ -112,9 +117,28 @@ class GraphOperator:
         self._graph.nodes = nodes
 
     def node_children(self, node) -> List[Optional[GraphNode]]:
-        return [other_node for other_node in self._graph.nodes
-                if other_node.nodes_from and
-                node in other_node.nodes_from]
+        return list(self._actual_children_index().get(node, []))
+
+    def _actual_children_index(self) -> Dict[GraphNode, List[GraphNode]]:
+        """ Returns the children of the nodes. The index is built in a single pass over the graph edges
+        and is reused until the nodes of the graph or the parents of any node are changed
+        (including direct modifications of nodes_from) """
+        nodes = self._graph.nodes
+        parents = [node.nodes_from for node in nodes]
+        # nodes are compared by identity, so the check is cheap
+        if self._indexed_structure != (nodes, parents):
+            children_index = {node: [] for node in nodes}
+            for node in nodes:
+                for parent in node.nodes_from or []:
+                    parent_children = children_index.setdefault(parent, [])
+                    if not parent_children or parent_children[-1] is not node:
+                        parent_children.append(node)
+            self._children_index = children_index
+            self._roots = [node for node in nodes if not children_index[node]]
+            # copies are stored because the lists can be modified in-place
+            self._indexed_structure = (list(nodes), [list(node_parents) if node_parents is not None else None
+                                                     for node_parents in parents])
+        return self._children_index
 
     def connect_nodes(self, parent: GraphNode, child: GraphNode):
         if child.descriptive_id not in [p.descriptive_id for p in parent.ordered_subnodes_hierarchy()]:
@@ -130,8 +154,8 @@ class GraphOperator:
     def root_node(self) -> Union[GraphNode, List[GraphNode]]:
         if len(self._graph.nodes) == 0:
             return []
-        roots = [node for node in self._graph.nodes
-                 if not any(self._graph.operator.node_children(node))]
+        self._actual_children_index()
+        roots = list(self._roots)
         if len(roots) == 1:
             return roots[0]
         return roots
@@ -173,6 +197,14 @@ class GraphOperator:
         else:
             return _depth_recursive(root)
 
+    def __getstate__(self):
+        # the index is rebuilt after copying, so it is not stored
+        state = dict(self.__dict__)
+        state['_children_index'] = {}
+        state['_roots'] = []
+        state['_indexed_structure'] = None
+        return state
+
     def get_nodes_degrees(self):
         """ Nodes degree as the number of edges the node has:
          k = k(in) + k(out)"""
@@ -1,4 +1,4 @@
-from copy import copy
+import hashlib
 from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,6 +10,9 @@ MAX_DEPTH = 100
 class NodeOperator:
     def __init__(self, node):
         self._node = node
+        # descriptive id with the state of the node it was built for and the digest of the id
+        self._cached_id = None
+        self._cached_digest = None
 
     def distance_to_primary_level(self):
         if not self._node.nodes_from:
@@ -33,14 +36,33 @@ class NodeOperator:
         return nodes
 
     def descriptive_id(self) -> str:
-        return _descriptive_id_recursive(self._node, visited_nodes=[])
+        return _descriptive_id_recursive(self._node, path=[], obtained_ids={})
 
+    def descriptive_digest(self) -> str:
+        """ Fixed-length digest of the descriptive id """
+        descriptive_id = self.descriptive_id()
+        cached_digest = self._cached_digest
+        if cached_digest is None or cached_digest[0] != descriptive_id:
+            digest = hashlib.blake2b(descriptive_id.encode(), digest_size=16).hexdigest()
+            self._cached_digest = (descriptive_id, digest)
+        return self._cached_digest[1]
 
-def _descriptive_id_recursive(current_node, visited_nodes) -> str:
+
+def _descriptive_id_recursive(current_node, path: list, obtained_ids: dict) -> str:
     """
     Method returns verbal description of the content in the node
-    and its parameters
+    and its parameters. The description of the node is built again only if
+    the label of the node or the descriptions of its parents are changed
+
+    :param current_node: node to describe
+    :param path: nodes from the described node to the current one (used for the cycles detection)
+    :param obtained_ids: descriptions of the nodes obtained during the current call
     """
+    if id(current_node) in obtained_ids:
+        return obtained_ids[id(current_node)]
+    if any(current_node is path_node for path_node in path):
+        return 'ID_CYCLED'
+
     if isinstance(current_node.content['name'], str):
         # If there is a string: name of operation (as in json repository)
         node_label = current_node.content['name']
@@ -51,17 +73,25 @@ def _descriptive_id_recursive(current_node, visited_nodes) -> str:
         operation_params = current_node.content.get('params')
         node_label = current_node.content['name'].description(operation_params)
 
-    full_path = ''
-    if current_node in visited_nodes:
-        return 'ID_CYCLED'
-    visited_nodes.append(current_node)
-    if current_node.nodes_from:
-        previous_items = []
-        for parent_node in current_node.nodes_from:
-            previous_items.append(f'{_descriptive_id_recursive(copy(parent_node), copy(visited_nodes))};')
-        previous_items.sort()
-        previous_items_str = ';'.join(previous_items)
-
-        full_path += f'({previous_items_str})'
-    full_path += f'/{node_label}'
+    path.append(current_node)
+    parent_ids = tuple(_descriptive_id_recursive(parent_node, path, obtained_ids)
+                       for parent_node in current_node.nodes_from or [])
+    path.pop()
+
+    operator = current_node._operator
+    cached_state = operator._cached_id
+    if cached_state is not None and cached_state[0] == (node_label, parent_ids):
+        full_path = cached_state[1]
+    else:
+        full_path = ''
+        if parent_ids:
+            previous_items = sorted(f'{parent_id};' for parent_id in parent_ids)
+            previous_items_str = ';'.join(previous_items)
+            full_path += f'({previous_items_str})'
+        full_path += f'/{node_label}'
+        if not any('ID_CYCLED' in parent_id for parent_id in parent_ids):
+            # description obtained inside the cycle depends on the path
+            operator._cached_id = ((node_label, parent_ids), full_path)
+
+    obtained_ids[id(current_node)] = full_path
     return full_path
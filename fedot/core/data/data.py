@@ -1,6 +1,8 @@
 import glob
+import hashlib
 import os
-from dataclasses import dataclass
+from copy import copy
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Union
 
 import imageio
@@ -11,12 +13,17 @@ from PIL import Image
 from fedot.core.data.load_data import JSONBatchLoader, TextBatchLoader
 from fedot.core.data.merge import DataMerger
 from fedot.core.data.multi_modal import MultiModalData
+from fedot.core.data.shared_arrays import replace_shared_arrays, share_array
 from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.data.table_schema import TableSchema
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
 
 # Max unique values to convert numerical column to categorical.
 MAX_UNIQ_VAL = 12
+# Size of the chunks (bytes for numerical arrays, rows for object arrays) used for the data fingerprinting
+FINGERPRINT_CHUNK_BYTES = 2 ** 24
+FINGERPRINT_CHUNK_ROWS = 10000
 
 
 @dataclass
@@ -29,7 +36,7 @@ class Data:
     task: Task
     data_type: DataTypesEnum
     # Object with supplementary info
-    supplementary_data: SupplementaryData = SupplementaryData()
+    supplementary_data: SupplementaryData = field(default_factory=SupplementaryData)
 
     @staticmethod
     def from_csv(file_path=None,
@@ -211,6 +218,15 @@ class Data:
         return InputData(idx=idx, features=features,
                          target=target, task=task, data_type=data_type)
 
+    def __copy__(self):
+        data = self.__class__.__new__(self.__class__)
+        data.__dict__.update(self.__dict__)
+        return data
+
+    def __getstate__(self):
+        # The shared arrays are pickled as the references to the memory-mapped files
+        return replace_shared_arrays(self.__dict__)
+
 
 @dataclass
 class InputData(Data):
@@ -218,6 +234,8 @@ class InputData(Data):
     Data class for input data for the nodes
     """
     target: Optional[np.array] = None
+    # Arrays used for the fingerprint calculation and the fingerprint itself
+    _fingerprint_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def num_classes(self) -> Optional[int]:
@@ -235,6 +253,47 @@ class InputData(Data):
         return InputData(idx=idx, features=features, target=target, task=task,
                          data_type=d_type, supplementary_data=updated_info)
 
+    def fingerprint(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Returns the digests of the features and the target content. The digests are cached
+        and calculated again only if the features or the target are replaced by other arrays.
+
+        .. note::
+            In-place modifications of the arrays are not tracked, so reset_fingerprint
+            must be called after them
+        """
+        cached = self._fingerprint_cache
+        if cached is None or cached[0] is not self.features or cached[1] is not self.target:
+            digests = (array_fingerprint(self.features) if self.features is not None else None,
+                       array_fingerprint(self.target) if self.target is not None else None)
+            self._fingerprint_cache = (self.features, self.target, digests)
+        return self._fingerprint_cache[2]
+
+    def reset_fingerprint(self):
+        self._fingerprint_cache = None
+
+    def to_shared(self, directory: Optional[str] = None, writable: bool = False) -> 'InputData':
+        """
+        Returns the copy of the data with the idx, features and target stored in the memory-mapped files.
+        Such data is sent to the other processes (e.g. to the workers evaluating the pipelines) as the references
+        to the files, so the arrays are not copied to each of the processes. The views of the arrays
+        (e.g. the contiguous parts of the data obtained during the splitting) are shared too
+
+        :param directory: directory for the memory-mapped files, default is the directory for the temporary files
+        :param writable: if False, the shared arrays are read-only. Otherwise the changes of the arrays
+            are visible to all the processes which received the data
+        """
+        shared_data = copy(self)
+        shared_data.idx = share_array(self.idx, directory, writable)
+        shared_data.features = share_array(self.features, directory, writable)
+        shared_data.target = share_array(self.target, directory, writable) \
+            if self.target is not self.features else shared_data.features
+
+        cached = self._fingerprint_cache
+        if cached is not None and cached[0] is self.features and cached[1] is self.target:
+            shared_data._fingerprint_cache = (shared_data.features, shared_data.target, cached[2])
+        return shared_data
+
     def subset(self, start: int, end: int):
         if not (0 <= start <= end <= len(self.idx)):
             raise ValueError('Incorrect boundaries for subset')
@@ -267,6 +326,34 @@ class OutputData(Data):
     target: Optional[np.array] = None
 
 
+def array_fingerprint(array: Union[np.ndarray, list]) -> str:
+    """
+    Calculates the digest of the array content. Numerical and fixed-length string arrays are hashed
+    as raw buffers chunk by chunk without the conversion to Python objects. Arrays with objects
+    (e.g. mixed or variable-length string columns) are hashed by the representation of the values
+
+    :param array: array to hash
+    :return: hex digest of the array
+    """
+    if not isinstance(array, np.ndarray):
+        array = np.array(array, dtype=object)
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f'{array.dtype.str}{array.shape}'.encode())
+    if array.ndim == 0 or array.size == 0:
+        hasher.update(repr(array.tolist()).encode())
+    elif array.dtype.hasobject:
+        for start in range(0, len(array), FINGERPRINT_CHUNK_ROWS):
+            hasher.update(repr(array[start:start + FINGERPRINT_CHUNK_ROWS].tolist()).encode())
+    else:
+        rows_in_chunk = max(FINGERPRINT_CHUNK_BYTES // max(array[0].nbytes, 1), 1)
+        for start in range(0, len(array), rows_in_chunk):
+            # slices of the C-contiguous array are hashed without copying
+            chunk = np.ascontiguousarray(array[start:start + rows_in_chunk])
+            hasher.update(chunk.reshape(-1).view(np.uint8))
+    return hasher.hexdigest()
+
+
 def _resize_image(file_path: str, target_size: tuple):
     im = Image.open(file_path)
     im_resized = im.resize(target_size, Image.NEAREST)
@@ -331,9 +418,9 @@ def data_has_categorical_features(data: Union[InputData, MultiModalData]) -> boo
     if isinstance(data, MultiModalData):
         for data_source_name, values in data.items():
             if data_source_name.startswith('data_source_table'):
-                data_has_categorical_columns = _has_data_categorical(values)
+                data_has_categorical_columns = table_schema(values).has_categorical
     elif data_type_is_suitable_preprocessing(data):
-        data_has_categorical_columns = _has_data_categorical(data)
+        data_has_categorical_columns = table_schema(data).has_categorical
 
     return data_has_categorical_columns
 
@@ -344,12 +431,29 @@ def data_has_missing_values(data: Union[InputData, MultiModalData]) -> bool:
     if isinstance(data, MultiModalData):
         for data_source_name, values in data.items():
             if data_type_is_table(values):
-                return pd.DataFrame(values.features).isna().sum().sum() > 0
+                return table_schema(values).has_missing
     elif data_type_is_suitable_preprocessing(data):
-        return pd.DataFrame(data.features).isna().sum().sum() > 0
+        return table_schema(data).has_missing
     return False
 
 
+def table_schema(data: InputData) -> TableSchema:
+    """
+    Returns the types of the columns of the features. The schema is inferred once
+    and stored in the supplementary data, so it is reused while the features and the target
+    are not replaced by other arrays
+
+    :param data: InputData with the table
+    :return: schema of the table
+    """
+    schema = data.supplementary_data.table_schema
+    target = getattr(data, 'target', None)
+    if schema is None or not schema.describes(data.features, target):
+        schema = TableSchema(data.features, target)
+        data.supplementary_data.table_schema = schema
+    return schema
+
+
 def str_columns_check(features):
     """
     Method for checking which columns contain categorical (text) data
@@ -395,28 +499,3 @@ def data_type_is_suitable_preprocessing(data: InputData) -> bool:
     if data.data_type == DataTypesEnum.table or data.data_type == DataTypesEnum.ts:
         return True
     return False
-
-
-def _has_data_categorical(data: InputData) -> bool:
-    """ Whether data categorical columns or not.
-
-    :param data: InputData
-    :return data_has_categorical_columns: bool, whether data has categorical columns or not
-    """
-    data_has_categorical_columns = False
-
-    if isinstance(data.features, list) or len(data.features.shape) == 1:
-        data_has_categorical_columns = _is_values_categorical(data.features)
-    else:
-        num_columns = data.features.shape[1]
-        for col_index in range(num_columns):
-            if data_has_categorical_columns:
-                break
-            data_has_categorical_columns = _is_values_categorical(data.features[:, col_index])
-
-    return data_has_categorical_columns
-
-
-def _is_values_categorical(values: List):
-    # Check if any value in list has 'string' type
-    return any(list(map(lambda x: isinstance(x, str), values)))
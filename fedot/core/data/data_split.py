@@ -1,3 +1,5 @@
+import math
+from copy import copy
 from typing import Tuple, Union
 
 import numpy as np
@@ -5,7 +7,9 @@ from sklearn.model_selection import KFold, train_test_split
 
 from fedot.core.data.data import InputData
 from fedot.core.data.multi_modal import MultiModalData
+from fedot.core.data.shared_arrays import is_shared, take_rows
 from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import TaskTypesEnum
 
 
 def _split_time_series(data, task, *args, **kwargs):
@@ -67,11 +71,19 @@ def _split_any(data, task, data_type, split_ratio, with_shuffle=False):
     input_features = data.features
     input_target = data.target
 
-    x_train, x_test, y_train, y_test = train_test_split(input_features,
-                                                        input_target,
-                                                        test_size=1. - split_ratio,
-                                                        shuffle=with_shuffle,
-                                                        random_state=random_state)
+    if is_shared(input_features) and not with_shuffle:
+        # The parts of the shared data are the views over the same memory-mapped files
+        train_ids, test_ids = train_test_split(np.arange(len(input_features)),
+                                               test_size=1. - split_ratio,
+                                               shuffle=with_shuffle)
+        x_train, x_test = take_rows(input_features, train_ids), take_rows(input_features, test_ids)
+        y_train, y_test = take_rows(input_target, train_ids), take_rows(input_target, test_ids)
+    else:
+        x_train, x_test, y_train, y_test = train_test_split(input_features,
+                                                            input_target,
+                                                            test_size=1. - split_ratio,
+                                                            shuffle=with_shuffle,
+                                                            random_state=random_state)
 
     idx_for_train = np.arange(0, len(x_train))
     idx_for_predict = np.arange(0, len(x_test))
@@ -192,3 +204,48 @@ def train_test_data_setup(data: Union[InputData, MultiModalData], split_ratio=0.
         raise ValueError(f'Dataset {type(data)} is not supported')
 
     return train_data, test_data
+
+
+def data_subsample(data: Union[InputData, MultiModalData], fraction: float,
+                   random_state: int = 42) -> Union[InputData, MultiModalData]:
+    """ Function for obtaining the smaller part of the data (e.g. for the fast evaluation of the pipelines).
+    The random rows are taken from the tables (stratified by the target for classification),
+    the last part of the series is taken from the time series
+
+    :param data: data to take the part of
+    :param fraction: fraction of the rows (or of the series length) to take
+    :param random_state: seed of the rows choice, the same rows are taken from all the sources of multi-modal data
+
+    :return: part of the data, the data itself if the fraction is 1 or more
+    """
+    if isinstance(data, MultiModalData):
+        subsample = MultiModalData()
+        for data_source_name, values in data.items():
+            subsample[data_source_name] = data_subsample(values, fraction, random_state)
+        return subsample
+
+    rows_amount = len(data.idx)
+    size = math.ceil(rows_amount * fraction)
+    if fraction >= 1 or size >= rows_amount:
+        return data
+
+    if data.data_type is DataTypesEnum.ts:
+        rows_ids = np.arange(rows_amount - size, rows_amount)
+    else:
+        rows_ids = np.arange(rows_amount)
+        stratify = data.target if data.task.task_type is TaskTypesEnum.classification else None
+        try:
+            rows_ids, _ = train_test_split(rows_ids, train_size=size, stratify=stratify, random_state=random_state)
+        except ValueError:
+            # e.g. some of the classes are too small for the stratification
+            rows_ids, _ = train_test_split(rows_ids, train_size=size, random_state=random_state)
+        rows_ids = np.sort(rows_ids)
+
+    subsample = copy(data)
+    subsample.idx = take_rows(np.asarray(data.idx), rows_ids)
+    subsample.features = take_rows(data.features, rows_ids)
+    subsample.target = take_rows(data.target, rows_ids) if data.target is not None else None
+    subsample.supplementary_data = copy(data.supplementary_data)
+    subsample.supplementary_data.table_schema = None
+    subsample.reset_fingerprint()
+    return subsample
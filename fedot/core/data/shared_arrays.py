@@ -0,0 +1,171 @@
+import os
+import tempfile
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Memory-mapped files with the shared arrays mapped in the current process by the start addresses of the mappings
+_mapped_files: Dict[int, '_MappedFile'] = {}
+# Base arrays of the files mapped in the current process (to map each file once)
+_attached_arrays = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+
+class _MappedFile:
+    """ Memory-mapped file with the content of the shared array """
+
+    def __init__(self, path: str, dtype: np.dtype, shape: Tuple[int, ...], mode: str, start: int, end: int):
+        self.path = path
+        self.dtype = dtype
+        self.shape = shape
+        self.mode = mode
+        self.start = start
+        self.end = end
+
+    def contains(self, low: int, high: int) -> bool:
+        return self.start <= low and high <= self.end
+
+
+class SharedArrayReference:
+    """
+    Reference to the shared array (or to its view) which is pickled instead of the content of the array.
+    The array is mapped again from the same file during the unpickling, so the memory is not duplicated
+    by the processes which receive the array.
+
+    :param mapped_file: file with the content of the array
+    :param array: the shared array or the view of it
+    """
+
+    def __init__(self, mapped_file: _MappedFile, array: np.ndarray):
+        self.mapped_file = mapped_file
+        self.offset = array.__array_interface__['data'][0] - mapped_file.start
+        self.shape = array.shape
+        self.strides = array.strides
+        self.dtype = array.dtype
+
+    def __reduce__(self):
+        mapped_file = self.mapped_file
+        return _attach_shared_array, (mapped_file.path, mapped_file.dtype, mapped_file.shape, mapped_file.mode,
+                                      self.offset, self.shape, self.strides, self.dtype)
+
+
+def share_array(array: Any, directory: Optional[str] = None, writable: bool = False) -> Any:
+    """
+    Copies the array to the memory-mapped file. The processes which receive the returned array
+    (or the views of it) map the same file instead of copying the array content, so the pages
+    of the array are shared by all the processes through the page cache of the OS.
+    The file is removed when the returned array and all its views are garbage collected.
+
+    :param array: array to share, the arrays with Python objects are returned as is
+    :param directory: directory for the memory-mapped file, default is the directory for the temporary files
+    :param writable: if False, the shared array is read-only. Otherwise the changes of the array
+        are visible to all the processes which received it (including the copies obtained by deepcopy)
+    :return: shared array
+    """
+    if not isinstance(array, np.ndarray) or array.dtype.hasobject or array.size == 0 or is_shared(array):
+        return array
+
+    file_descriptor, path = tempfile.mkstemp(prefix='fedot_shared_', suffix='.bin', dir=directory)
+    os.close(file_descriptor)
+    writer = np.memmap(path, dtype=array.dtype, mode='w+', shape=array.shape)
+    writer[...] = array
+    writer.flush()
+    del writer
+    return _map_file(path, array.dtype, array.shape, mode='r+' if writable else 'r', is_owner=True)
+
+
+def is_shared(array: Any) -> bool:
+    """ Whether the content of the array is stored in the shared memory-mapped file """
+    return shared_array_reference(array) is not None
+
+
+def shared_array_reference(array: Any) -> Optional[SharedArrayReference]:
+    """ Returns the reference for pickling if the content of the array is stored
+    in the shared memory-mapped file, otherwise None """
+    if not _mapped_files or not isinstance(array, np.ndarray) or array.size == 0:
+        return None
+    low, high = np.byte_bounds(array)
+    with _lock:
+        mapped_files = list(_mapped_files.values())
+    for mapped_file in mapped_files:
+        if mapped_file.contains(low, high):
+            return SharedArrayReference(mapped_file, array)
+    return None
+
+
+def take_rows(array: Any, index: np.ndarray) -> Any:
+    """
+    Returns the rows of the array by the index. The contiguous ranges of the rows of the shared arrays
+    are returned as the views over the same file instead of the copies
+
+    :param array: array to take the rows from
+    :param index: indices of the rows
+    """
+    index = np.asarray(index)
+    if len(index) > 0 and index.ndim == 1 and np.issubdtype(index.dtype, np.integer) and is_shared(array):
+        start = index[0]
+        if 0 <= start and index[-1] - start + 1 == len(index) and np.all(np.diff(index) == 1):
+            return array[start:start + len(index)]
+    return array[index]
+
+
+def replace_shared_arrays(state: Dict[str, Any]) -> Dict[str, Any]:
+    """ Replaces the shared arrays in the state of the object (e.g. in the fields of the data)
+    by the references, so the arrays are pickled as the references to the files """
+    if not _mapped_files:
+        return state
+    replaced_state = dict(state)
+    references = {}
+    for name, value in state.items():
+        if isinstance(value, tuple):
+            replaced_state[name] = tuple(_replace_shared_array(item, references) for item in value)
+        else:
+            replaced_state[name] = _replace_shared_array(value, references)
+    return replaced_state
+
+
+def _replace_shared_array(value: Any, references: Dict[int, Any]) -> Any:
+    if not isinstance(value, np.ndarray):
+        return value
+    if id(value) not in references:
+        # the same array is replaced by the same reference, so it is unpickled as one array
+        reference = shared_array_reference(value)
+        references[id(value)] = reference if reference is not None else value
+    return references[id(value)]
+
+
+def _map_file(path: str, dtype: np.dtype, shape: Tuple[int, ...], mode: str, is_owner: bool) -> np.ndarray:
+    mapped = np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+    array = mapped.view(np.ndarray)
+    start = array.__array_interface__['data'][0]
+    with _lock:
+        _mapped_files[start] = _MappedFile(path, dtype, shape, mode, start, start + array.nbytes)
+    weakref.finalize(mapped, _unmap_file, start, path if is_owner else None)
+    with _lock:
+        _attached_arrays[path] = array
+    return array
+
+
+def _unmap_file(start: int, path_to_remove: Optional[str]):
+    with _lock:
+        _mapped_files.pop(start, None)
+    if path_to_remove is not None:
+        try:
+            os.remove(path_to_remove)
+        except OSError:
+            # e.g. the file is still mapped by the other process on Windows
+            pass
+
+
+def _attach_shared_array(path: str, file_dtype: np.dtype, file_shape: Tuple[int, ...], mode: str,
+                         offset: int, shape: Tuple[int, ...], strides: Tuple[int, ...],
+                         dtype: np.dtype) -> np.ndarray:
+    with _lock:
+        base_array = _attached_arrays.get(path)
+    if base_array is None:
+        base_array = _map_file(path, file_dtype, file_shape, mode, is_owner=False)
+    if offset == 0 and shape == base_array.shape and strides == base_array.strides and dtype == base_array.dtype:
+        return base_array
+    return np.ndarray(shape, dtype=dtype, buffer=base_array, offset=offset, strides=strides)
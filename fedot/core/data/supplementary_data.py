@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
 
+from fedot.core.data.table_schema import TableSchema
 from fedot.core.repository.operation_types_repository import OperationTypesRepository
 from fedot.core.repository.tasks import TaskTypesEnum
 
@@ -21,6 +22,8 @@ class SupplementaryData:
     features_mask: Optional[dict] = None
     # Last visited nodes
     previous_operations: Optional[list] = None
+    # Types of the columns of the table features inferred once for the features array
+    table_schema: Optional[TableSchema] = field(default=None, repr=False, compare=False)
 
     def calculate_data_flow_len(self, outputs):
         """ Method for calculating data flow length (amount of visited nodes)
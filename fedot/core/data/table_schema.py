@@ -0,0 +1,181 @@
+import weakref
+from copy import copy
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# If the partition of the non-numeric values in the column with strings is less than
+# NUMERIC_PARTITION_THRESHOLD, the column is converted to numeric and these values are replaced with nan
+NUMERIC_PARTITION_THRESHOLD = 0.1
+# If the partition is between NUMERIC_PARTITION_THRESHOLD and CATEGORICAL_PARTITION_THRESHOLD,
+# the column is mixed and can not be processed automatically
+CATEGORICAL_PARTITION_THRESHOLD = 0.9
+
+# Kinds of the columns (inferred by pandas) with numbers and missing values only
+_NUMERIC_KINDS = {'integer', 'floating', 'mixed-integer-float', 'decimal', 'boolean', 'empty'}
+
+
+class TableSchema:
+    """
+    Types of the columns and the missing values of the table inferred once for the features array.
+    The schema is used both for the preprocessing of the table (the conversion of the columns
+    with a few non-numeric values to numeric) and for the checks of the missing values
+    and categorical features.
+
+    :param features: table to describe
+    :param target: target of the table
+
+    .. note::
+        The schema is bound to the features and target arrays (by identity),
+        in-place modifications of the arrays are not tracked
+    """
+
+    def __init__(self, features: Union[np.ndarray, list], target: Optional[np.ndarray] = None):
+        self._features_ref = _weak_ref(features)
+        self._target_ref = _weak_ref(target)
+
+        table = np.asarray(features)
+        if table.ndim == 1:
+            table = table.reshape(-1, 1)
+        rows_amount = max(table.shape[0], 1)
+
+        # Indices of the columns with the strings which must be converted to numeric
+        self.converted_columns: List[int] = []
+        # Indices of the columns with both numbers and strings which can not be processed automatically
+        self.mixed_columns: List[int] = []
+        # Indices of the columns with strings only
+        self.categorical_columns: List[int] = []
+        # Amount of the missing values in each column
+        self.missing_counts = np.zeros(table.shape[1] if table.ndim > 1 else 0, dtype=int)
+        # Amount of the missing values in the converted columns after the conversion
+        self._converted_missing_counts = {}
+
+        if table.dtype.kind in 'biufc':
+            if table.dtype.kind in 'fc':
+                self.missing_counts = np.isnan(table).sum(axis=0)
+        elif table.ndim == 2:
+            self._infer_object_columns(table, rows_amount)
+
+        self.target_missing_rows = _missing_rows(target)
+
+    def _infer_object_columns(self, table: np.ndarray, rows_amount: int):
+        if table.dtype.kind in 'US':
+            table = table.astype(object)
+        self.missing_counts = np.zeros(table.shape[1], dtype=int)
+
+        numeric_columns = []
+        for column_id in range(table.shape[1]):
+            column = table[:, column_id]
+            if pd.api.types.infer_dtype(column, skipna=True) in _NUMERIC_KINDS:
+                numeric_columns.append(column_id)
+                continue
+
+            missing_mask = pd.isna(column)
+            self.missing_counts[column_id] = np.count_nonzero(missing_mask)
+            if not any(isinstance(value, str) for value in column):
+                continue
+
+            numeric_column = pd.to_numeric(column, errors='coerce')
+            numeric_missing_mask = pd.isna(numeric_column)
+            not_numeric_amount = np.count_nonzero(numeric_missing_mask & ~missing_mask)
+            partition_not_numeric = not_numeric_amount / rows_amount
+            if partition_not_numeric < NUMERIC_PARTITION_THRESHOLD:
+                self.converted_columns.append(column_id)
+                self._converted_missing_counts[column_id] = np.count_nonzero(numeric_missing_mask)
+            elif partition_not_numeric < CATEGORICAL_PARTITION_THRESHOLD:
+                self.mixed_columns.append(column_id)
+            else:
+                self.categorical_columns.append(column_id)
+
+        if numeric_columns:
+            self.missing_counts[numeric_columns] = _missing_counts_of_numeric(table[:, numeric_columns])
+
+    @property
+    def has_categorical(self) -> bool:
+        return bool(self.categorical_columns or self.mixed_columns or self.converted_columns)
+
+    @property
+    def has_missing(self) -> bool:
+        return bool(np.any(self.missing_counts))
+
+    def describes(self, features, target=None) -> bool:
+        """ Whether the schema was inferred for these features and target """
+        return _is_same(self._features_ref, features) and _is_same(self._target_ref, target)
+
+    def for_converted_table(self) -> 'TableSchema':
+        """ Returns the schema of the same table after the conversion
+        of the columns with a few non-numeric values to numeric """
+        schema = copy(self)
+        schema.converted_columns = []
+        schema._converted_missing_counts = {}
+        schema.missing_counts = np.array(self.missing_counts)
+        for column_id, missing_count in self._converted_missing_counts.items():
+            schema.missing_counts[column_id] = missing_count
+        return schema
+
+    def for_table_without_rows(self, features: np.ndarray, target: Optional[np.ndarray],
+                               removed_features: np.ndarray) -> 'TableSchema':
+        """
+        Returns the schema for the table obtained from the described one
+        by the removal of the rows with the missing target
+
+        :param features: table without the rows
+        :param target: target without the rows
+        :param removed_features: removed rows of the described table
+        """
+        schema = copy(self)
+        schema._features_ref = _weak_ref(features)
+        schema._target_ref = _weak_ref(target)
+        schema.missing_counts = self.missing_counts - pd.isna(removed_features).sum(axis=0)
+        schema.target_missing_rows = np.array([], dtype=int)
+        return schema
+
+    def __copy__(self):
+        schema = TableSchema.__new__(TableSchema)
+        schema.__dict__.update(self.__dict__)
+        return schema
+
+    def __getstate__(self):
+        # The references to the arrays are not transferred, so the schema
+        # is inferred again for the copy of the data in the other process
+        state = dict(self.__dict__)
+        state['_features_ref'] = None
+        state['_target_ref'] = None
+        return state
+
+
+def _weak_ref(array) -> Optional[weakref.ref]:
+    if array is None:
+        return None
+    try:
+        return weakref.ref(array)
+    except TypeError:
+        # e.g. lists do not support the weak references
+        return None
+
+
+def _is_same(ref, array) -> bool:
+    if array is None:
+        return ref is None
+    return ref is not None and ref() is array
+
+
+def _missing_counts_of_numeric(table: np.ndarray) -> np.ndarray:
+    try:
+        return np.isnan(table.astype(float)).sum(axis=0)
+    except (TypeError, ValueError):
+        # e.g. None values can not be converted to float
+        return pd.isna(table).sum(axis=0)
+
+
+def _missing_rows(target: Optional[np.ndarray]) -> np.ndarray:
+    if target is None or np.ndim(target) == 0:
+        return np.array([], dtype=int)
+    target = np.asarray(target)
+    if target.dtype.kind in 'biu':
+        return np.array([], dtype=int)
+    missing_mask = pd.isna(target)
+    if missing_mask.ndim > 1:
+        missing_mask = missing_mask.any(axis=tuple(range(1, missing_mask.ndim)))
+    return np.flatnonzero(missing_mask)
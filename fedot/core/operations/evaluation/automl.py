@@ -1,22 +1,21 @@
-import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
-from h2o import h2o, H2OFrame
-from h2o.automl import H2OAutoML
-from tpot import TPOTClassifier, TPOTRegressor
-
-from fedot.core.pipelines.automl_wrappers import *
-
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.operations.evaluation.evaluation_interfaces import EvaluationStrategy
+from fedot.core.pipelines.automl_wrappers import H2OSerializationWrapper, TPOTRegressionSerializationWrapper
+from fedot.core.repository.json_evaluation import import_object
 from fedot.core.repository.tasks import TaskTypesEnum
 
+if TYPE_CHECKING:
+    from h2o import H2OFrame
+
 
 class H2OAutoMLRegressionStrategy(EvaluationStrategy):
+    # h2o and tpot are imported on the first use of the strategies
     __operations_by_types = {
-        'h2o_regr': H2OAutoML
+        'h2o_regr': 'h2o.automl.H2OAutoML'
     }
 
     def __init__(self, operation_type: str, params: Optional[dict] = None):
@@ -26,6 +25,8 @@ class H2OAutoMLRegressionStrategy(EvaluationStrategy):
         super().__init__(operation_type, params)
 
     def fit(self, train_data: InputData):
+        from h2o import h2o
+
         ip, port = self._get_h2o_connect_config()
         h2o.init(ip=ip, port=port, name='h2o_server')
 
@@ -46,16 +47,18 @@ class H2OAutoMLRegressionStrategy(EvaluationStrategy):
         for name in target_names:
             train_columns.remove(name)
         for name in target_names:
-            model = H2OAutoML(max_models=self.params.get("max_models"),
-                              seed=self.params.get("seed"),
-                              max_runtime_secs=self.params.get("timeout") * 60 // target_len
-                              )
+            model = self.operation_impl(max_models=self.params.get("max_models"),
+                                        seed=self.params.get("seed"),
+                                        max_runtime_secs=self.params.get("timeout") * 60 // target_len
+                                        )
             model.train(x=train_columns, y=name, training_frame=train_frame)
             models.append(model.leader)
 
         return H2OSerializationWrapper(models)
 
     def predict(self, trained_operation, predict_data: InputData, is_fit_pipeline_stage: bool) -> OutputData:
+        from h2o import H2OFrame
+
         res = []
         for model in trained_operation.get_estimators():
             frame = H2OFrame(predict_data.features)
@@ -68,11 +71,13 @@ class H2OAutoMLRegressionStrategy(EvaluationStrategy):
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
-            return self.__operations_by_types[operation_type]
+            return import_object(self.__operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain H2O AutoML Regression Strategy for {operation_type}')
 
-    def _data_transform(self, data: InputData) -> H2OFrame:
+    def _data_transform(self, data: InputData) -> 'H2OFrame':
+        from h2o import H2OFrame
+
         if len(data.target.shape) == 1:
             concat_data = np.concatenate((data.features, data.target.reshape(-1, 1)), 1)
         else:
@@ -88,7 +93,7 @@ class H2OAutoMLRegressionStrategy(EvaluationStrategy):
 
 class H2OAutoMLClassificationStrategy(EvaluationStrategy):
     __operations_by_types = {
-        'h2o_class': H2OAutoML
+        'h2o_class': 'h2o.automl.H2OAutoML'
     }
 
     def __init__(self, operation_type: str, params: Optional[dict] = None):
@@ -99,6 +104,8 @@ class H2OAutoMLClassificationStrategy(EvaluationStrategy):
         super().__init__(operation_type, params)
 
     def fit(self, train_data: InputData):
+        from h2o import h2o
+
         ip, port = self._get_h2o_connect_config()
 
         h2o.init(ip=ip, port=port, name='h2o_server')
@@ -137,11 +144,13 @@ class H2OAutoMLClassificationStrategy(EvaluationStrategy):
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
-            return self.__operations_by_types[operation_type]
+            return import_object(self.__operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain H2O AutoML Classification Strategy for {operation_type}')
 
-    def _data_transform(self, data: InputData) -> H2OFrame:
+    def _data_transform(self, data: InputData) -> 'H2OFrame':
+        from h2o import H2OFrame
+
         concat_data = np.concatenate((data.features, data.target.reshape(-1, 1)), 1)
         frame = H2OFrame(python_obj=concat_data)
         return frame
@@ -154,7 +163,7 @@ class H2OAutoMLClassificationStrategy(EvaluationStrategy):
 
 class TPOTAutoMLRegressionStrategy(EvaluationStrategy):
     __operations_by_types = {
-        'tpot_regr': TPOTRegressor
+        'tpot_regr': 'tpot.TPOTRegressor'
     }
 
     def __init__(self, operation_type: str, params: Optional[dict] = None):
@@ -199,14 +208,14 @@ class TPOTAutoMLRegressionStrategy(EvaluationStrategy):
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
-            return self.__operations_by_types[operation_type]
+            return import_object(self.__operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain H2O AutoML Regression Strategy for {operation_type}')
 
 
 class TPOTAutoMLClassificationStrategy(EvaluationStrategy):
     __operations_by_types = {
-        'tpot_class': TPOTClassifier
+        'tpot_class': 'tpot.TPOTClassifier'
     }
 
     def __init__(self, operation_type: str, params: Optional[dict] = None):
@@ -245,6 +254,6 @@ class TPOTAutoMLClassificationStrategy(EvaluationStrategy):
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
-            return self.__operations_by_types[operation_type]
+            return import_object(self.__operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain H2O AutoML Classification Strategy for {operation_type}')
@@ -9,12 +9,7 @@ from fedot.core.operations.evaluation.operation_implementations.data_operations.
     ResampleImplementation
 from fedot.core.operations.evaluation.operation_implementations. \
     data_operations.sklearn_selectors import LinearClassFSImplementation, NonLinearClassFSImplementation
-from fedot.core.operations.evaluation.operation_implementations.models. \
-    discriminant_analysis import LDAImplementation, QDAImplementation
-from fedot.core.operations.evaluation.operation_implementations.models. \
-    keras import FedotCNNImplementation
-from fedot.core.operations.evaluation.operation_implementations.models.knn import FedotKnnClassImplementation
-from fedot.core.operations.evaluation.operation_implementations.models.svc import FedotSVCImplementation
+from fedot.core.repository.json_evaluation import import_object
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -42,12 +37,15 @@ class SkLearnClassificationStrategy(SkLearnEvaluationStrategy):
 
 
 class FedotClassificationStrategy(EvaluationStrategy):
+    # Operations are imported on the first use, the cnn requires tensorflow
     __operations_by_types = {
-        'lda': LDAImplementation,
-        'qda': QDAImplementation,
-        'svc': FedotSVCImplementation,
-        'cnn': FedotCNNImplementation,
-        'knn': FedotKnnClassImplementation
+        'lda': 'fedot.core.operations.evaluation.operation_implementations.models.'
+               'discriminant_analysis.LDAImplementation',
+        'qda': 'fedot.core.operations.evaluation.operation_implementations.models.'
+               'discriminant_analysis.QDAImplementation',
+        'svc': 'fedot.core.operations.evaluation.operation_implementations.models.svc.FedotSVCImplementation',
+        'cnn': 'fedot.core.operations.evaluation.operation_implementations.models.keras.FedotCNNImplementation',
+        'knn': 'fedot.core.operations.evaluation.operation_implementations.models.knn.FedotKnnClassImplementation'
     }
 
     def __init__(self, operation_type: str, params: Optional[dict] = None):
@@ -98,7 +96,7 @@ class FedotClassificationStrategy(EvaluationStrategy):
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
-            return self.__operations_by_types[operation_type]
+            return import_object(self.__operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain Fedot Classification Strategy for {operation_type}')
 
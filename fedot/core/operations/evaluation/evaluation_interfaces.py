@@ -2,23 +2,12 @@ import warnings
 from abc import abstractmethod
 from typing import Optional
 
-from catboost import CatBoostClassifier, CatBoostRegressor
-from lightgbm import LGBMClassifier, LGBMRegressor
-from sklearn.cluster import KMeans as SklearnKmeans
-from sklearn.ensemble import AdaBoostRegressor, ExtraTreesRegressor, GradientBoostingRegressor, RandomForestClassifier, \
-    RandomForestRegressor
-from sklearn.linear_model import Lasso as SklearnLassoReg, LinearRegression as SklearnLinReg, \
-    LogisticRegression as SklearnLogReg, Ridge as SklearnRidgeReg, SGDRegressor as SklearnSGD
 from sklearn.multioutput import MultiOutputClassifier, MultiOutputRegressor
-from sklearn.naive_bayes import BernoulliNB as SklearnBernoulliNB, MultinomialNB as SklearnMultinomialNB
-from sklearn.neural_network import MLPClassifier
-from sklearn.svm import LinearSVR as SklearnSVR
-from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
-from xgboost import XGBClassifier, XGBRegressor
 
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.log import Log, default_log
 from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.json_evaluation import import_object
 from fedot.core.repository.operation_types_repository import (OperationTypesRepository,
                                                               get_operation_type_from_id)
 from fedot.core.repository.tasks import TaskTypesEnum
@@ -115,32 +104,33 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
     data operation repositories
     :param dict params: hyperparameters to fit the operation with
     """
+    # Operations are imported on the first use to avoid loading of all the ML backends
     __operations_by_types = {
-        'xgbreg': XGBRegressor,
-        'adareg': AdaBoostRegressor,
-        'gbr': GradientBoostingRegressor,
-        'dtreg': DecisionTreeRegressor,
-        'treg': ExtraTreesRegressor,
-        'rfr': RandomForestRegressor,
-        'linear': SklearnLinReg,
-        'ridge': SklearnRidgeReg,
-        'lasso': SklearnLassoReg,
-        'svr': SklearnSVR,
-        'sgdr': SklearnSGD,
-        'lgbmreg': LGBMRegressor,
-        'catboostreg': CatBoostRegressor,
-
-        'xgboost': XGBClassifier,
-        'logit': SklearnLogReg,
-        'bernb': SklearnBernoulliNB,
-        'multinb': SklearnMultinomialNB,
-        'dt': DecisionTreeClassifier,
-        'rf': RandomForestClassifier,
-        'mlp': MLPClassifier,
-        'lgbm': LGBMClassifier,
-        'catboost': CatBoostClassifier,
-
-        'kmeans': SklearnKmeans,
+        'xgbreg': 'xgboost.XGBRegressor',
+        'adareg': 'sklearn.ensemble.AdaBoostRegressor',
+        'gbr': 'sklearn.ensemble.GradientBoostingRegressor',
+        'dtreg': 'sklearn.tree.DecisionTreeRegressor',
+        'treg': 'sklearn.ensemble.ExtraTreesRegressor',
+        'rfr': 'sklearn.ensemble.RandomForestRegressor',
+        'linear': 'sklearn.linear_model.LinearRegression',
+        'ridge': 'sklearn.linear_model.Ridge',
+        'lasso': 'sklearn.linear_model.Lasso',
+        'svr': 'sklearn.svm.LinearSVR',
+        'sgdr': 'sklearn.linear_model.SGDRegressor',
+        'lgbmreg': 'lightgbm.LGBMRegressor',
+        'catboostreg': 'catboost.CatBoostRegressor',
+
+        'xgboost': 'xgboost.XGBClassifier',
+        'logit': 'sklearn.linear_model.LogisticRegression',
+        'bernb': 'sklearn.naive_bayes.BernoulliNB',
+        'multinb': 'sklearn.naive_bayes.MultinomialNB',
+        'dt': 'sklearn.tree.DecisionTreeClassifier',
+        'rf': 'sklearn.ensemble.RandomForestClassifier',
+        'mlp': 'sklearn.neural_network.MLPClassifier',
+        'lgbm': 'lightgbm.LGBMClassifier',
+        'catboost': 'catboost.CatBoostClassifier',
+
+        'kmeans': 'sklearn.cluster.KMeans',
     }
 
     def __init__(self, operation_type: str, params: Optional[dict] = None):
@@ -191,13 +181,13 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
-            return self.__operations_by_types[operation_type]
+            return import_object(self.__operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain SKlearn strategy for {operation_type}')
 
     def _find_operation_by_impl(self, impl):
         for operation, operation_impl in self.__operations_by_types.items():
-            if operation_impl == impl:
+            if import_object(operation_impl) == impl:
                 return operation
 
     @property
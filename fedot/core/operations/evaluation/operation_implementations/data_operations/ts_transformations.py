@@ -85,8 +85,8 @@ class LaggedImplementation(DataOperationImplementation):
                 self.features_columns = self.features_columns[-1]
 
             if not self.sparse_transform:
-                features = np.array(new_input_data.features)
-                self.features_columns = features[-self.window_size:]
+                # Only the last window of the time series is used for the forecast
+                self.features_columns = np.array(new_input_data.features[-self.window_size:])
 
             self.features_columns = self.features_columns.reshape(1, -1)
 
@@ -375,24 +375,12 @@ def ts_to_table(idx, time_series: np.array, window_size: int):
     :param window_size: size of sliding window, which defines lag
 
     :return updated_idx: clipped indices of time series
-    :return features_columns: lagged time series feature table
+    :return features_columns: lagged time series feature table (read-only view of the time series,
+    so it must be copied before modification)
     """
-    # Convert data to lagged form
-    lagged_dataframe = pd.DataFrame({'t_id': time_series})
-    vals = lagged_dataframe['t_id']
-    for i in range(1, window_size + 1):
-        frames = [lagged_dataframe, vals.shift(i)]
-        lagged_dataframe = pd.concat(frames, axis=1)
-
-    # Remove incomplete rows
-    lagged_dataframe.dropna(inplace=True)
-
-    transformed = np.array(lagged_dataframe)
-
-    # Remove extra column (it will go to target)
-    features_columns = transformed[:, 1:]
-    # Generate dataset with features
-    features_columns = np.fliplr(features_columns)
+    # Rows of the lagged table are the windows of the time series preceding each element
+    time_series = np.asarray(time_series, dtype=float)
+    features_columns = _sliding_window_view(time_series, window_size)[:-1]
 
     # First n elements in time series are removed
     updated_idx = idx[window_size:]
@@ -426,8 +414,8 @@ def _sparse_matrix(logger, features_columns: np.array, n_components_perc=0.5, us
         components = _get_svd(features_columns, n_components)
     else:
         step = int(1 / n_components_perc)
-        indeces_to_stay = np.arange(1, features_columns.shape[1], step)
-        components = np.take(features_columns, indeces_to_stay, 1)
+        # Every step-th column starting from the second one (the columns are not copied)
+        components = features_columns[:, 1::step]
 
     return components
 
@@ -459,7 +447,7 @@ def prepare_target(idx, features_columns: np.array, target, forecast_length: int
 
     :return updated_idx: clipped indices of time series
     :return updated_features: clipped lagged feature table
-    :return updated_target: lagged target table
+    :return updated_target: lagged target table (read-only view of the target for multi-step forecasting)
     """
 
     # Update target (clip first "window size" values)
@@ -467,16 +455,8 @@ def prepare_target(idx, features_columns: np.array, target, forecast_length: int
 
     # Multi-target transformation
     if forecast_length > 1:
-        # Target transformation
-        df = pd.DataFrame({'t_id': ts_target})
-        vals = df['t_id']
-        for i in range(1, forecast_length):
-            frames = [df, vals.shift(-i)]
-            df = pd.concat(frames, axis=1)
-
-        # Remove incomplete rows
-        df.dropna(inplace=True)
-        updated_target = np.array(df)
+        # Each row of the target table is the window of the next forecast_length values
+        updated_target = _sliding_window_view(np.asarray(ts_target, dtype=float), forecast_length)
 
         threshold = -forecast_length + 1
         updated_idx = idx[: threshold]
@@ -487,3 +467,16 @@ def prepare_target(idx, features_columns: np.array, target, forecast_length: int
         updated_target = ts_target
 
     return updated_idx, updated_features, updated_target
+
+
+def _sliding_window_view(series: np.array, window_size: int) -> np.array:
+    """ Method returns the table with the windows of the series as rows.
+    The table is the read-only view of the series, so the values are not copied
+
+    :param series: one-dimensional array
+    :param window_size: size of the window
+    """
+    windows_num = max(len(series) - window_size + 1, 0)
+    stride = series.strides[0]
+    return np.lib.stride_tricks.as_strided(series, shape=(windows_num, window_size),
+                                           strides=(stride, stride), writeable=False)
@@ -6,8 +6,7 @@ from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.operations.evaluation.evaluation_interfaces import EvaluationStrategy
-from fedot.core.operations.evaluation.operation_implementations. \
-    data_operations.text_preprocessing import TextCleanImplementation
+from fedot.core.repository.json_evaluation import import_object
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -63,8 +62,10 @@ class SkLearnTextVectorizeStrategy(EvaluationStrategy):
 
 
 class FedotTextPreprocessingStrategy(EvaluationStrategy):
+    # Operations are imported on the first use, the text cleaning requires nltk
     __operations_by_types = {
-        'text_clean': TextCleanImplementation}
+        'text_clean': 'fedot.core.operations.evaluation.operation_implementations.data_operations.'
+                      'text_preprocessing.TextCleanImplementation'}
 
     def __init__(self, operation_type: str, params: Optional[dict] = None):
         self.text_processor = self._convert_to_operation(operation_type)
@@ -105,6 +106,6 @@ class FedotTextPreprocessingStrategy(EvaluationStrategy):
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
-            return self.__operations_by_types[operation_type]
+            return import_object(self.__operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain custom text preprocessing strategy for {operation_type}')
@@ -6,9 +6,7 @@ from fedot.core.operations.evaluation.evaluation_interfaces import EvaluationStr
 from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
     ExogDataTransformationImplementation, GaussianFilterImplementation, LaggedTransformationImplementation, \
     TsSmoothingImplementation, SparseLaggedTransformationImplementation, CutImplementation
-from fedot.core.operations.evaluation.operation_implementations.models. \
-    ts_implementations import ARIMAImplementation, AutoRegImplementation, STLForecastARIMAImplementation, \
-    CLSTMImplementation
+from fedot.core.repository.json_evaluation import import_object
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -23,11 +21,16 @@ class FedotTsForecastingStrategy(EvaluationStrategy):
     :param dict params: hyperparameters to fit the model with
     """
 
+    # Operations are imported on the first use, the models require statsmodels and torch
     __operations_by_types = {
-        'arima': ARIMAImplementation,
-        'ar': AutoRegImplementation,
-        'stl_arima': STLForecastARIMAImplementation,
-        'clstm': CLSTMImplementation}
+        'arima': 'fedot.core.operations.evaluation.operation_implementations.models.'
+                 'ts_implementations.ARIMAImplementation',
+        'ar': 'fedot.core.operations.evaluation.operation_implementations.models.'
+              'ts_implementations.AutoRegImplementation',
+        'stl_arima': 'fedot.core.operations.evaluation.operation_implementations.models.'
+                     'ts_implementations.STLForecastARIMAImplementation',
+        'clstm': 'fedot.core.operations.evaluation.operation_implementations.models.'
+                 'ts_implementations.CLSTMImplementation'}
 
     def __init__(self, operation_type: str, params: Optional[dict] = None):
         super().__init__(operation_type, params)
@@ -68,7 +71,7 @@ class FedotTsForecastingStrategy(EvaluationStrategy):
 
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
-            return self.__operations_by_types[operation_type]
+            return import_object(self.__operations_by_types[operation_type])
         else:
             raise ValueError(f'Impossible to obtain custom time series forecasting '
                              f'strategy for {operation_type}')
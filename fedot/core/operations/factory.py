@@ -2,7 +2,7 @@ from fedot.core.operations.automl import AutoML
 from fedot.core.operations.data_operation import DataOperation
 from fedot.core.operations.model import Model
 from fedot.core.operations.operation import Operation
-from fedot.core.repository.operation_types_repository import OperationTypesRepository, get_operation_type_from_id
+from fedot.core.repository.operation_types_repository import OperationTypesRepository
 
 
 class OperationFactory:
@@ -48,19 +48,15 @@ class OperationFactory:
 
         # Get available models from model_repository.json file
         operations_repo = OperationTypesRepository('data_operation')
-        operations = operations_repo.operations
         if 'automl' in OperationTypesRepository.get_available_repositories():
             automl_repo = OperationTypesRepository('automl')
-            models_automl = automl_repo.operations
         else:
-            models_automl = []
-
-        operation_name = get_operation_type_from_id(self.operation_name)
+            automl_repo = None
 
         # If there is a such model in the list
-        if any(operation_name == model.id for model in operations):
+        if operations_repo.has_operation(self.operation_name):
             operation_type = 'data_operation'
-        elif any(operation_name == model.id for model in models_automl):
+        elif automl_repo is not None and automl_repo.has_operation(self.operation_name):
             operation_type = 'automl'
         # Otherwise - it is model
         else:
@@ -1,13 +1,16 @@
 from abc import abstractmethod
-from copy import deepcopy
-from typing import Any, Type
+from copy import copy, deepcopy
+from typing import Any, Callable, List, Type
 
 from fedot.core.dag.graph_node import GraphNode
 from fedot.core.log import default_log
+from fedot.core.operations.atomized_model import AtomizedModel
+from fedot.core.operations.operation import Operation
 from fedot.core.optimisers.graph import OptGraph, OptNode
 from fedot.core.pipelines.node import Node, PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.template import PipelineTemplate
+from fedot.core.utils import DEFAULT_PARAMS_STUB
 
 
 class BaseOptimizationAdapter:
@@ -66,56 +69,44 @@ class PipelineAdapter(BaseOptimizationAdapter):
         """
         super().__init__(base_graph_class=Pipeline, base_node_class=Node, log=log)
 
-    def _transform_to_opt_node(self, node, *args, **params):
-        # Prepare content for nodes
-        if type(node) == OptNode:
+    def _transform_to_opt_node(self, node, is_primary):
+        if isinstance(node, OptNode):
             self._log.warn('Unexpected: OptNode found in PipelineAdapter instead'
                            'PrimaryNode or SecondaryNode.')
-        else:
-            if type(node) == GraphNode:
-                self._log.warn('Unexpected: GraphNode found in PipelineAdapter instead'
-                               'PrimaryNode or SecondaryNode.')
-            else:
-                content = {'name': node.operation,
-                           'params': node.custom_params}
-
-                node.__class__ = OptNode
-                node.content = content
-
-    def _transform_to_pipeline_node(self, node, *args, **params):
-        if node.nodes_from:
-            node.__class__ = params.get('secondary_class')
-        else:
-            node.__class__ = params.get('primary_class')
-        if not node.nodes_from:
-            node.__init__(operation_type=node.content['name'], content=node.content)
-        else:
-            node.__init__(nodes_from=node.nodes_from,
-                          operation_type=node.content['name'], content=node.content
-                          )
+        elif not isinstance(node, Node):
+            self._log.warn('Unexpected: GraphNode found in PipelineAdapter instead'
+                           'PrimaryNode or SecondaryNode.')
+            return GraphNode(content=dict(node.content))
+
+        content = {'name': _detached_operation(node.content['name']),
+                   'params': deepcopy(node.content.get('params', DEFAULT_PARAMS_STUB))}
+        opt_node = OptNode(content=content, log=node.log)
+        # The params are replaced with the stub in the constructor of OptNode
+        opt_node.content = content
+        return opt_node
+
+    def _transform_to_pipeline_node(self, node, is_primary):
+        content = {'name': _detached_operation(node.content['name']),
+                   'params': deepcopy(node.content['params'])}
+        if is_primary:
+            return PrimaryNode(content=content)
+        return SecondaryNode(content=content)
 
     def adapt(self, adaptee: Pipeline):
-        """ Convert Pipeline class into OptGraph class """
-        source_pipeline = deepcopy(adaptee)
-
-        # Apply recursive transformation since root
-        for node in source_pipeline.nodes:
-            _transform_node(node=node, primary_class=OptNode,
-                            transform_func=self._transform_to_opt_node)
-        graph = OptGraph(source_pipeline.nodes)
-        graph.uid = source_pipeline.uid
+        """ Convert Pipeline class into OptGraph class.
+        Only the structure and the description of the operations are copied,
+        the fitted operations and the data of the nodes stay in the pipeline """
+        nodes = _copy_nodes(adaptee.nodes, self._transform_to_opt_node)
+        graph = OptGraph(nodes)
+        graph.uid = adaptee.uid
         return graph
 
     def restore(self, opt_graph: OptGraph, computation_time=None):
-        """ Convert OptGraph class into Pipeline class """
-        source_graph = deepcopy(opt_graph)
-
-        # Inverse transformation since root node
-        for node in source_graph.nodes:
-            _transform_node(node=node, primary_class=PrimaryNode, secondary_class=SecondaryNode,
-                            transform_func=self._transform_to_pipeline_node)
-        pipeline = Pipeline(source_graph.nodes)
-        pipeline.uid = source_graph.uid
+        """ Convert OptGraph class into Pipeline class. The restored pipeline is not fitted
+        and does not share any mutable state with the graph """
+        nodes = _copy_nodes(opt_graph.nodes, self._transform_to_pipeline_node)
+        pipeline = Pipeline(nodes)
+        pipeline.uid = opt_graph.uid
         pipeline.computation_time = computation_time
         return pipeline
 
@@ -132,10 +123,33 @@ def _check_nodes_references_correct(graph):
                     raise ValueError('Parent node not in graph nodes list')
 
 
-def _transform_node(node, primary_class, secondary_class=None, transform_func=None):
-    if transform_func:
-        if not secondary_class:
-            secondary_class = primary_class  # if there are no differences between primary and secondary class
-        transform_func(node=node,
-                       primary_class=primary_class,
-                       secondary_class=secondary_class)
+def _copy_nodes(nodes: List[Any], transform_func: Callable) -> List[Any]:
+    """ Creates the new nodes with the same structure as the source ones.
+    transform_func(node, is_primary) creates the copy of the node without the parents,
+    the parents are linked after all the nodes are created (so the cycles are copied too) """
+    copies = {}
+    nodes_to_link = list(nodes)
+    while nodes_to_link:
+        node = nodes_to_link.pop()
+        if node not in copies:
+            copies[node] = transform_func(node, not node.nodes_from)
+            nodes_to_link.extend(node.nodes_from or [])
+
+    for node, node_copy in copies.items():
+        if node.nodes_from:
+            node_copy.nodes_from = [copies[parent] for parent in node.nodes_from]
+    return [copies[node] for node in nodes]
+
+
+def _detached_operation(operation: Any) -> Any:
+    """ Returns the copy of the operation without the fitted state. The description of the operation
+    (type, repository, log) is shared with the source, the fitted model is neither copied nor shared """
+    if isinstance(operation, AtomizedModel):
+        # The nested pipeline of the atomized model is the mutable part of the operation
+        return deepcopy(operation)
+    if not isinstance(operation, Operation):
+        return operation
+    operation_copy = copy(operation)
+    operation_copy._eval_strategy = None
+    operation_copy.fitted_operation = None
+    return operation_copy
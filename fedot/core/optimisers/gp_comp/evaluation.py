@@ -0,0 +1,72 @@
+import os
+from abc import ABC, abstractmethod
+from multiprocessing import Pool
+from typing import Any, Callable, Iterator, Sequence, Tuple
+
+# The function evaluated in the worker process. It is passed once per worker
+# instead of pickling it (with all the data inside) for each task
+_worker_function = None
+
+
+class EvaluationBackend(ABC):
+    """
+    Base class for the backends used to calculate the fitness of the individuals
+    """
+
+    @abstractmethod
+    def evaluate(self, function: Callable, items: Sequence[Any]) -> Iterator[Tuple[int, Any]]:
+        """
+        Apply the function to each item and yield the results as soon as they are obtained.
+        The evaluation of the remaining items is stopped when the iterator is closed
+
+        :param function: function to apply
+        :param items: arguments for the function
+        :return: iterator of pairs (index of the item, result of the function for the item)
+        """
+        raise NotImplementedError()
+
+
+class SequentialEvaluationBackend(EvaluationBackend):
+    """
+    The items are evaluated one by one in the current process
+    """
+
+    def evaluate(self, function: Callable, items: Sequence[Any]) -> Iterator[Tuple[int, Any]]:
+        for item_num, item in enumerate(items):
+            yield item_num, function(item)
+
+
+class MultiprocessingEvaluationBackend(EvaluationBackend):
+    """
+    The items are evaluated simultaneously in the pool of worker processes.
+    The function and the items must be picklable
+
+    :param n_jobs: number of worker processes, -1 means using all the available cores
+    """
+
+    def __init__(self, n_jobs: int = -1):
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+
+    def evaluate(self, function: Callable, items: Sequence[Any]) -> Iterator[Tuple[int, Any]]:
+        processes = min(self.n_jobs, len(items))
+        if processes <= 1:
+            yield from SequentialEvaluationBackend().evaluate(function, items)
+            return
+
+        pool = Pool(processes=processes, initializer=_set_worker_function, initargs=(function,))
+        try:
+            yield from pool.imap_unordered(_call_worker_function, enumerate(items))
+        finally:
+            # the workers evaluating already unnecessary items are stopped too
+            pool.terminate()
+            pool.join()
+
+
+def _set_worker_function(function: Callable):
+    global _worker_function
+    _worker_function = function
+
+
+def _call_worker_function(numbered_item: Tuple[int, Any]) -> Tuple[int, Any]:
+    item_num, item = numbered_item
+    return item_num, _worker_function(item)
@@ -1,10 +1,12 @@
 import timeit
 import warnings
 from copy import deepcopy
+from functools import partial
 from random import choice, randint
 from typing import (Any, Callable, List, Tuple)
 
 from fedot.core.composer.constraint import constraint_function
+from fedot.core.optimisers.gp_comp.evaluation import EvaluationBackend, SequentialEvaluationBackend
 from fedot.core.optimisers.graph import OptGraph, OptNode
 from fedot.core.optimisers.utils.multi_objective_fitness import MultiObjFitness
 from fedot.core.utils import DEFAULT_PARAMS_STUB
@@ -111,25 +113,41 @@ def num_of_parents_in_crossover(num_of_final_inds: int) -> int:
 
 
 def evaluate_individuals(individuals_set, objective_function, graph_generation_params,
-                         is_multi_objective: bool, timer=None):
+                         is_multi_objective: bool, timer=None, evaluation_backend: EvaluationBackend = None):
+    if evaluation_backend is None:
+        evaluation_backend = SequentialEvaluationBackend()
     num_of_successful_evals = 0
     reversed_set = individuals_set[::-1]
-    evaluated_individuals = []
-    for ind in reversed_set:
-        start_time = timeit.default_timer()
-
-        ind.fitness = calculate_objective(ind.graph, objective_function,
-                                          is_multi_objective, graph_generation_params)
-        ind.computation_time = timeit.default_timer() - start_time
-        if ind.fitness is not None:
-            num_of_successful_evals += 1
-            evaluated_individuals.append(ind)
-        if timer is not None and num_of_successful_evals > 0:
-            if timer.is_time_limit_reached():
-                break
+    evaluated_individuals = {}
+
+    timed_objective = partial(_calculate_objective_with_time, objective_function=objective_function,
+                              is_multi_objective=is_multi_objective,
+                              graph_generation_params=graph_generation_params)
+    results = evaluation_backend.evaluate(timed_objective, [ind.graph for ind in reversed_set])
+    try:
+        for ind_num, (fitness, computation_time) in results:
+            ind = reversed_set[ind_num]
+            ind.fitness = fitness
+            ind.computation_time = computation_time
+            if ind.fitness is not None:
+                num_of_successful_evals += 1
+                evaluated_individuals[ind_num] = ind
+            if timer is not None and num_of_successful_evals > 0:
+                if timer.is_time_limit_reached():
+                    break
+    finally:
+        results.close()
     if len(evaluated_individuals) == 0:
         raise AttributeError('Too much fitness evaluation errors. Composing stopped.')
-    return evaluated_individuals
+    # the order of individuals does not depend on the order of evaluation
+    return [evaluated_individuals[ind_num] for ind_num in sorted(evaluated_individuals)]
+
+
+def _calculate_objective_with_time(graph: OptGraph, objective_function: Callable, is_multi_objective: bool,
+                                   graph_generation_params) -> Tuple[Any, float]:
+    start_time = timeit.default_timer()
+    fitness = calculate_objective(graph, objective_function, is_multi_objective, graph_generation_params)
+    return fitness, timeit.default_timer() - start_time
 
 
 def calculate_objective(graph: OptGraph, objective_function: Callable, is_multi_objective: bool,
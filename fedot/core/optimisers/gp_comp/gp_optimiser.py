@@ -12,9 +12,12 @@ from fedot.core.composer.constraint import constraint_function
 from fedot.core.log import Log, default_log
 from fedot.core.optimisers.adapters import BaseOptimizationAdapter, DirectAdapter
 from fedot.core.optimisers.gp_comp.archive import SimpleArchive
+from fedot.core.optimisers.gp_comp.evaluation import EvaluationBackend, SequentialEvaluationBackend
 from fedot.core.optimisers.gp_comp.gp_operators import clean_operators_history, \
     duplicates_filtration, evaluate_individuals, num_of_parents_in_crossover, random_graph
 from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.multi_fidelity import MultiFidelityObjective, evaluate_with_successive_halving, \
+    fully_evaluated
 from fedot.core.optimisers.gp_comp.operators.crossover import CrossoverTypesEnum, crossover
 from fedot.core.optimisers.gp_comp.operators.inheritance import GeneticSchemeTypesEnum, inheritance
 from fedot.core.optimisers.gp_comp.operators.mutation import MutationTypesEnum, mutation
@@ -44,6 +47,11 @@ class GPGraphOptimiserParameters:
         :param depth_increase_step: the step of depth increase in automated depth configuration
         :param multi_objective: flag used for of algorithm type definition (muti-objective if true or  single-objective
         if false). Value is defined in GPComposerBuilder. Default False.
+        :param evaluation_backend: backend used for the fitness evaluation of the individuals
+        (e.g. MultiprocessingEvaluationBackend for the simultaneous evaluation). Default sequential evaluation.
+        :param compact_history: if True, the history is written to the append-only log (one record per individual)
+        by the background thread instead of the storing of the pipeline templates and the export of each of them.
+        The log is read by OptHistory.log_reader. Default False.
     """
 
     def __init__(self, selection_types: List[SelectionTypesEnum] = None,
@@ -53,7 +61,9 @@ class GPGraphOptimiserParameters:
                  genetic_scheme_type: GeneticSchemeTypesEnum = GeneticSchemeTypesEnum.generational,
                  with_auto_depth_configuration: bool = False, depth_increase_step: int = 3,
                  multi_objective: bool = False,
-                 history_folder: str = None):
+                 history_folder: str = None,
+                 evaluation_backend: Optional[EvaluationBackend] = None,
+                 compact_history: bool = False):
 
         self.selection_types = selection_types
         self.crossover_types = crossover_types
@@ -64,6 +74,8 @@ class GPGraphOptimiserParameters:
         self.depth_increase_step = depth_increase_step
         self.multi_objective = multi_objective
         self.history_folder = history_folder
+        self.evaluation_backend = evaluation_backend
+        self.compact_history = compact_history
 
     def set_default_params(self):
         """
@@ -75,6 +87,9 @@ class GPGraphOptimiserParameters:
             else:
                 self.selection_types = [SelectionTypesEnum.tournament]
 
+        if not self.evaluation_backend:
+            self.evaluation_backend = SequentialEvaluationBackend()
+
         if not self.crossover_types:
             self.crossover_types = [CrossoverTypesEnum.subtree, CrossoverTypesEnum.one_point]
 
@@ -182,7 +197,7 @@ class GPGraphOptimiser:
             self.population = self._evaluate_individuals(self.population, objective_function, timer=t)
 
             if self.archive is not None:
-                self.archive.update(self.population)
+                self.archive.update(fully_evaluated(self.population))
 
             on_next_iteration_callback(self.population, self.archive)
 
@@ -237,7 +252,7 @@ class GPGraphOptimiser:
                     self.population.append(self.prev_best)
 
                 if self.archive is not None:
-                    self.archive.update(self.population)
+                    self.archive.update(fully_evaluated(self.population))
 
                 on_next_iteration_callback(self.population, self.archive)
                 self.log.info(f'spent time: {round(t.minutes_from_start, 1)} min')
@@ -258,6 +273,7 @@ class GPGraphOptimiser:
             best = self.result_individual()
             self.log.info('Result:')
             self.log_info_about_best()
+        self.history.close_log()
 
         output = [self.graph_generation_params.adapter.restore(ind.graph)
                   for ind in tqdm(best, desc='Restoring best', unit='ind')] if isinstance(best, list) \
@@ -314,7 +330,7 @@ class GPGraphOptimiser:
             self.max_depth += 1
 
     def get_best_individual(self, individuals: List[Any], equivalents_from_current_pop=True) -> Any:
-        best_ind = min(individuals, key=lambda ind: ind.fitness)
+        best_ind = min(fully_evaluated(individuals), key=lambda ind: ind.fitness)
         if equivalents_from_current_pop:
             equivalents = self.simpler_equivalents_of_best_ind(best_ind)
         else:
@@ -385,6 +401,10 @@ class GPGraphOptimiser:
         return np.isclose(first_fitness, second_fitness, atol=atol, rtol=rtol)
 
     def default_on_next_iteration_callback(self, individuals, archive):
+        if self.parameters.compact_history:
+            archive_items = archive.items if archive is not None and self.parameters.multi_objective else None
+            self.history.add_to_log(individuals, archive_items)
+            return
         try:
             for individual in self.population:
                 individual.graph = \
@@ -411,10 +431,13 @@ class GPGraphOptimiser:
         return best
 
     def _evaluate_individuals(self, individuals_set, objective_function, timer=None):
-        evaluated_individuals = evaluate_individuals(individuals_set=individuals_set,
-                                                     objective_function=objective_function,
-                                                     graph_generation_params=self.graph_generation_params,
-                                                     timer=timer, is_multi_objective=self.parameters.multi_objective)
+        evaluate = evaluate_with_successive_halving if isinstance(objective_function, MultiFidelityObjective) \
+            else evaluate_individuals
+        evaluated_individuals = evaluate(individuals_set=individuals_set,
+                                         objective_function=objective_function,
+                                         graph_generation_params=self.graph_generation_params,
+                                         timer=timer, is_multi_objective=self.parameters.multi_objective,
+                                         evaluation_backend=self.parameters.evaluation_backend)
         individuals_set = correct_if_population_has_nans(evaluated_individuals, self.log)
         return individuals_set
 
@@ -4,14 +4,18 @@ from fedot.core.optimisers.graph import OptGraph
 from fedot.core.optimisers.opt_history import ParentOperator
 
 ERROR_PREFIX = 'Invalid graph configuration:'
+# Fidelity of the fitness obtained with the full budget (e.g. on the full training data)
+FULL_FIDELITY = 1.0
 
 
 class Individual:
     def __init__(self, graph: 'OptGraph', fitness: List[float] = None,
-                 parent_operators: List[ParentOperator] = None):
+                 parent_operators: List[ParentOperator] = None, fidelity: float = FULL_FIDELITY):
         self.parent_operators = parent_operators if parent_operators is not None else []
         self.fitness = fitness
         self.graph = graph
+        # Budget (e.g. the fraction of the training data) with which the fitness was obtained
+        self.fidelity = fidelity
 
     def __eq__(self, other):
         return self.graph == other.graph
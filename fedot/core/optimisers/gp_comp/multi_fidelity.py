@@ -0,0 +1,117 @@
+import math
+from copy import copy
+from typing import Any, Callable, List, Sequence, Tuple
+
+from fedot.core.optimisers.gp_comp.evaluation import EvaluationBackend
+from fedot.core.optimisers.gp_comp.gp_operators import evaluate_individuals
+from fedot.core.optimisers.gp_comp.individual import FULL_FIDELITY, Individual
+
+
+class MultiFidelityObjective:
+    """
+    Objective function which can be calculated with the different budgets (fidelities),
+    e.g. on the different parts of the training data. The optimiser evaluates the new individuals
+    by successive halving: all of them are evaluated with the smallest budget, and only the best
+    part of them is promoted to each next (larger) budget.
+
+    :param objectives: pairs (fidelity, objective function) in the ascending order of the fidelities,
+        the last objective function is calculated with the full budget
+    :param promotion_rate: fraction of the individuals promoted to the next budget
+    """
+
+    def __init__(self, objectives: Sequence[Tuple[float, Callable]], promotion_rate: float = 1 / 3):
+        if not objectives:
+            raise ValueError('At least one objective function must be defined')
+        if not 0 < promotion_rate <= 1:
+            raise ValueError('Promotion rate must belong to the interval (0; 1]')
+        self.objectives = sorted(objectives, key=lambda fidelity_objective: fidelity_objective[0])
+        self.promotion_rate = promotion_rate
+
+    def __call__(self, graph: Any) -> Any:
+        """ Calculates the objective with the full budget """
+        _, objective = self.objectives[-1]
+        return objective(graph)
+
+
+def evaluate_with_successive_halving(individuals_set: List[Individual], objective_function: MultiFidelityObjective,
+                                     graph_generation_params, is_multi_objective: bool, timer=None,
+                                     evaluation_backend: EvaluationBackend = None) -> List[Individual]:
+    """
+    Evaluates the individuals with the increasing budgets of the multi-fidelity objective.
+    The individuals which are not promoted keep the fitness obtained with the smaller budget
+    (and the fidelity of it), but they are not ranked better than the worst of the promoted ones
+    (by the primary objective in the multi-objective case). The individuals failed with the smaller budget
+    are promoted, since the failure may be caused by the lack of the data.
+
+    :return: evaluated individuals in the order of individuals_set
+    """
+    order = {id(ind): ind_num for ind_num, ind in enumerate(individuals_set)}
+    candidates = individuals_set
+    # Individuals which are not promoted from each of the budgets
+    rejected_by_levels: List[List[Individual]] = []
+    evaluated = []
+    for level_num, (fidelity, objective) in enumerate(objective_function.objectives):
+        is_last_level = level_num == len(objective_function.objectives) - 1
+        for ind in candidates:
+            ind.fitness = None
+        try:
+            evaluated = evaluate_individuals(individuals_set=candidates, objective_function=objective,
+                                             graph_generation_params=graph_generation_params,
+                                             is_multi_objective=is_multi_objective, timer=timer,
+                                             evaluation_backend=evaluation_backend)
+        except AttributeError:
+            if is_last_level:
+                raise
+            evaluated = []
+        for ind in evaluated:
+            ind.fidelity = fidelity
+
+        is_time_limit_reached = timer is not None and timer.is_time_limit_reached()
+        if is_last_level or (is_time_limit_reached and evaluated):
+            break
+
+        ranked = sorted(evaluated, key=lambda ind: _rank_key(ind, is_multi_objective))
+        promoted_amount = max(math.ceil(len(candidates) * objective_function.promotion_rate), 1)
+        promoted = ranked[:promoted_amount]
+        rejected_by_levels.append(ranked[promoted_amount:])
+        failed = [ind for ind in candidates if ind.fitness is None]
+        candidates = promoted + failed
+
+    _bound_rejected_fitness(evaluated, rejected_by_levels, is_multi_objective)
+    all_evaluated = evaluated + [ind for rejected in rejected_by_levels for ind in rejected]
+    if not all_evaluated:
+        raise AttributeError('Too much fitness evaluation errors. Composing stopped.')
+    return sorted(all_evaluated, key=lambda ind: order[id(ind)])
+
+
+def _rank_key(ind: Individual, is_multi_objective: bool):
+    # All the objectives are minimised, the primary one is used for the ranking in the multi-objective case
+    return ind.fitness.values[0] if is_multi_objective else ind.fitness
+
+
+def fully_evaluated(individuals: List[Any]) -> List[Any]:
+    """ Returns the individuals evaluated with the full budget, or all the individuals if there are no such ones.
+    The fitness obtained with the reduced budget is not compared with the fitness of the fully evaluated ones """
+    return [ind for ind in individuals if ind.fidelity >= FULL_FIDELITY] or individuals
+
+
+def _bound_rejected_fitness(promoted: List[Individual], rejected_by_levels: List[List[Individual]],
+                            is_multi_objective: bool):
+    """ The individuals rejected with each budget are ranked not better than the individuals promoted from it """
+    bound = max((_rank_key(ind, is_multi_objective) for ind in promoted), default=None)
+    for rejected in reversed(rejected_by_levels):
+        for ind in rejected:
+            if bound is not None and _rank_key(ind, is_multi_objective) < bound:
+                _set_rank_key(ind, bound, is_multi_objective)
+        bound = max([_rank_key(ind, is_multi_objective) for ind in rejected] +
+                    ([bound] if bound is not None else []), default=None)
+
+
+def _set_rank_key(ind: Individual, value: float, is_multi_objective: bool):
+    if is_multi_objective:
+        # the fitness object may be shared with the copies of the individual
+        fitness = copy(ind.fitness)
+        fitness.values = (value, *ind.fitness.values[1:])
+        ind.fitness = fitness
+    else:
+        ind.fitness = value
@@ -10,6 +10,7 @@ from fedot.core.optimisers.gp_comp.gp_operators import clean_operators_history,
     num_of_parents_in_crossover
 from fedot.core.optimisers.gp_comp.gp_optimiser import GPGraphOptimiser, GPGraphOptimiserParameters
 from fedot.core.optimisers.gp_comp.iterator import SequenceIterator, fibonacci_sequence
+from fedot.core.optimisers.gp_comp.multi_fidelity import fully_evaluated
 from fedot.core.optimisers.gp_comp.operators.inheritance import GeneticSchemeTypesEnum, inheritance
 from fedot.core.optimisers.gp_comp.operators.regularization import regularized_population
 from fedot.core.optimisers.gp_comp.operators.selection import selection
@@ -83,7 +84,7 @@ class GPGraphParameterFreeOptimiser(GPGraphOptimiser):
             self.population = self._evaluate_individuals(self.population, objective_function, timer=t)
 
             if self.archive is not None:
-                self.archive.update(self.population)
+                self.archive.update(fully_evaluated(self.population))
 
             on_next_iteration_callback(self.population, self.archive)
 
@@ -147,7 +148,7 @@ class GPGraphParameterFreeOptimiser(GPGraphOptimiser):
                     self.population.append(self.prev_best)
 
                 if self.archive is not None:
-                    self.archive.update(self.population)
+                    self.archive.update(fully_evaluated(self.population))
 
                 on_next_iteration_callback(self.population, self.archive)
                 self.log.info(f'spent time: {round(t.minutes_from_start, 1)} min')
@@ -164,6 +165,7 @@ class GPGraphParameterFreeOptimiser(GPGraphOptimiser):
             best = self.result_individual()
             self.log.info('Result:')
             self.log_info_about_best()
+        self.history.close_log()
 
         output = [self.graph_generation_params.adapter.restore(ind.graph)
                   for ind in tqdm(best, desc='Restoring best', unit='ind')] if isinstance(best, list) \
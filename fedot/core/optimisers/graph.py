@@ -7,7 +7,6 @@ from fedot.core.dag.graph_operator import GraphOperator
 from fedot.core.dag.node_operator import NodeOperator
 from fedot.core.log import Log, default_log
 from fedot.core.utils import DEFAULT_PARAMS_STUB
-from fedot.core.visualisation.graph_viz import GraphVisualiser
 
 
 def node_ops_adaptation(func):
@@ -62,6 +61,10 @@ class OptNode:
     def descriptive_id(self):
         return self._operator.descriptive_id()
 
+    @property
+    def descriptive_digest(self):
+        return self._operator.descriptive_digest()
+
     def ordered_subnodes_hierarchy(self, visited=None) -> List['OptNode']:
         nodes = self._operator.ordered_subnodes_hierarchy(visited)
         return [self._node_adapter.adapt(node) for node in nodes]
@@ -154,6 +157,8 @@ class OptGraph:
         self.operator.delete_subtree(self._node_adapter.restore(subroot))
 
     def show(self, path: str = None):
+        from fedot.core.visualisation.graph_viz import GraphVisualiser
+
         GraphVisualiser().visualise(self, path)
 
     def __eq__(self, other) -> bool:
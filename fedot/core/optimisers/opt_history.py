@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from typing import (Any, List, Optional)
 from uuid import uuid4
 
+from fedot.core.optimisers.opt_history_log import HISTORY_LOG_FILE, HistoryLogReader, HistoryLogWriter, \
+    individual_record
 from fedot.core.optimisers.utils.multi_objective_fitness import MultiObjFitness
 from fedot.core.optimisers.utils.population_utils import get_metric_position
 from fedot.core.pipelines.template import PipelineTemplate
@@ -39,8 +41,19 @@ class OptHistory:
         self.pipelines_comp_time_history = []
         self.archive_comp_time_history = []
         self.parent_operators = []
+        self.fitness_cache_hits = 0
+        self.fitness_cache_misses = 0
         self.save_folder = save_folder if save_folder \
             else f'composing_history_{datetime.datetime.now().timestamp()}'
+        # Writer of the append-only log used instead of the templates of the individuals (if any)
+        self._log_writer: Optional[HistoryLogWriter] = None
+        self._logged_generations = 0
+
+    def __getstate__(self):
+        # The writer of the log stays in the process which created it (e.g. the history is not copied to the workers)
+        state = self.__dict__.copy()
+        state['_log_writer'] = None
+        return state
 
     def _convert_pipeline_to_template(self, pipeline):
         pipeline_template = PipelineTemplate(pipeline)
@@ -82,37 +95,71 @@ class OptHistory:
         except Exception as ex:
             print(f'Cannot add to archive history: {ex}')
 
+    def add_to_log(self, individuals: List[Any], archive_items: Optional[List[Any]] = None):
+        """
+        Appends the records of the individuals of the next generation (and of the archive) to the history log.
+        In contrast to add_to_history, the individuals are neither copied nor converted to the templates,
+        and the records are written to the file by the background thread
+
+        :param individuals: evaluated individuals of the population
+        :param archive_items: individuals of the archive of the best individuals
+        """
+        if self._log_writer is None:
+            self._log_writer = HistoryLogWriter(self.log_path)
+        generation = self._logged_generations
+        records = [individual_record(ind, generation) for ind in individuals]
+        records.extend(individual_record(ind, generation, is_archive=True) for ind in archive_items or [])
+        self._log_writer.write(records)
+        self._logged_generations += 1
+
+    def close_log(self):
+        """ Waits for the writing of all the records to the history log """
+        if self._log_writer is not None:
+            log_writer, self._log_writer = self._log_writer, None
+            log_writer.close()
+
+    def log_reader(self) -> HistoryLogReader:
+        """ Returns the reader of the history log, the pipeline templates are created by it on demand """
+        if self._log_writer is not None:
+            self._log_writer.flush()
+        return HistoryLogReader(self.log_path)
+
+    @property
+    def log_path(self) -> str:
+        return os.path.join(self._get_save_path(), HISTORY_LOG_FILE)
+
     def write_composer_history_to_csv(self, file='history.csv'):
         history_dir = self._get_save_path()
         file = os.path.join(history_dir, file)
         if not os.path.isdir(history_dir):
             os.mkdir(history_dir)
-        self._write_header_to_csv(file)
-        idx = 0
+        with open(file, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file, quoting=csv.QUOTE_ALL)
+            writer.writerow(self._csv_header())
+            for idx, row in enumerate(self._csv_rows()):
+                writer.writerow([idx, *row])
+
+    def _csv_header(self) -> List[str]:
+        metric_str = 'metric'
+        if self.is_multi_objective:
+            metric_str += 's'
+        return ['index', 'generation', metric_str, 'quantity_of_operations', 'depth', 'computation_time', 'fidelity']
+
+    def _csv_rows(self):
+        if not self.individuals and self._logged_generations:
+            for record in self.log_reader():
+                if not record.get('archive'):
+                    yield [record['generation'], record['fitness'], len(record['nodes']), record['depth'],
+                           record['computation_time'], record['fidelity']]
+            return
         for gen_num, gen_inds in enumerate(self.individuals):
             for ind_num, ind in enumerate(gen_inds):
                 if self.is_multi_objective:
                     fitness = ind.fitness.values
                 else:
                     fitness = ind.fitness
-                row = [idx, gen_num, fitness, len(ind.graph.operation_templates), ind.graph.depth,
-                       self.pipelines_comp_time_history[gen_num][ind_num]]
-                self._add_history_to_csv(file, row)
-                idx += 1
-
-    def _write_header_to_csv(self, f):
-        with open(f, 'w', newline='') as file:
-            writer = csv.writer(file, quoting=csv.QUOTE_ALL)
-            metric_str = 'metric'
-            if self.is_multi_objective:
-                metric_str += 's'
-            row = ['index', 'generation', metric_str, 'quantity_of_operations', 'depth', 'computation_time']
-            writer.writerow(row)
-
-    def _add_history_to_csv(self, f: str, row: List[Any]):
-        with open(f, 'a', newline='') as file:
-            writer = csv.writer(file, quoting=csv.QUOTE_ALL)
-            writer.writerow(row)
+                yield [gen_num, fitness, len(ind.graph.operation_templates), ind.graph.depth,
+                       self.pipelines_comp_time_history[gen_num][ind_num], _fidelity(ind)]
 
     def save_current_results(self, path: Optional[str] = None):
         if not path:
@@ -166,6 +213,11 @@ class OptHistory:
             historical_fitness = [[pipeline.fitness for pipeline in pop] for pop in self.individuals]
         return historical_fitness
 
+    @property
+    def historical_fidelity(self):
+        """ Budgets (e.g. the fractions of the training data) with which the fitness of the individuals was obtained """
+        return [[_fidelity(ind) for ind in pop] for pop in self.individuals]
+
     @property
     def all_historical_fitness(self):
         historical_fitness = self.historical_fitness
@@ -195,6 +247,8 @@ class OptHistory:
 
     @property
     def is_multi_objective(self):
+        if not self.individuals and self._logged_generations:
+            return isinstance(next(iter(self.log_reader()))['fitness'], list)
         return type(self.individuals[0][0].fitness) is MultiObjFitness
 
     def _get_save_path(self):
@@ -206,3 +260,8 @@ class OptHistory:
             return self.save_folder
         else:
             return os.path.join(default_fedot_data_dir(), self.save_folder)
+
+
+def _fidelity(individual: Any) -> float:
+    # the individuals saved before the multi-fidelity evaluation was introduced are evaluated with the full budget
+    return getattr(individual, 'fidelity', 1.0)
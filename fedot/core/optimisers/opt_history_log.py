@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.template import PipelineTemplate
+from fedot.core.utils import DEFAULT_PARAMS_STUB
+
+# Name of the file with the records of the individuals in the history folder
+HISTORY_LOG_FILE = 'history.jsonl'
+
+
+class HistoryLogWriter:
+    """
+    Append-only log of the optimisation history with one JSON line per individual.
+    The records are written by the background thread in batches, so the optimisation
+    is not blocked by the file operations. The file is opened once for all the records.
+    The error of the writing is raised by the next call of write, flush or close.
+
+    :param path: path to the log file, the records are appended to the existing file
+    :param batch_size: maximal amount of the records written at once
+    """
+
+    def __init__(self, path: str, batch_size: int = 256):
+        self.path = path
+        self.batch_size = batch_size
+        # The file is opened in the caller, so the errors of the opening are raised immediately
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._log_file = open(path, 'a', encoding='utf-8')
+        self._records = queue.Queue()
+        self._error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def write(self, records: List[Dict[str, Any]]):
+        """ Schedules the records for writing. The records are serialized immediately,
+        so they may be changed after the call """
+        self._raise_error()
+        for record in records:
+            self._records.put(json.dumps(record, separators=(',', ':'), default=_json_default))
+
+    def flush(self):
+        """ Waits until all the scheduled records are written """
+        self._records.join()
+        self._raise_error()
+
+    def close(self):
+        """ Writes all the scheduled records and stops the background thread """
+        if self._thread.is_alive():
+            self._records.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _write_loop(self):
+        is_closed = False
+        while not is_closed:
+            lines = [self._records.get()]
+            # The batch contains all the records scheduled at the moment
+            while len(lines) < self.batch_size:
+                try:
+                    lines.append(self._records.get_nowait())
+                except queue.Empty:
+                    break
+            if None in lines:
+                is_closed = True
+                lines = [line for line in lines if line is not None]
+            try:
+                # After the error the records are dropped, so the waiting for them is not blocked
+                if lines and self._error is None:
+                    self._log_file.write('\n'.join(lines) + '\n')
+                    self._log_file.flush()
+            except Exception as ex:
+                self._error = ex
+            finally:
+                for _ in range(len(lines) + int(is_closed)):
+                    self._records.task_done()
+        try:
+            self._log_file.close()
+        except Exception as ex:
+            if self._error is None:
+                self._error = ex
+
+
+class HistoryLogReader:
+    """
+    Reader of the history log written by HistoryLogWriter. Only the records (the structure,
+    the fitness, the timing and the parent operators of the individuals) are loaded,
+    the pipeline templates are created on demand
+
+    :param path: path to the log file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        if self._records is None:
+            with open(self.path, encoding='utf-8') as log_file:
+                self._records = [json.loads(line) for line in log_file if line.strip()]
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.records)
+
+    @property
+    def generations(self) -> List[List[Dict[str, Any]]]:
+        """ Records of the individuals of the population grouped by the generations """
+        generations = []
+        for record in self.records:
+            if record.get('archive'):
+                continue
+            while len(generations) <= record['generation']:
+                generations.append([])
+            generations[record['generation']].append(record)
+        return generations
+
+    @property
+    def historical_fitness(self) -> List[list]:
+        return [[record['fitness'] for record in generation] for generation in self.generations]
+
+    @staticmethod
+    def pipeline_template(record: Dict[str, Any]) -> PipelineTemplate:
+        """ Creates the template of the (not fitted) pipeline of the individual """
+        return PipelineTemplate(pipeline_from_record(record))
+
+
+def individual_record(individual: Any, generation: int, is_archive: bool = False) -> Dict[str, Any]:
+    """
+    Returns the compact description of the individual for the history log.
+    The description is obtained from the graph directly without the restoring of the pipeline
+
+    :param individual: evaluated individual with the graph of any type (OptGraph or Pipeline)
+    :param generation: number of the generation
+    :param is_archive: is the individual from the archive of the best individuals
+    """
+    graph = individual.graph
+    nodes_ids = {id(node): node_num for node_num, node in enumerate(graph.nodes)}
+    nodes = [{'operation_type': _operation_type(node),
+              'params': node.content.get('params', DEFAULT_PARAMS_STUB),
+              'nodes_from': [nodes_ids[id(parent)] for parent in node.nodes_from or []]}
+             for node in graph.nodes]
+    root_node = graph.root_node[0] if isinstance(graph.root_node, list) else graph.root_node
+
+    fitness = individual.fitness
+    record = {'generation': generation,
+              'struct_id': root_node.descriptive_digest if root_node is not None else '',
+              'nodes': nodes,
+              'root': nodes_ids.get(id(root_node)),
+              'depth': graph.depth,
+              'fitness': list(fitness.values) if hasattr(fitness, 'values') else fitness,
+              'fidelity': getattr(individual, 'fidelity', 1.0),
+              'computation_time': getattr(individual, 'computation_time', None),
+              'parent_operators': [{'type': operator.operator_type,
+                                    'name': operator.operator_name,
+                                    'parent_ids': [_structure_digest(parent.struct_id)
+                                                   for parent in operator.parent_objects]}
+                                   for operator in individual.parent_operators]}
+    if is_archive:
+        record['archive'] = True
+    return record
+
+
+def pipeline_from_record(record: Dict[str, Any]) -> Pipeline:
+    """ Creates the pipeline (not fitted) with the structure and the parameters from the record """
+    nodes = {}
+
+    def create_node(node_num: int):
+        if node_num not in nodes:
+            description = record['nodes'][node_num]
+            if description['nodes_from']:
+                parents = [create_node(parent_num) for parent_num in description['nodes_from']]
+                node = SecondaryNode(description['operation_type'], nodes_from=parents)
+            else:
+                node = PrimaryNode(description['operation_type'])
+            if isinstance(description['params'], dict):
+                node.custom_params = description['params']
+            nodes[node_num] = node
+        return nodes[node_num]
+
+    for node_num in range(len(record['nodes'])):
+        create_node(node_num)
+    return Pipeline([nodes[node_num] for node_num in range(len(record['nodes']))])
+
+
+def _operation_type(node: Any) -> str:
+    operation = node.content['name']
+    return operation if isinstance(operation, str) else operation.operation_type
+
+
+def _structure_digest(descriptive_id: str) -> str:
+    # The same digest as the descriptive_digest of the node
+    return hashlib.blake2b(descriptive_id.encode(), digest_size=16).hexdigest()
+
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, 'tolist'):
+        # numpy scalars and arrays
+        return obj.tolist()
+    return str(obj)
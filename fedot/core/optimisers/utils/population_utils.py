@@ -1,8 +1,9 @@
-from typing import Any
+from typing import Any, Union
 
 import numpy as np
 
 from fedot.core.data.data import InputData
+from fedot.core.data.multi_modal import MultiModalData
 
 
 def is_equal_fitness(first_fitness, second_fitness, atol=1e-10, rtol=1e-10):
@@ -35,24 +36,19 @@ def get_metric_position(metrics, metric_type):
     return metric_position
 
 
-def nested_list_transform_to_tuple(data_field):
-    if isinstance(data_field, (list, np.ndarray)):
-        transformed = tuple(map(nested_list_transform_to_tuple, data_field))
-    else:
-        transformed = data_field
-    return transformed
-
-
 def input_data_characteristics(data: InputData, log):
     data_type = data.data_type
-    if data.features is not None:
-        features_hash = hash(nested_list_transform_to_tuple(data.features))
-    else:
-        features_hash = None
+    features_hash, target_hash = data.fingerprint()
+    if features_hash is None:
         log.info('Input data features is None')
-    if data.target is not None:
-        target_hash = hash(nested_list_transform_to_tuple(data.target))
-    else:
+    if target_hash is None:
         log.info('Input data target is None')
-        target_hash = None
     return data_type, features_hash, target_hash
+
+
+def data_characteristics(data: Union[InputData, MultiModalData], log) -> tuple:
+    """ Returns the characteristics of the data (for each data source in case of multi-modal data) """
+    if isinstance(data, MultiModalData):
+        return tuple((data_source_name, input_data_characteristics(data_source, log))
+                     for data_source_name, data_source in data.items())
+    return input_data_characteristics(data, log)
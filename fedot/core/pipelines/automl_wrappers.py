@@ -1,5 +1,4 @@
 import os
-import h2o
 
 
 class TPOTRegressionSerializationWrapper:
@@ -21,6 +20,8 @@ class H2OSerializationWrapper:
 
     @classmethod
     def load_operation(cls, path_global):
+        import h2o
+
         models = []
         for path in os.listdir(path_global):
             path = os.path.join(path_global, path)
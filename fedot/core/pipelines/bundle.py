@@ -0,0 +1,162 @@
+import json
+import os
+import pickle
+import struct
+import sys
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Signature of the file with the pipeline bundle (with the version of the format)
+BUNDLE_SIGNATURE = b'FEDOTPB1'
+# The header and the buffers of the arrays start at the offsets aligned to this value
+BUNDLE_ALIGNMENT = 64
+# The arrays with less amount of bytes are stored inside the pickled operations
+MIN_MAPPED_BUFFER_SIZE = 4096
+
+_HEADER_SIZE_FORMAT = '<Q'
+# The out-of-band buffers of the pickled data are supported from Python 3.8 (pickle protocol 5)
+_IS_OUT_OF_BAND_SUPPORTED = sys.version_info >= (3, 8)
+
+
+class LazyFittedOperation:
+    """
+    Fitted operation stored in the pipeline bundle, which is not loaded until the first use.
+    The node replaces it by the loaded operation on the first access to the fitted_operation.
+
+    :param path: path to the bundle file
+    :param section: description of the operation section from the header of the bundle
+    """
+    # The node checks this attribute instead of the type, so the bundle module is not imported with the node
+    is_lazy_fitted_operation = True
+
+    def __init__(self, path: str, section: Dict[str, Any]):
+        self.path = path
+        self.section = section
+
+    def load(self) -> Any:
+        """ Unpickles the operation. The large arrays of it are mapped from the bundle file
+        in the copy-on-write mode, so they are read from the disk on demand """
+        offset, size = self.section['offset'], self.section['size']
+        mapped_file = np.memmap(self.path, dtype=np.uint8, mode='c')
+        data = mapped_file[offset:offset + size].tobytes()
+        if not self.section['buffers']:
+            return pickle.loads(data)
+        if not _IS_OUT_OF_BAND_SUPPORTED:
+            raise ValueError('The pipeline bundle with the memory-mapped arrays can be loaded with Python 3.8+ only')
+        buffers = [mapped_file[buffer_offset:buffer_offset + buffer_size]
+                   for buffer_offset, buffer_size in self.section['buffers']]
+        return pickle.loads(data, buffers=buffers)
+
+
+class PipelineBundle:
+    """
+    Reader of the single-file pipeline bundle written by write_bundle. The file contains
+    the header with the JSON structure of the pipeline (as in the export to JSON) and the sections
+    with the fitted operations. Only the header is read on the creation of the reader.
+
+    :param path: path to the bundle file
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        with open(self.path, 'rb') as bundle_file:
+            signature = bundle_file.read(len(BUNDLE_SIGNATURE))
+            if signature != BUNDLE_SIGNATURE:
+                raise ValueError(f'The file is not a pipeline bundle: {self.path}')
+            header_size, = struct.unpack(_HEADER_SIZE_FORMAT, bundle_file.read(struct.calcsize(_HEADER_SIZE_FORMAT)))
+            header = json.loads(bundle_file.read(header_size).decode('utf-8'))
+        self.structure: dict = header['structure']
+        self._sections: Dict[str, Dict[str, Any]] = header['operations']
+
+    def fitted_operation(self, operation_id: int, lazy: bool = True) -> Any:
+        """
+        Returns the fitted operation of the node or None if the node is not fitted
+
+        :param operation_id: id of the operation in the structure of the pipeline
+        :param lazy: if True, the operation is loaded on the first access to it
+        """
+        section = self._sections.get(str(operation_id))
+        if section is None:
+            return None
+        operation = LazyFittedOperation(self.path, section)
+        return operation if lazy else operation.load()
+
+
+def write_bundle(path: str, structure: dict, fitted_operations: Dict[int, Any], json_encoder=None):
+    """
+    Writes the pipeline bundle. The operations are pickled with the protocol 5, the buffers
+    of the large contiguous arrays are written out of the pickled data at the aligned offsets,
+    so they can be mapped to the memory during the loading. Before Python 3.8 the operations
+    are pickled with the protocol 4 and the arrays are stored inside the pickled data
+
+    :param path: path to the bundle file
+    :param structure: JSON-like structure of the pipeline
+    :param fitted_operations: fitted operations by the ids of the operations
+    :param json_encoder: class of the JSON encoder for the structure
+    """
+    pickled_operations: List[Tuple[int, bytes, List['pickle.PickleBuffer']]] = []
+    for operation_id, operation in fitted_operations.items():
+        buffers = []
+        if _IS_OUT_OF_BAND_SUPPORTED:
+            data = pickle.dumps(operation, protocol=5,
+                                buffer_callback=lambda buffer: _buffer_to_map(buffer, buffers))
+        else:
+            data = pickle.dumps(operation, protocol=4)
+        pickled_operations.append((operation_id, data, buffers))
+
+    # The offsets depend on the size of the header, so the header is padded to the size
+    # which the offsets were calculated for (the size is increased until the header fits it)
+    header_size = 0
+    while True:
+        offset = _align(len(BUNDLE_SIGNATURE) + struct.calcsize(_HEADER_SIZE_FORMAT) + header_size)
+        sections = {}
+        for operation_id, data, buffers in pickled_operations:
+            section = {'offset': offset, 'size': len(data), 'buffers': []}
+            offset = _align(offset + len(data))
+            for buffer in buffers:
+                section['buffers'].append([offset, buffer.raw().nbytes])
+                offset = _align(offset + buffer.raw().nbytes)
+            sections[str(operation_id)] = section
+        header = json.dumps({'structure': structure, 'operations': sections}, cls=json_encoder).encode('utf-8')
+        if len(header) <= header_size:
+            header = header.ljust(header_size, b' ')
+            break
+        header_size = _align(len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'wb') as bundle_file:
+        bundle_file.write(BUNDLE_SIGNATURE)
+        bundle_file.write(struct.pack(_HEADER_SIZE_FORMAT, len(header)))
+        bundle_file.write(header)
+        for operation_id, data, buffers in pickled_operations:
+            section = sections[str(operation_id)]
+            _write_at(bundle_file, section['offset'], data)
+            for buffer, (buffer_offset, _) in zip(buffers, section['buffers']):
+                _write_at(bundle_file, buffer_offset, buffer.raw())
+
+
+def _buffer_to_map(buffer: 'pickle.PickleBuffer', buffers: List['pickle.PickleBuffer']) -> bool:
+    # Returns False for the buffers stored out of the pickled data
+    try:
+        raw_buffer = buffer.raw()
+    except BufferError:
+        # not contiguous buffer
+        return True
+    if raw_buffer.nbytes < MIN_MAPPED_BUFFER_SIZE:
+        return True
+    buffers.append(buffer)
+    return False
+
+
+def _write_at(bundle_file, offset: int, data: Any):
+    padding = offset - bundle_file.tell()
+    if padding < 0:
+        raise ValueError('Incorrect offset of the section in the pipeline bundle')
+    bundle_file.write(b'\0' * padding)
+    bundle_file.write(data)
+
+
+def _align(offset: int) -> int:
+    return (offset + BUNDLE_ALIGNMENT - 1) // BUNDLE_ALIGNMENT * BUNDLE_ALIGNMENT
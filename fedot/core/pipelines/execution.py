@@ -0,0 +1,237 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.pipelines.node import Node
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.pipeline import Pipeline
+
+
+class PipelineExecutor:
+    """
+    Class for the fit and predict processes of the pipeline nodes. The nodes are
+    processed in topological order (from primary nodes to the root), so each node
+    is executed exactly once per call and its output is passed to all the children.
+
+    :param pipeline: pipeline to execute
+    :param n_jobs: number of nodes executed simultaneously. The nodes are executed one by one if n_jobs is 1,
+        all the available cores are used if n_jobs is -1
+    :param backend: 'thread' or 'process' - the type of workers for the simultaneous execution of independent nodes
+
+    .. note::
+        execution_counts stores the number of executions of each node
+        during the last call of fit or predict
+    """
+
+    def __init__(self, pipeline: 'Pipeline', n_jobs: int = 1, backend: str = 'thread'):
+        if backend not in _POOLS_BY_BACKEND:
+            raise ValueError(f'Unknown backend {backend} for the pipeline execution. '
+                             f'Available options are: {list(_POOLS_BY_BACKEND.keys())}')
+        self.pipeline = pipeline
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else max(n_jobs, 1)
+        self.backend = backend
+        self.execution_counts: Dict[Node, int] = {}
+
+    def fit(self, input_data: Optional[InputData]) -> OutputData:
+        """
+        Run training process in all nodes of the pipeline
+
+        :param input_data: data used for operation training
+        :return: OutputData from the root node
+        """
+        return self._execute(input_data, node_operation='fit')
+
+    def predict(self, input_data: Optional[InputData], output_mode: str = 'default',
+                known_outputs: Optional[Dict[Node, OutputData]] = None) -> OutputData:
+        """
+        Run prediction process in all nodes of the pipeline
+
+        :param input_data: data used for prediction
+        :param output_mode: desired output for the root node operation (e.g. labels, probs, full_probs)
+        :param known_outputs: already obtained outputs of some nodes, these nodes are not executed
+        :return: OutputData from the root node
+        """
+        return self._execute(input_data, node_operation='predict', output_mode=output_mode,
+                             known_outputs=known_outputs)
+
+    def outputs_of_nodes(self, input_data: Optional[InputData], node_operation: str,
+                         known_outputs: Optional[Dict[Node, OutputData]] = None) -> Dict[Node, OutputData]:
+        """
+        Run the fit or predict process in the nodes of the pipeline except the nodes with known outputs
+
+        :param input_data: data used for operation training or prediction
+        :param node_operation: 'fit' or 'predict'
+        :param known_outputs: already obtained outputs of some nodes on the same data, these nodes are not executed
+        :return: dict with OutputData from all the nodes
+        """
+        self.execution_counts = {}
+        return self._execute_nodes(input_data, node_operation, 'default', known_outputs or {})
+
+    def predict_for_output_modes(self, input_data: Optional[InputData],
+                                 output_modes: Sequence[str]) -> Dict[str, OutputData]:
+        """
+        Run prediction process with several desired outputs of the root node. All the nodes
+        except the root are executed once, their outputs are reused for every output mode
+
+        :param input_data: data used for prediction
+        :param output_modes: desired outputs for the root node operation (e.g. labels, probs, full_probs)
+        :return: dict with OutputData from the root node for each of the output modes
+        """
+        root = self.pipeline.root_node
+        self.execution_counts = {}
+        first_mode, *other_modes = output_modes
+        results = self._execute_nodes(input_data, 'predict', first_mode, known_outputs={})
+        outputs = {first_mode: results.pop(root)}
+        for output_mode in other_modes:
+            outputs[output_mode] = self._execute_nodes(input_data, 'predict', output_mode,
+                                                       known_outputs=results)[root]
+        return outputs
+
+    def _execute(self, input_data: Optional[InputData], node_operation: str,
+                 output_mode: str = 'default', known_outputs: Optional[Dict[Node, OutputData]] = None) -> OutputData:
+        self.execution_counts = {}
+        results = self._execute_nodes(input_data, node_operation, output_mode, known_outputs or {})
+        return results[self.pipeline.root_node]
+
+    def _execute_nodes(self, input_data: Optional[InputData], node_operation: str, output_mode: str,
+                       known_outputs: Dict[Node, OutputData]) -> Dict[Node, OutputData]:
+        """ Execute all the nodes of the pipeline except the nodes with known outputs.
+        Returns the outputs of all the nodes """
+        root = self.pipeline.root_node
+        if root in known_outputs:
+            return dict(known_outputs)
+
+        ordered_nodes = [node for node in nodes_in_topological_order(root) if node not in known_outputs]
+        if self.n_jobs > 1 and len(ordered_nodes) > 1:
+            return self._execute_in_parallel(ordered_nodes, input_data, node_operation, output_mode,
+                                             known_outputs)
+
+        results: Dict[Node, OutputData] = dict(known_outputs)
+        for node in ordered_nodes:
+            # Desired form of the output is applied only to the final prediction
+            node_output_mode = output_mode if node is root else 'default'
+            results[node] = self._execute_node(node, input_data, node_operation,
+                                               node_output_mode, results)
+        return results
+
+    def _execute_in_parallel(self, ordered_nodes: List[Node], input_data: Optional[InputData],
+                             node_operation: str, output_mode: str,
+                             known_outputs: Dict[Node, OutputData]) -> Dict[Node, OutputData]:
+        """ Execute the node as soon as all its parents are executed. The outputs of the parents
+        are combined in the main process, the operation of the node is executed in the worker """
+        root = ordered_nodes[-1]
+        parents_to_wait = {node: set(node.nodes_from or []).difference(known_outputs) for node in ordered_nodes}
+        children = {node: [] for node in ordered_nodes}
+        for node in ordered_nodes:
+            for parent in parents_to_wait[node]:
+                children[parent].append(node)
+
+        results: Dict[Node, OutputData] = dict(known_outputs)
+        with _POOLS_BY_BACKEND[self.backend](max_workers=self.n_jobs) as pool:
+            running = {}
+
+            def _submit(node_to_run: Node):
+                node_output_mode = output_mode if node_to_run is root else 'default'
+                node_input = self._node_input(node_to_run, input_data, node_operation, results)
+                if self.backend == 'process':
+                    # Only the operation of the node is sent to the worker, not the whole subtree
+                    node_to_send = _detached_copy(node_to_run)
+                else:
+                    node_to_send = node_to_run
+                future = pool.submit(_execute_node_operation, node_to_send, node_input,
+                                     node_operation, node_output_mode)
+                running[future] = node_to_run
+
+            for node in ordered_nodes:
+                if not parents_to_wait[node]:
+                    _submit(node)
+
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = running.pop(future)
+                    output, fitted_operation, params = future.result()
+                    node.fitted_operation = fitted_operation
+                    node.content['params'] = params
+                    self.execution_counts[node] = self.execution_counts.get(node, 0) + 1
+                    results[node] = output
+
+                    for child in children[node]:
+                        parents_to_wait[child].discard(node)
+                        if not parents_to_wait[child]:
+                            _submit(child)
+        return results
+
+    @staticmethod
+    def _node_input(node: Node, input_data: Optional[InputData], node_operation: str,
+                    results: Dict[Node, OutputData]) -> InputData:
+        if node.nodes_from:
+            parent_results = {parent: results[parent] for parent in node.nodes_from}
+            return node._input_from_parents(input_data=input_data, parent_operation=node_operation,
+                                            parent_results=parent_results)
+        return node._input_from_node_data(input_data)
+
+    def _execute_node(self, node: Node, input_data: Optional[InputData], node_operation: str,
+                      output_mode: str, results: Dict[Node, OutputData]) -> OutputData:
+        self.execution_counts[node] = self.execution_counts.get(node, 0) + 1
+
+        kwargs = {}
+        if node.nodes_from:
+            kwargs['parent_results'] = {parent: results[parent] for parent in node.nodes_from}
+
+        if node_operation == 'fit':
+            return node.fit(input_data=input_data, **kwargs)
+        elif node_operation == 'predict':
+            return node.predict(input_data=input_data, output_mode=output_mode, **kwargs)
+        raise NotImplementedError()
+
+
+def nodes_in_topological_order(root: Node) -> List[Node]:
+    """
+    The function returns all the nodes of the subtree with the root node,
+    each parent is placed before all its children
+
+    :param root: root node of the subtree
+    :return: list with unique nodes
+    """
+    ordered_nodes = []
+    visited = set()
+
+    def _visit(node: Node):
+        if node in visited:
+            return
+        visited.add(node)
+        for parent in node.nodes_from or []:
+            _visit(parent)
+        ordered_nodes.append(node)
+
+    _visit(root)
+    return ordered_nodes
+
+
+def _execute_node_operation(node: Node, node_input: InputData, node_operation: str,
+                            output_mode: str) -> Tuple[OutputData, object, dict]:
+    """ Run the operation of the node on the already prepared input data """
+    if node_operation == 'fit':
+        output = Node.fit(node, input_data=node_input)
+    elif node_operation == 'predict':
+        output = Node.predict(node, input_data=node_input, output_mode=output_mode)
+    else:
+        raise NotImplementedError()
+    return output, node.fitted_operation, node.content['params']
+
+
+def _detached_copy(node: Node) -> Node:
+    """ Returns node with the same operation and fitted operation, but without parents and data """
+    detached_node = Node(nodes_from=None, operation_type=node.operation, log=node.log)
+    detached_node.content = dict(node.content)
+    detached_node.fitted_operation = node.fitted_operation
+    return detached_node
+
+
+_POOLS_BY_BACKEND = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor
+}
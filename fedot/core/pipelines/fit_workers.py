@@ -0,0 +1,223 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from copy import copy
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+import numpy as np
+
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.data.shared_arrays import is_shared
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.pipeline import Pipeline
+
+# Amount of the datasets (pairs of features and target) stored by each worker
+WORKER_DATA_CACHE_SIZE = 4
+
+
+class FitWorker:
+    """
+    Process which fits the pipelines sent by the pool. The arrays of the training data
+    are sent to the worker only once and cached there by their fingerprints.
+
+    :param context: multiprocessing context used to start the process
+    """
+
+    def __init__(self, context):
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(target=_worker_loop, args=(worker_connection,), daemon=True)
+        self.process.start()
+        worker_connection.close()
+        # Fingerprints of the arrays cached in the worker process
+        self.cached_arrays: Set[str] = set()
+        self._is_ready = False
+
+    def wait_ready(self):
+        """ Waits for the end of the worker startup (e.g. the import of the modules),
+        so the startup time is not included into the time limit of the fitting """
+        if not self._is_ready:
+            self.connection.recv()
+            self._is_ready = True
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class FitWorkersPool:
+    """
+    Pool of the persistent worker processes for the pipelines fitting with time limit.
+    The workers are started on demand and reused by the next fits, so the interpreter startup
+    and the transfer of the training data are paid once per worker instead of once per pipeline.
+    The worker which exceeds the time limit is killed and replaced by the new one.
+    Only the fitted states of the nodes are sent back from the workers.
+
+    :param max_idle_workers: maximal amount of the idle workers kept alive, default is the number of cores
+    """
+
+    def __init__(self, max_idle_workers: Optional[int] = None):
+        self.max_idle_workers = max_idle_workers or os.cpu_count()
+        self._idle_workers: List[FitWorker] = []
+        self._lock = threading.Lock()
+        # Amount of the worker processes started by the pool (including the replacements of the killed ones)
+        self.started_workers = 0
+
+    def fit(self, pipeline: 'Pipeline', input_data: Optional[InputData], time: timedelta,
+            **fit_params) -> Optional[OutputData]:
+        """
+        Fits the pipeline in the worker process and applies the fitted states to the nodes of the pipeline
+
+        :param pipeline: pipeline to fit
+        :param input_data: data used for operation training
+        :param time: time constraint for operation fitting process
+        :param fit_params: parameters of Pipeline._fit
+        :return: OutputData from the root node
+        """
+        worker = self._acquire()
+        try:
+            worker.wait_ready()
+            arrays = _detach_arrays(input_data, worker.cached_arrays)
+            worker.connection.send((pipeline, arrays.pop('input_data'), arrays, fit_params))
+            if not worker.connection.poll(time.total_seconds()):
+                worker.kill()
+                # The replacement is started in advance, so the next fit does not wait for its startup
+                self._release(self._start_worker())
+                raise TimeoutError(f'Pipeline fitness evaluation time limit is expired')
+            status, result, cached_arrays = worker.connection.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError):
+            worker.kill()
+            raise RuntimeError('Worker process for the pipeline fitting is terminated unexpectedly')
+
+        worker.cached_arrays = set(cached_arrays)
+        self._release(worker)
+        if status == 'error':
+            raise result
+
+        pipeline.fitted_on_data = result['fitted_on_data']
+        pipeline.computation_time = result['computation_time']
+        pipeline.execution_counts = dict(zip(pipeline.nodes, result['execution_counts']))
+        for node, fitted_operation in zip(pipeline.nodes, result['fitted_operations']):
+            node.fitted_operation = fitted_operation
+        return result['train_predicted']
+
+    def shutdown(self):
+        with self._lock:
+            workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            worker.stop()
+
+    def _acquire(self) -> FitWorker:
+        with self._lock:
+            while self._idle_workers:
+                worker = self._idle_workers.pop()
+                if worker.is_alive:
+                    return worker
+                worker.kill()
+        return self._start_worker()
+
+    def _start_worker(self) -> FitWorker:
+        with self._lock:
+            self.started_workers += 1
+        return FitWorker(multiprocessing.get_context())
+
+    def _release(self, worker: FitWorker):
+        with self._lock:
+            if len(self._idle_workers) < self.max_idle_workers:
+                self._idle_workers.append(worker)
+                return
+        worker.stop()
+
+
+_pool: Optional[FitWorkersPool] = None
+_pool_lock = threading.Lock()
+
+
+def fit_workers_pool() -> FitWorkersPool:
+    """ Returns the pool of the fit workers shared by all the pipelines of the process """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = FitWorkersPool()
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def _detach_arrays(input_data: Optional[InputData], cached_arrays: Set[str]) -> Dict[str, Any]:
+    """ Replaces the features and target of the data by their fingerprints.
+    Only the arrays which are not cached by the worker are sent along with the data """
+    if input_data is None:
+        return {'input_data': None}
+    features_digest, target_digest = input_data.fingerprint()
+    arrays = {}
+    detached_data = copy(input_data)
+    for name, digest in (('features', features_digest), ('target', target_digest)):
+        array = getattr(input_data, name)
+        # The shared arrays are sent as the references to the memory-mapped files anyway
+        if isinstance(array, np.ndarray) and not is_shared(array):
+            setattr(detached_data, name, digest)
+            if digest not in cached_arrays:
+                arrays[digest] = array
+    detached_data.reset_fingerprint()
+    arrays['input_data'] = detached_data
+    return arrays
+
+
+def _worker_loop(connection):
+    import fedot.core.pipelines.pipeline  # noqa: F401
+    connection.send('ready')
+
+    # Arrays of the training data by their fingerprints, the least recently used ones are removed first
+    arrays_cache = OrderedDict()
+    while True:
+        try:
+            task = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if task is None:
+            break
+
+        pipeline, input_data, arrays, fit_params = task
+        arrays_cache.update(arrays)
+        try:
+            if input_data is not None:
+                for name in ('features', 'target'):
+                    digest = getattr(input_data, name)
+                    if isinstance(digest, str) and digest in arrays_cache:
+                        arrays_cache.move_to_end(digest)
+                        setattr(input_data, name, arrays_cache[digest])
+            while len(arrays_cache) > WORKER_DATA_CACHE_SIZE:
+                arrays_cache.popitem(last=False)
+
+            train_predicted = pipeline._fit(input_data, **fit_params)
+            result = ('ok', {'train_predicted': train_predicted,
+                             'computation_time': pipeline.computation_time,
+                             'fitted_on_data': pipeline.fitted_on_data,
+                             'execution_counts': [pipeline.execution_counts.get(node, 0)
+                                                  for node in pipeline.nodes],
+                             'fitted_operations': [node.fitted_operation for node in pipeline.nodes]})
+        except Exception as ex:
+            result = ('error', ex)
+        try:
+            connection.send((*result, list(arrays_cache.keys())))
+        except Exception as ex:
+            # e.g. the exception raised during the fitting can not be pickled
+            connection.send(('error', RuntimeError(f'Pipeline fitting result can not be sent: {ex}'),
+                             list(arrays_cache.keys())))
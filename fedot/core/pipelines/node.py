@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from fedot.core.dag.graph_node import GraphNode
 from fedot.core.data.data import InputData, OutputData
@@ -135,6 +135,9 @@ class Node(GraphNode):
     @property
     def fitted_operation(self):
         if hasattr(self, '_fitted_operation'):
+            if getattr(self._fitted_operation, 'is_lazy_fitted_operation', False) is True:
+                # the operation from the pipeline bundle is loaded on the first use
+                self._fitted_operation = self._fitted_operation.load()
             return self._fitted_operation
         else:
             return None
@@ -236,10 +239,7 @@ class PrimaryNode(Node):
         """
         self.log.ext_debug(f'Trying to fit primary node with operation: {self.operation}')
 
-        if self.direct_set:
-            input_data = self.node_data
-        else:
-            self.node_data = input_data
+        input_data = self._input_from_node_data(input_data)
         return super().fit(input_data)
 
     def unfit(self):
@@ -257,12 +257,16 @@ class PrimaryNode(Node):
         """
         self.log.ext_debug(f'Predict in primary node by operation: {self.operation}')
 
-        if self.direct_set:
-            input_data = self.node_data
-        else:
-            self.node_data = input_data
+        input_data = self._input_from_node_data(input_data)
         return super().predict(input_data, output_mode)
 
+    def _input_from_node_data(self, input_data: InputData) -> InputData:
+        """ Returns the data passed to the node directly or stores the pipeline input data """
+        if self.direct_set:
+            return self.node_data
+        self.node_data = input_data
+        return input_data
+
     def get_data_from_node(self):
         """ Method returns data if the data was set to the nodes directly """
         return self.node_data
@@ -298,43 +302,54 @@ class SecondaryNode(Node):
             nodes_from = []
         super().__init__(nodes_from=nodes_from, operation_type=operation_type, **kwargs)
 
-    def fit(self, input_data: InputData, **kwargs) -> OutputData:
+    def fit(self, input_data: InputData,
+            parent_results: Optional[Dict[Node, OutputData]] = None, **kwargs) -> OutputData:
         """
         Fit the operation located in the secondary node
 
         :param input_data: data used for operation training
+        :param parent_results: already obtained outputs of the parent nodes. If passed,
+            the parent nodes are not fitted again
         """
         self.log.ext_debug(f'Trying to fit secondary node with operation: {self.operation}')
 
-        secondary_input = self._input_from_parents(input_data=input_data, parent_operation='fit')
+        secondary_input = self._input_from_parents(input_data=input_data, parent_operation='fit',
+                                                   parent_results=parent_results)
 
         return super().fit(input_data=secondary_input)
 
-    def predict(self, input_data: InputData, output_mode: str = 'default') -> OutputData:
+    def predict(self, input_data: InputData, output_mode: str = 'default',
+                parent_results: Optional[Dict[Node, OutputData]] = None) -> OutputData:
         """
         Predict using the operation located in the secondary node
 
         :param input_data: data used for prediction
         :param output_mode: desired output for operations (e.g. labels, probs, full_probs)
+        :param parent_results: already obtained outputs of the parent nodes. If passed,
+            the parent nodes are not used for prediction again
         """
         self.log.ext_debug(f'Obtain prediction in secondary node with operation: {self.operation}')
 
         secondary_input = self._input_from_parents(input_data=input_data,
-                                                   parent_operation='predict')
+                                                   parent_operation='predict',
+                                                   parent_results=parent_results)
 
         return super().predict(input_data=secondary_input, output_mode=output_mode)
 
     def _input_from_parents(self, input_data: InputData,
-                            parent_operation: str) -> InputData:
+                            parent_operation: str,
+                            parent_results: Optional[Dict[Node, OutputData]] = None) -> InputData:
         if len(self.nodes_from) == 0:
             raise ValueError('No parent nodes found')
 
-        self.log.ext_debug(f'Fit all parent nodes in secondary node with operation: {self.operation}')
-
         parent_nodes = self._nodes_from_with_fixed_order()
 
-        parent_results, target = _combine_parents(parent_nodes, input_data,
-                                                  parent_operation)
+        if parent_results is None:
+            self.log.ext_debug(f'Fit all parent nodes in secondary node with operation: {self.operation}')
+            parent_results, _ = _combine_parents(parent_nodes, input_data,
+                                                 parent_operation)
+        else:
+            parent_results = [parent_results[parent] for parent in parent_nodes]
 
         secondary_input = InputData.from_predictions(outputs=parent_results)
         # Update info about visited nodes
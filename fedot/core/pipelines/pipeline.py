@@ -1,29 +1,26 @@
 from copy import copy
 from datetime import timedelta
-from multiprocessing import Manager, Process
-from typing import Callable, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import pandas as pd
 import numpy as np
 
 from fedot.core.composer.cache import OperationsCache
 from fedot.core.dag.graph import Graph
-from fedot.core.data.data import InputData, data_has_categorical_features, data_has_missing_values
+from fedot.core.data.data import InputData, OutputData, data_has_categorical_features, data_has_missing_values, \
+    table_schema
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.log import Log, default_log
 from fedot.core.operations.evaluation.operation_implementations.data_operations.sklearn_transformations import \
     DataOperationImplementation, ImputationImplementation, OneHotEncodingImplementation
 from fedot.core.optimisers.timer import Timer
-from fedot.core.optimisers.utils.population_utils import input_data_characteristics
+from fedot.core.optimisers.utils.population_utils import data_characteristics, input_data_characteristics
+from fedot.core.pipelines.execution import PipelineExecutor
+from fedot.core.pipelines.fit_workers import fit_workers_pool
 from fedot.core.pipelines.node import Node, PrimaryNode
 from fedot.core.pipelines.template import PipelineTemplate
 from fedot.core.pipelines.tuning.unified import PipelineTuner
 from fedot.core.data.data import data_type_is_table
 
-# The allowed empirical partition limit of the number of rows to delete.
-# Rows that have 'string' type, instead of other 'integer' observes.
-# Example: 90% objects in column are 'integer', other are 'string'. Then
-# we will try to convert 'string' data to 'integer', otherwise delete it.
-EMPIRICAL_PARTITION = 0.1
 ERROR_PREFIX = 'Invalid pipeline configuration:'
 
 
@@ -38,6 +35,7 @@ class Pipeline(Graph):
     .. note::
         fitted_on_data stores the data which were used in last pipeline fitting (equals None if pipeline hasn't been
         fitted yet)
+        execution_counts stores the number of executions of each node during the last fit or predict call
     """
 
     def __init__(self, nodes: Optional[Union[Node, List[Node]]] = None,
@@ -47,6 +45,7 @@ class Pipeline(Graph):
         self.template = None
         self.fitted_on_data = {}
         self.pre_proc_encoders = {}
+        self.execution_counts = {}
 
         self.log = log
         if not log:
@@ -87,45 +86,32 @@ class Pipeline(Graph):
         return fitted_status
 
     def _fit_with_time_limit(self, input_data: Optional[InputData] = None, use_fitted_operations=False,
-                             time: timedelta = timedelta(minutes=3)) -> Manager:
+                             time: timedelta = timedelta(minutes=3), n_jobs: int = 1,
+                             backend: str = 'thread') -> Optional[OutputData]:
         """
-        Run training process with time limit. Create
+        Run training process with time limit in the persistent worker process.
+        The fitted operations are returned from the worker to the nodes of the pipeline
 
         :param input_data: data used for operation training
         :param use_fitted_operations: flag defining whether use saved information about previous executions or not,
         default True
         :param time: time constraint for operation fitting process (seconds)
+        :param n_jobs: number of independent nodes fitted simultaneously
+        :param backend: type of workers for the simultaneous fitting of nodes ('thread' or 'process')
         """
-        time = int(time.total_seconds())
-        manager = Manager()
-        process_state_dict = manager.dict()
-        fitted_operations = manager.list()
-        p = Process(target=self._fit,
-                    args=(input_data, use_fitted_operations, process_state_dict, fitted_operations),
-                    kwargs={})
-        p.start()
-        p.join(time)
-        if p.is_alive():
-            p.terminate()
-            raise TimeoutError(f'Pipeline fitness evaluation time limit is expired')
-
-        self.fitted_on_data = process_state_dict['fitted_on_data']
-        self.computation_time = process_state_dict['computation_time']
-        for node_num, node in enumerate(self.nodes):
-            self.nodes[node_num].fitted_operation = fitted_operations[node_num]
-        return process_state_dict['train_predicted']
-
-    def _fit(self, input_data: InputData, use_fitted_operations=False, process_state_dict: Manager = None,
-             fitted_operations: Manager = None):
+        return fit_workers_pool().fit(self, input_data, time,
+                                      use_fitted_operations=use_fitted_operations,
+                                      n_jobs=n_jobs, backend=backend)
+
+    def _fit(self, input_data: InputData, use_fitted_operations=False, n_jobs: int = 1, backend: str = 'thread'):
         """
         Run training process in all nodes in pipeline starting with root.
 
         :param input_data: data used for operation training
         :param use_fitted_operations: flag defining whether use saved information about previous executions or not,
         default True
-        :param process_state_dict: this dictionary is used for saving required pipeline parameters (which were changed
-        inside the process) in a case of operation fit time control (when process created)
-        :param fitted_operations: this list is used for saving fitted operations of pipeline nodes
+        :param n_jobs: number of independent nodes fitted simultaneously
+        :param backend: type of workers for the simultaneous fitting of nodes ('thread' or 'process')
         """
 
         # InputData was set directly to the primary nodes
@@ -144,21 +130,15 @@ class Pipeline(Graph):
             computation_time_update = not use_fitted_operations or not self.root_node.fitted_operation or \
                                       self.computation_time is None
 
-            train_predicted = self.root_node.fit(input_data=input_data)
+            executor = PipelineExecutor(self, n_jobs=n_jobs, backend=backend)
+            train_predicted = executor.fit(input_data=input_data)
+            self.execution_counts = executor.execution_counts
             if computation_time_update:
                 self.computation_time = round(t.minutes_from_start, 3)
-
-        if process_state_dict is None:
-            return train_predicted
-        else:
-            process_state_dict['train_predicted'] = train_predicted
-            process_state_dict['computation_time'] = self.computation_time
-            process_state_dict['fitted_on_data'] = self.fitted_on_data
-            for node in self.nodes:
-                fitted_operations.append(node.fitted_operation)
+        return train_predicted
 
     def fit(self, input_data: Union[InputData, MultiModalData], use_fitted=True,
-            time_constraint: Optional[timedelta] = None):
+            time_constraint: Optional[timedelta] = None, n_jobs: int = 1, backend: str = 'thread'):
         """
         Run training process in all nodes in pipeline starting with root.
 
@@ -166,6 +146,9 @@ class Pipeline(Graph):
         :param use_fitted: flag defining whether use saved information about previous executions or not,
             default True
         :param time_constraint: time constraint for operation fitting (seconds)
+        :param n_jobs: number of independent nodes (e.g. branches of the pipeline) fitted simultaneously,
+            -1 means using all the available cores
+        :param backend: type of workers for the simultaneous fitting of nodes: 'thread' or 'process'
         """
         if not use_fitted:
             self.unfit()
@@ -177,13 +160,37 @@ class Pipeline(Graph):
 
         if time_constraint is None:
             train_predicted = self._fit(input_data=copied_input_data,
-                                        use_fitted_operations=use_fitted)
+                                        use_fitted_operations=use_fitted,
+                                        n_jobs=n_jobs, backend=backend)
         else:
             train_predicted = self._fit_with_time_limit(input_data=copied_input_data,
                                                         use_fitted_operations=use_fitted,
-                                                        time=time_constraint)
+                                                        time=time_constraint,
+                                                        n_jobs=n_jobs, backend=backend)
         return train_predicted
 
+    def fit_nodes(self, input_data: Union[InputData, MultiModalData],
+                  known_outputs: Optional[Dict[Node, OutputData]] = None) -> Dict[Node, OutputData]:
+        """
+        Run training process in the nodes of the pipeline except the nodes with known outputs.
+        The nodes with known outputs must be already fitted on the same data.
+
+        :param input_data: data used for operation training
+        :param known_outputs: outputs of the fitted nodes obtained on the same data
+        :return: dict with OutputData from all the nodes
+        """
+        copied_input_data = self._preprocessing_fit_data(copy(input_data))
+        copied_input_data = self._assign_data_to_nodes(copied_input_data)
+        if copied_input_data is not None:
+            self.update_fitted_on_data(copied_input_data)
+
+        with Timer(log=self.log) as t:
+            executor = PipelineExecutor(self)
+            outputs = executor.outputs_of_nodes(copied_input_data, 'fit', known_outputs)
+            self.execution_counts = executor.execution_counts
+            self.computation_time = round(t.minutes_from_start, 3)
+        return outputs
+
     def _preprocessing_fit_data(self, data: Union[InputData, MultiModalData]):
         has_imputation_operation, has_encoder_operation = pipeline_encoders_validation(self)
 
@@ -207,15 +214,28 @@ class Pipeline(Graph):
         for node in self.nodes:
             node.unfit()
 
-    def fit_from_cache(self, cache: OperationsCache):
+    def fit_from_cache(self, cache: OperationsCache, input_data: Union[InputData, MultiModalData] = None):
+        """
+        Restore fitted operations of the nodes from the cache
+
+        :param cache: cache with fitted operations
+        :param input_data: data used for operation training. If passed, only the operations
+            fitted on the same data are restored
+        """
+        data_fingerprint = None if input_data is None else data_characteristics(input_data, self.log)
         for node in self.nodes:
-            cached_state = cache.get(node)
+            cached_state = cache.get(node, data_fingerprint)
             if cached_state:
                 node.fitted_operation = cached_state.operation
             else:
                 node.fitted_operation = None
 
-    def predict(self, input_data: Union[InputData, MultiModalData], output_mode: str = 'default'):
+        if isinstance(input_data, InputData) and any(node.fitted_operation for node in self.nodes):
+            # Restored operations can be used during the fitting on the same data
+            self.fitted_on_data = dict(zip(('data_type', 'features_hash', 'target_hash'), data_fingerprint))
+
+    def predict(self, input_data: Union[InputData, MultiModalData], output_mode: str = 'default',
+                n_jobs: int = 1, backend: str = 'thread'):
         """
         Run the predict process in all nodes in pipeline starting with root.
 
@@ -225,9 +245,82 @@ class Pipeline(Graph):
                 'labels' (numbers of classes - for classification) ,
                 'probs' (probabilities - for classification =='default'),
                 'full_probs' (return all probabilities - for binary classification).
+        :param n_jobs: number of independent nodes used for prediction simultaneously,
+            -1 means using all the available cores
+        :param backend: type of workers for the simultaneous prediction of nodes: 'thread' or 'process'
         :return: OutputData with prediction
         """
 
+        copied_input_data = self._prepare_data_for_prediction(input_data)
+
+        executor = PipelineExecutor(self, n_jobs=n_jobs, backend=backend)
+        result = executor.predict(input_data=copied_input_data, output_mode=output_mode)
+        self.execution_counts = executor.execution_counts
+        return result
+
+    def predict_nodes(self, input_data: Union[InputData, MultiModalData],
+                      known_outputs: Optional[Dict[Node, OutputData]] = None) -> Dict[Node, OutputData]:
+        """
+        Run the predict process in the nodes of the pipeline except the nodes with known outputs
+
+        :param input_data: data for prediction
+        :param known_outputs: outputs of the nodes obtained on the same data
+        :return: dict with OutputData from all the nodes
+        """
+        copied_input_data = self._prepare_data_for_prediction(input_data)
+
+        executor = PipelineExecutor(self)
+        outputs = executor.outputs_of_nodes(copied_input_data, 'predict', known_outputs)
+        self.execution_counts = executor.execution_counts
+        return outputs
+
+    def predict_iter(self, input_data: Union[InputData, MultiModalData], chunk_size: int = 10000,
+                     output_mode: str = 'default') -> Iterator[OutputData]:
+        """
+        Run the predict process for the blocks of rows of the table one by one, so the memory used
+        by the outputs of the nodes is bounded by the size of the block. The preprocessing of the data
+        (e.g. the encoding of the categorical features) is applied to the whole table once, so the
+        concatenation of the obtained predictions is equal to the result of the predict method
+        (up to the rounding of the matrix products, which may differ for the different numbers of rows).
+        The data types other than table are predicted in one block.
+
+        :param input_data: data for prediction
+        :param chunk_size: number of rows in each block
+        :param output_mode: desired form of output for operations (see output_mode in predict method)
+        :return: iterator of OutputData with prediction for each block of rows
+        """
+        if chunk_size < 1:
+            raise ValueError(f'Chunk size must be positive, got {chunk_size}')
+        copied_input_data = self._prepare_data_for_prediction(input_data)
+
+        executor = PipelineExecutor(self)
+        if copied_input_data is None or not data_type_is_table(copied_input_data):
+            chunks = [copied_input_data]
+        else:
+            chunks = (_data_rows(copied_input_data, start, start + chunk_size)
+                      for start in range(0, len(copied_input_data.idx), chunk_size))
+        for chunk in chunks:
+            yield executor.predict(input_data=chunk, output_mode=output_mode)
+            self.execution_counts = executor.execution_counts
+
+    def predict_for_output_modes(self, input_data: Union[InputData, MultiModalData],
+                                 output_modes: Sequence[str]) -> Dict[str, OutputData]:
+        """
+        Run the predict process once and obtain the outputs of the root node in several forms.
+        Only the root node is executed again for every additional output mode.
+
+        :param input_data: data for prediction
+        :param output_modes: desired forms of output (see output_mode in predict method)
+        :return: dict with OutputData with prediction for each of the output modes
+        """
+        copied_input_data = self._prepare_data_for_prediction(input_data)
+
+        executor = PipelineExecutor(self)
+        results = executor.predict_for_output_modes(input_data=copied_input_data, output_modes=output_modes)
+        self.execution_counts = executor.execution_counts
+        return results
+
+    def _prepare_data_for_prediction(self, input_data: Union[InputData, MultiModalData]):
         if not self.is_fitted:
             ex = 'Pipeline is not fitted yet'
             self.log.error(ex)
@@ -245,20 +338,20 @@ class Pipeline(Graph):
         if data_has_categorical_features(copied_input_data) and not has_encoder_operation:
             _encode_data_for_prediction(copied_input_data, self.pre_proc_encoders)
 
-        copied_input_data = self._assign_data_to_nodes(copied_input_data)
-
-        result = self.root_node.predict(input_data=copied_input_data, output_mode=output_mode)
-        return result
+        return self._assign_data_to_nodes(copied_input_data)
 
     def fine_tune_all_nodes(self, loss_function: Callable,
                             loss_params: dict = None,
                             input_data: Union[InputData, MultiModalData] = None,
                             iterations=50, timeout: int = 5,
                             cv_folds: int = None,
-                            validation_blocks: int = 3) -> 'Pipeline':
+                            validation_blocks: int = 3,
+                            n_jobs: int = 1) -> 'Pipeline':
         """ Tune all hyperparameters of nodes simultaneously via black-box
             optimization using PipelineTuner. For details, see
         :meth:`~fedot.core.pipelines.tuning.unified.PipelineTuner.tune_pipeline`
+
+        :param n_jobs: number of trials evaluated simultaneously, -1 means using all the available cores
         """
         # Make copy of the input data to avoid performing inplace operations
         copied_input_data = copy(input_data)
@@ -267,7 +360,8 @@ class Pipeline(Graph):
         pipeline_tuner = PipelineTuner(pipeline=self,
                                        task=copied_input_data.task,
                                        iterations=iterations,
-                                       timeout=timeout)
+                                       timeout=timeout,
+                                       n_jobs=n_jobs)
         self.log.info('Start pipeline tuning')
 
         tuned_pipeline = pipeline_tuner.tune_pipeline(input_data=copied_input_data,
@@ -301,6 +395,27 @@ class Pipeline(Graph):
         self.template = PipelineTemplate(self, self.log)
         self.template.import_pipeline(source, dict_fitted_operations)
 
+    def save_bundle(self, path: str):
+        """
+        Save the pipeline to the single file with the json representation and the fitted operations.
+        The large arrays of the fitted operations are memory-mapped during the loading of the bundle.
+
+        :param path: path to the bundle file
+        """
+        self.template = PipelineTemplate(self, self.log)
+        self.template.export_bundle(path, root_node=self.root_node)
+
+    def load_bundle(self, path: str, lazy: bool = True):
+        """
+        Load the pipeline from the bundle saved by save_bundle.
+
+        :param path: path to the bundle file
+        :param lazy: if True, each fitted operation is loaded on the first use of it
+        """
+        self.nodes = []
+        self.template = PipelineTemplate(self, self.log)
+        self.template.import_bundle(path, lazy)
+
     def __eq__(self, other) -> bool:
         return self.root_node.descriptive_id == other.root_node.descriptive_id
 
@@ -316,11 +431,10 @@ class Pipeline(Graph):
     def root_node(self) -> Optional[Node]:
         if len(self.nodes) == 0:
             return None
-        root = [node for node in self.nodes
-                if not any(self.operator.node_children(node))]
-        if len(root) > 1:
+        root = self.operator.root_node()
+        if isinstance(root, list):
             raise ValueError(f'{ERROR_PREFIX} More than 1 root_nodes in pipeline')
-        return root[0]
+        return root
 
     def _assign_data_to_nodes(self, input_data) -> Optional[InputData]:
         if isinstance(input_data, MultiModalData):
@@ -379,33 +493,13 @@ def pipeline_encoders_validation(pipeline: Pipeline) -> (bool, bool):
     return has_imputer, has_encoder
 
 
-def _is_numeric(s) -> bool:
-    """ Check if variable converted to float.
-
-    :param s: any type variable
-    :return: is variable convertable to float
-    """
-    try:
-        float(s)
-        return True
-    except ValueError:
-        return False
-
-
-def is_np_array_has_nan(array):
-    for x in array:
-        if x is np.nan:
-            return True
-    return False
-
-
-def _try_convert_to_numeric(values):
-    try:
-        values = pd.to_numeric(values)
-        values = values.astype(np.number)
-    except ValueError:
-        pass
-    return values
+def _data_rows(data: InputData, start: int, end: int) -> InputData:
+    """ Returns the rows of the data from start to end (exclusive) as the views of the arrays """
+    supplementary_data = copy(data.supplementary_data)
+    supplementary_data.table_schema = None
+    return InputData(idx=data.idx[start:end], features=data.features[start:end],
+                     target=data.target[start:end] if data.target is not None else None,
+                     task=data.task, data_type=data.data_type, supplementary_data=supplementary_data)
 
 
 def _custom_preprocessing(data: Union[InputData, MultiModalData]):
@@ -421,37 +515,35 @@ def _custom_preprocessing(data: Union[InputData, MultiModalData]):
 
 
 def _preprocessing_input_data(data: InputData) -> InputData:
-    features = data.features
-    target = data.target
-
-    # delete rows with equal target None
-    if target is not None and len(target.shape) != 0 and is_np_array_has_nan(target):
-        target_index_with_nan = np.hstack(np.argwhere(np.isnan(target)))
-        data.features = np.delete(features, target_index_with_nan, 0)
-        data.target = np.delete(data.target, target_index_with_nan, 0)
-        data.idx = np.delete(data.idx, target_index_with_nan, 0)
-
-    source_shape = features.shape
-    columns_amount = source_shape[1] if len(source_shape) > 1 else 1
-
-    for i in range(columns_amount):
-        values = pd.Series(features[:, i])
-        # check for each column, if values converted to numeric. remember index of rows that not converted
-        if any(list(map(lambda x: isinstance(x, str), values))):
-            not_numeric = list(map(lambda x: not _is_numeric(x), values))
-            rows_to_nan = list(values.index[not_numeric])
-            partition_not_numeric = len(rows_to_nan) / source_shape[0]
-
-            # if partition of numerical rows less then EMPIRICAL_PARTITION,
-            # then convert to numerical and others to Nan
-            if partition_not_numeric < EMPIRICAL_PARTITION:
-                values[rows_to_nan] = np.nan
-                data.features[:, i] = _try_convert_to_numeric(values)
-            # if EMPIRICAL_PARTITION < partition < 1, then some data in column are
-            # integer and some data are string, can not handle this case
-            elif partition_not_numeric < 0.9:
-                raise ValueError("The data in the column has a different type. Need to preprocessing data manually.")
-
+    """ Converts the columns with a few non-numeric values to numeric (these values are replaced with nan)
+    and removes the rows with missing target. The types of the columns are inferred once for the table
+    and reused by the next fits and predictions on the same data """
+    schema = table_schema(data)
+    if schema.mixed_columns:
+        # if NUMERIC_PARTITION_THRESHOLD < partition < CATEGORICAL_PARTITION_THRESHOLD, then some data
+        # in column are numeric and some data are string, can not handle this case
+        raise ValueError("The data in the column has a different type. Need to preprocessing data manually.")
+
+    if schema.converted_columns:
+        if data.features.dtype != object:
+            data.features = data.features.astype(object)
+        for column_id in schema.converted_columns:
+            data.features[:, column_id] = pd.to_numeric(data.features[:, column_id], errors='coerce')
+        data.reset_fingerprint()
+        # The table is converted inplace, so the source data shares the schema of the converted table
+        schema = schema.for_converted_table()
+        data.supplementary_data.table_schema = schema
+
+    removed_rows = schema.target_missing_rows
+    if len(removed_rows) > 0:
+        # delete rows with equal target None
+        removed_features = data.features[removed_rows]
+        data.features = np.delete(data.features, removed_rows, 0)
+        data.target = np.delete(data.target, removed_rows, 0)
+        data.idx = np.delete(data.idx, removed_rows, 0)
+        data.supplementary_data = copy(data.supplementary_data)
+        data.supplementary_data.table_schema = schema.for_table_without_rows(data.features, data.target,
+                                                                             removed_features)
     return data
 
 
@@ -2,7 +2,7 @@ import json
 import os
 from collections import Counter
 from datetime import datetime
-from typing import List, Optional, Tuple, Union, Callable
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union, Callable
 from uuid import uuid4
 import joblib
 import numpy as np
@@ -13,6 +13,9 @@ from fedot.core.operations.operation_template import OperationTemplate
 from fedot.core.pipelines.node import Node, PrimaryNode, SecondaryNode
 from fedot.core.repository.operation_types_repository import atomized_model_type
 
+if TYPE_CHECKING:
+    from fedot.core.pipelines.bundle import PipelineBundle
+
 
 class NumpyIntEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -136,6 +139,30 @@ class PipelineTemplate:
 
         return json_data, dict_fitted_operations
 
+    def export_bundle(self, path: str, root_node: Node = None):
+        """
+        Save the pipeline to the single file with the JSON structure and the fitted operations.
+        The large arrays of the operations are stored so that they can be mapped to the memory
+        during the import.
+        :param path: path to the bundle file
+        :param root_node: root node of exported pipeline
+        """
+        # The bundle module is imported on demand, so it is not required for the import of the pipelines
+        from fedot.core.pipelines.bundle import write_bundle
+
+        fitted_operations = {}
+        for operation_template in self.operation_templates:
+            if isinstance(operation_template, AtomizedModelTemplate) or 'h2o' in operation_template.operation_type:
+                message = f'Saving {operation_template.operation_type} operations to the bundle is not supported'
+                self.log.error(message)
+                raise TypeError(message)
+            if operation_template.fitted_operation:
+                fitted_operations[operation_template.operation_id] = operation_template.fitted_operation
+                operation_template.fitted_operation_path = None
+
+        write_bundle(path, self.convert_to_dict(root_node), fitted_operations, json_encoder=NumpyIntEncoder)
+        self.log.message(f'The pipeline saved in the bundle: {os.path.abspath(path)}.')
+
     def convert_to_dict(self, root_node: Node = None) -> dict:
         json_nodes = list(map(lambda op_template: op_template.convert_to_dict(), self.operation_templates))
         for node in json_nodes:
@@ -201,6 +228,22 @@ class PipelineTemplate:
         self.convert_to_pipeline(self.link_to_empty_pipeline, path, dict_fitted_operations)
         self.depth = self.link_to_empty_pipeline.depth
 
+    def import_bundle(self, path: str, lazy: bool = True):
+        """
+        Load the pipeline from the bundle saved by export_bundle.
+        :param path: path to the bundle file
+        :param lazy: if True, each fitted operation is loaded on the first use of it
+        """
+        from fedot.core.pipelines.bundle import PipelineBundle
+
+        self._check_path_correct(path)
+        bundle = PipelineBundle(path)
+
+        self._extract_operations(bundle.structure, path)
+        self.convert_to_pipeline(self.link_to_empty_pipeline, fitted_operations_bundle=bundle, lazy=lazy)
+        self.depth = self.link_to_empty_pipeline.depth
+        self.log.message(f'The pipeline was imported from the bundle: {path}.')
+
     def _check_path_correct(self, path: str):
         absolute_path = os.path.abspath(path)
         name_of_file = os.path.basename(absolute_path)
@@ -227,19 +270,22 @@ class PipelineTemplate:
             self.operation_templates.append(operation_template)
             self.total_pipeline_operations[operation_template.operation_type] += 1
 
-    def convert_to_pipeline(self, pipeline, path: str = None, dict_fitted_operations: dict = None):
+    def convert_to_pipeline(self, pipeline, path: str = None, dict_fitted_operations: dict = None,
+                            fitted_operations_bundle: 'PipelineBundle' = None, lazy: bool = True):
         if path is not None:
             path = os.path.abspath(os.path.dirname(path))
         visited_nodes = {}
         root_template = [op_template for op_template in self.operation_templates if op_template.operation_id == 0][0]
 
-        root_node = self.roll_pipeline_structure(root_template, visited_nodes, path, dict_fitted_operations)
+        root_node = self.roll_pipeline_structure(root_template, visited_nodes, path, dict_fitted_operations,
+                                                 fitted_operations_bundle, lazy)
         pipeline.nodes.clear()
         pipeline.add_node(root_node)
 
     def roll_pipeline_structure(self, operation_object: ['OperationTemplate',
                                                          'AtomizedModelTemplate'],
-                                visited_nodes: dict, path: str = None, dict_fitted_operations: dict = None):
+                                visited_nodes: dict, path: str = None, dict_fitted_operations: dict = None,
+                                fitted_operations_bundle: 'PipelineBundle' = None, lazy: bool = True):
         """
         The function recursively traverses all disjoint operations
         and connects the operations in a pipeline.
@@ -247,6 +293,9 @@ class PipelineTemplate:
         :params operation_object: operationTemplate or AtomizedOperationTemplate
         :params visited_nodes: array to remember which node was visited
         :params path: path to save
+        :params dict_fitted_operations: dictionary of the fitted operations
+        :params fitted_operations_bundle: bundle with the fitted operations
+        :params lazy: if True, the fitted operations from the bundle are loaded on the first use
         :return: root_node
         """
         fitted_operation = None
@@ -286,6 +335,8 @@ class PipelineTemplate:
                 raise TypeError(message)
             else:
                 fitted_operation = joblib.load(dict_fitted_operations[f'operation_{operation_object.operation_id}'])
+        elif fitted_operations_bundle is not None:
+            fitted_operation = fitted_operations_bundle.fitted_operation(operation_object.operation_id, lazy)
 
         operation_object.fitted_operation = fitted_operation
         node.fitted_operation = fitted_operation
@@ -293,8 +344,9 @@ class PipelineTemplate:
         nodes_from = [operation_template for operation_template in self.operation_templates
                       if operation_template.operation_id in operation_object.nodes_from]
 
-        node.nodes_from = [self.roll_pipeline_structure(node_from, visited_nodes, path, dict_fitted_operations) for
-                           node_from in nodes_from]
+        node.nodes_from = [self.roll_pipeline_structure(node_from, visited_nodes, path, dict_fitted_operations,
+                                                        fitted_operations_bundle, lazy)
+                           for node_from in nodes_from]
 
         visited_nodes[operation_object.operation_id] = node
         return node
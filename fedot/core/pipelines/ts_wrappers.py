@@ -1,11 +1,13 @@
 from copy import copy
-from typing import Union
+from typing import List, Union
 
 import numpy as np
 
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.multi_modal import MultiModalData
-from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import ts_to_table
+from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
+    _sliding_window_view, ts_to_table
+from fedot.core.pipelines.execution import PipelineExecutor
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import TaskTypesEnum
 
@@ -29,24 +31,32 @@ def out_of_sample_ts_forecast(pipeline, input_data: InputData,
     exception_if_not_ts_task(task)
 
     if isinstance(input_data, InputData):
-        pre_history_ts = np.array(input_data.features)
+        source_ts = np.array(input_data.features)
+        source_len = len(source_ts)
 
         # How many elements to the future pipeline can produce
         scope_len = task.task_params.forecast_length
         number_of_iterations = _calculate_number_of_steps(scope_len, horizon)
 
+        # The history is extended by the predictions in place, so it is not copied at each step
+        history_buffer = np.empty(source_len + number_of_iterations * scope_len,
+                                  dtype=np.result_type(source_ts.dtype, float))
+        history_buffer[:source_len] = source_ts
+        history_len = source_len
+
         # Make forecast iteratively moving throw the horizon
         final_forecast = []
         for _ in range(0, number_of_iterations):
-            iter_predict = pipeline.root_node.predict(input_data=input_data)
+            iter_predict = PipelineExecutor(pipeline).predict(input_data=input_data)
             iter_predict = np.ravel(np.array(iter_predict.predict))
             final_forecast.append(iter_predict)
 
             # Add prediction to the historical data - update it
-            pre_history_ts = np.hstack((pre_history_ts, iter_predict))
+            history_buffer[history_len: history_len + len(iter_predict)] = iter_predict
+            history_len += len(iter_predict)
 
             # Prepare InputData for next iteration
-            input_data = _update_input(pre_history_ts, scope_len, task)
+            input_data = _update_input(history_buffer[:history_len], scope_len, task)
     elif isinstance(input_data, MultiModalData):
         data = MultiModalData()
         for data_id in input_data.keys():
@@ -111,6 +121,12 @@ def in_sample_ts_forecast(pipeline, input_data: Union[InputData, MultiModalData]
                                          number_of_iterations,
                                          scope_len)
 
+        if _is_batch_forecast_available(pipeline, time_series, source_len):
+            # Last known elements of the time series for every forecasting step
+            history_ends = [last_index_pre_history] + intervals[:-1]
+            final_forecast = _in_sample_batch_forecast(pipeline, time_series, history_ends, task)
+            return np.ravel(final_forecast)[:horizon]
+
         data = _update_input(pre_history_ts, scope_len, task)
     else:
         # TODO simplify
@@ -228,6 +244,48 @@ def in_sample_fitted_values(train_predicted: OutputData) -> OutputData:
     return copied_data
 
 
+def _is_batch_forecast_available(pipeline, time_series: np.array, history_len: int) -> bool:
+    """ The forecasts for all the steps can be obtained in one call if the time series
+    goes only through the lagged transformations and the rest of the pipeline processes the rows
+    of the lagged table independently """
+    if not pipeline.is_fitted or np.isnan(np.asarray(time_series, dtype=float)).any():
+        return False
+    for node in pipeline.nodes:
+        if node.nodes_from:
+            if node.operation.metadata.input_types != [DataTypesEnum.table]:
+                return False
+        elif node.operation.operation_type != 'lagged' or node.fitted_operation.window_size > history_len:
+            return False
+    return True
+
+
+def _in_sample_batch_forecast(pipeline, time_series: np.array, history_ends: List[int], task) -> np.array:
+    """ Method makes forecasts for all the steps of in-sample forecasting in one call of the pipeline.
+    The lagged tables for all the steps are built from the actual values of the time series at once
+
+    :param pipeline: fitted pipeline with lagged transformations as primary nodes
+    :param time_series: actual values of the time series
+    :param history_ends: index of the last known element of time series for every step
+    :param task: time series forecasting task
+    :return: forecasts for all the steps as rows
+    """
+    time_series = np.asarray(time_series, dtype=float)
+    history_ends = np.array(history_ends)
+    steps_idx = np.arange(len(history_ends))
+
+    lagged_outputs = {}
+    for node in pipeline.nodes:
+        if not node.nodes_from:
+            window_size = node.fitted_operation.window_size
+            # Window of the time series preceding the forecast for every step
+            lagged_table = _sliding_window_view(time_series, window_size)[history_ends - window_size + 1]
+            lagged_outputs[node] = OutputData(idx=steps_idx, features=lagged_table, predict=lagged_table,
+                                              task=task, target=None, data_type=DataTypesEnum.table)
+
+    steps_predict = PipelineExecutor(pipeline).predict(input_data=None, known_outputs=lagged_outputs)
+    return np.array(steps_predict.predict)
+
+
 def _calculate_number_of_steps(scope_len, horizon):
     """ Method return amount of iterations which must be done for multistep
     time series forecasting
@@ -0,0 +1,76 @@
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from fedot.core.data.data import InputData, OutputData
+from fedot.core.pipelines.execution import nodes_in_topological_order
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.pipeline import Pipeline
+
+
+class FrozenNodesCache:
+    """
+    Cache of the fitted operations and the outputs of the nodes which are not changed during the tuning
+    of the particular node, i.e. all the nodes except the tuned node and its descendants.
+    The frozen nodes are fitted once for each fold of the data, so each next trial fits only
+    the tuned node and its descendants.
+
+    The nodes are identified by their indices in the pipeline, so the cache is applicable
+    to the copies of the tuned pipeline (e.g. for the simultaneous evaluation of the folds).
+    The folds are identified by the fingerprints of the data.
+
+    :param pipeline: tuned pipeline
+    :param node_id: index of the tuned node in the pipeline
+    """
+
+    def __init__(self, pipeline: 'Pipeline', node_id: int):
+        tuned_node = pipeline.nodes[node_id]
+        self.frozen_ids: List[int] = [index for index, node in enumerate(pipeline.nodes)
+                                      if tuned_node not in nodes_in_topological_order(node)]
+        # Fitted operations of the frozen nodes by the fingerprint of the train data
+        self._fitted_operations: Dict[Any, Dict[int, Any]] = {}
+        # Outputs of the frozen nodes on the train data by the fingerprint of the train data
+        self._train_outputs: Dict[Any, Dict[int, OutputData]] = {}
+        # Outputs of the frozen nodes on the test data by the fingerprints of the train and test data
+        self._test_outputs: Dict[Any, Dict[int, OutputData]] = {}
+        self._lock = threading.Lock()
+
+    def fit(self, pipeline: 'Pipeline', train_data: InputData):
+        """ Fits the pipeline from scratch reusing the frozen nodes fitted on the same data """
+        key = train_data.fingerprint()
+        with self._lock:
+            fitted_operations = self._fitted_operations.get(key)
+            train_outputs = self._train_outputs.get(key)
+
+        if fitted_operations is None:
+            pipeline.unfit()
+            outputs = pipeline.fit_nodes(train_data)
+            with self._lock:
+                self._fitted_operations[key] = {index: pipeline.nodes[index].fitted_operation
+                                                for index in self.frozen_ids}
+                self._train_outputs[key] = {index: outputs[pipeline.nodes[index]] for index in self.frozen_ids}
+            return
+
+        for index, node in enumerate(pipeline.nodes):
+            node.fitted_operation = fitted_operations.get(index)
+        pipeline.fit_nodes(train_data, self._known_outputs(pipeline, train_outputs))
+
+    def predict(self, pipeline: 'Pipeline', test_data: InputData) -> OutputData:
+        """ Predicts with the pipeline fitted by the fit method reusing the outputs of the frozen nodes """
+        key = (pipeline.fitted_on_data.get('features_hash'), pipeline.fitted_on_data.get('target_hash'),
+               test_data.fingerprint())
+        with self._lock:
+            test_outputs = self._test_outputs.get(key)
+
+        outputs = pipeline.predict_nodes(test_data, self._known_outputs(pipeline, test_outputs))
+        if test_outputs is None:
+            with self._lock:
+                self._test_outputs[key] = {index: outputs[pipeline.nodes[index]] for index in self.frozen_ids}
+        return outputs[pipeline.root_node]
+
+    @staticmethod
+    def _known_outputs(pipeline: 'Pipeline',
+                       outputs_by_index: Optional[Dict[int, OutputData]]) -> Dict[Any, OutputData]:
+        if not outputs_by_index:
+            return {}
+        return {pipeline.nodes[index]: output for index, output in outputs_by_index.items()}
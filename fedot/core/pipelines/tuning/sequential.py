@@ -4,6 +4,7 @@ from typing import Callable, ClassVar
 from hyperopt import fmin, space_eval, tpe
 
 from fedot.core.log import Log
+from fedot.core.pipelines.tuning.frozen_nodes import FrozenNodesCache
 from fedot.core.pipelines.tuning.search_space import convert_params, SearchSpace
 from fedot.core.pipelines.tuning.tuner_interface import HyperoptTuner, _greater_is_better
 
@@ -17,8 +18,9 @@ class SequentialTuner(HyperoptTuner):
                  timeout: timedelta = timedelta(minutes=5),
                  inverse_node_order=False, log: Log = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = tpe.suggest):
-        super().__init__(pipeline, task, iterations, timeout, log, search_space, algo)
+                 algo: Callable = tpe.suggest,
+                 cv_n_jobs: int = 1):
+        super().__init__(pipeline, task, iterations, timeout, log, search_space, algo, cv_n_jobs)
         self.inverse_node_order = inverse_node_order
 
     def tune_pipeline(self, input_data, loss_function, loss_params=None,
@@ -141,16 +143,21 @@ class SequentialTuner(HyperoptTuner):
 
         :return : updated pipeline with tuned parameters in particular node
         """
-        best_parameters = fmin(partial(self._objective,
-                                       pipeline=self.pipeline,
-                                       node_id=node_id,
-                                       data=data,
-                                       loss_function=loss_function,
-                                       loss_params=loss_params),
-                               node_params,
-                               algo=self.algo,
-                               max_evals=iterations_per_node,
-                               timeout=seconds_per_node)
+        # The nodes which are not changed by the trials are fitted once for each fold
+        self._nodes_cache = FrozenNodesCache(self.pipeline, node_id)
+        try:
+            best_parameters = fmin(partial(self._objective,
+                                           pipeline=self.pipeline,
+                                           node_id=node_id,
+                                           data=data,
+                                           loss_function=loss_function,
+                                           loss_params=loss_params),
+                                   node_params,
+                                   algo=self.algo,
+                                   max_evals=iterations_per_node,
+                                   timeout=seconds_per_node)
+        finally:
+            self._nodes_cache = None
 
         best_parameters = space_eval(space=node_params,
                                      hp_assignment=best_parameters)
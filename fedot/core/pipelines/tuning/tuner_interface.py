@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, ClassVar
+from typing import Callable, ClassVar, Optional
 from copy import deepcopy
 from datetime import timedelta
 
@@ -11,6 +11,7 @@ from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.validation.tune.time_series import cv_time_series_predictions
 from fedot.core.validation.tune.tabular import cv_tabular_predictions
 from fedot.core.validation.tune.simple import fit_predict_one_fold
+from fedot.core.pipelines.tuning.frozen_nodes import FrozenNodesCache
 from fedot.core.pipelines.tuning.search_space import SearchSpace
 
 MAX_METRIC_VALUE = 10e6
@@ -25,13 +26,16 @@ class HyperoptTuner(ABC):
     :attribute iterations: max number of iterations
     :attribute search_space: SearchSpace instance
     :attribute algo: algorithm for hyperparameters optimization with signature similar to hyperopt.tse.suggest
+    :attribute cv_n_jobs: number of cross validation folds evaluated simultaneously,
+        -1 means using all the available cores
     """
 
     def __init__(self, pipeline, task, iterations=100,
                  timeout: timedelta = timedelta(minutes=5),
                  log: Log = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = None):
+                 algo: Callable = None,
+                 cv_n_jobs: int = 1):
         self.pipeline = pipeline
         self.task = task
         self.iterations = iterations
@@ -43,6 +47,9 @@ class HyperoptTuner(ABC):
         self.validation_blocks = None
         self.search_space = search_space
         self.algo = algo
+        self.cv_n_jobs = cv_n_jobs
+        # Cache of the nodes which are not changed during the evaluation of the trials (if any)
+        self._nodes_cache = None
 
         if not log:
             self.log = default_log(__name__)
@@ -81,7 +88,7 @@ class HyperoptTuner(ABC):
 
         try:
             if self.cv_folds is None:
-                preds, test_target = self._one_fold_validation(data, pipeline)
+                preds, test_target = self._one_fold_validation(data, pipeline, self._nodes_cache)
             else:
                 preds, test_target = self._cross_validation(data, pipeline)
 
@@ -165,14 +172,14 @@ class HyperoptTuner(ABC):
                 return self.init_pipeline
 
     @staticmethod
-    def _one_fold_validation(data, pipeline):
+    def _one_fold_validation(data, pipeline, nodes_cache: Optional[FrozenNodesCache] = None):
         """ Perform simple (hold-out) validation """
 
         if data.task.task_type == TaskTypesEnum.classification:
-            test_target, preds = fit_predict_one_fold(data, pipeline)
+            test_target, preds = fit_predict_one_fold(data, pipeline, nodes_cache)
         else:
             # For regression and time series forecasting
-            test_target, preds = fit_predict_one_fold(data, pipeline)
+            test_target, preds = fit_predict_one_fold(data, pipeline, nodes_cache)
             # Convert predictions into one dimensional array
             preds = np.ravel(np.array(preds))
             test_target = np.ravel(test_target)
@@ -185,7 +192,9 @@ class HyperoptTuner(ABC):
         if data.data_type is DataTypesEnum.table or data.data_type is DataTypesEnum.text or \
                 data.data_type is DataTypesEnum.image:
             preds, test_target = cv_tabular_predictions(pipeline, data,
-                                                        cv_folds=self.cv_folds)
+                                                        cv_folds=self.cv_folds,
+                                                        n_jobs=self.cv_n_jobs,
+                                                        nodes_cache=self._nodes_cache)
 
         elif data.data_type is DataTypesEnum.ts:
             if self.validation_blocks is None:
@@ -194,7 +203,9 @@ class HyperoptTuner(ABC):
 
             preds, test_target = cv_time_series_predictions(pipeline, data, log=self.log,
                                                             cv_folds=self.cv_folds,
-                                                            validation_blocks=self.validation_blocks)
+                                                            validation_blocks=self.validation_blocks,
+                                                            n_jobs=self.cv_n_jobs,
+                                                            nodes_cache=self._nodes_cache)
         return test_target, preds
 
     @property
@@ -1,9 +1,19 @@
+import os
+import queue
+import time
 from datetime import timedelta
 from functools import partial
-from typing import Callable, ClassVar
-from hyperopt import fmin, tpe, space_eval
+from multiprocessing import Pool
+from typing import Callable, ClassVar, Optional
+
+import numpy as np
+from hyperopt import STATUS_OK, Trials, base, fmin, tpe, space_eval
+from hyperopt.base import Domain
+from hyperopt.exceptions import AllTrialsFailed
+from hyperopt.utils import coarse_utcnow
 
 from fedot.core.log import Log
+from fedot.core.optimisers.gp_comp.evaluation import _call_worker_function, _set_worker_function
 from fedot.core.pipelines.tuning.search_space import convert_params, SearchSpace
 from fedot.core.pipelines.tuning.tuner_interface import HyperoptTuner, _greater_is_better
 
@@ -11,14 +21,22 @@ from fedot.core.pipelines.tuning.tuner_interface import HyperoptTuner, _greater_
 class PipelineTuner(HyperoptTuner):
     """
     Class for hyperparameters optimization for all nodes simultaneously
+
+    :attribute n_jobs: number of trials evaluated simultaneously in the pool of worker processes,
+        -1 means using all the available cores. If n_jobs is more than 1, the candidate parameters are
+        requested from the search algorithm as soon as the worker is free, and each worker evaluates them
+        on its own copy of the pipeline. The objective (including the loss function) must be picklable
     """
 
     def __init__(self, pipeline, task, iterations=100,
                  timeout: timedelta = timedelta(minutes=5),
                  log: Log = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = tpe.suggest):
-        super().__init__(pipeline, task, iterations, timeout, log, search_space, algo)
+                 algo: Callable = tpe.suggest,
+                 cv_n_jobs: int = 1,
+                 n_jobs: int = 1):
+        super().__init__(pipeline, task, iterations, timeout, log, search_space, algo, cv_n_jobs)
+        self.n_jobs = os.cpu_count() if n_jobs == -1 else max(n_jobs, 1)
 
     def tune_pipeline(self, input_data, loss_function, loss_params=None,
                       cv_folds: int = None, validation_blocks: int = None):
@@ -38,17 +56,21 @@ class PipelineTuner(HyperoptTuner):
         # Check source metrics for data
         self.init_check(input_data, loss_function, loss_params)
 
-        best = fmin(partial(self._objective,
+        objective = partial(self._objective,
                             pipeline=self.pipeline,
                             data=input_data,
                             loss_function=loss_function,
-                            loss_params=loss_params),
-                    parameters_dict,
-                    algo=self.algo,
-                    max_evals=self.iterations,
-                    timeout=self.max_seconds)
-
-        best = space_eval(space=parameters_dict, hp_assignment=best)
+                            loss_params=loss_params)
+        if self.n_jobs > 1 and self.iterations > 1:
+            best = self._parallel_fmin(objective, parameters_dict)
+        else:
+            best = fmin(objective,
+                        parameters_dict,
+                        algo=self.algo,
+                        max_evals=self.iterations,
+                        timeout=self.max_seconds)
+
+        best = space_eval(space=parameters_dict, hp_assignment=best) if best is not None else {}
 
         tuned_pipeline = self.set_arg_pipeline(pipeline=self.pipeline,
                                                parameters=best)
@@ -61,6 +83,97 @@ class PipelineTuner(HyperoptTuner):
 
         return final_pipeline
 
+    def _parallel_fmin(self, objective: Callable, parameters_dict: dict) -> Optional[dict]:
+        """
+        Minimizes the objective evaluating the trials in the pool of worker processes.
+        The results are passed to the search algorithm as soon as they are obtained,
+        so the next candidates are chosen with the knowledge of all the finished trials.
+        New trials are not started after the timeout, and the running ones are abandoned
+        if at least one trial is finished
+
+        :param objective: function to minimize
+        :param parameters_dict: search space
+
+        :return: best point of the search space in the format of hyperopt.fmin or None if all the trials failed
+        """
+        trials = Trials()
+        domain = Domain(objective, parameters_dict)
+        random_state = np.random.default_rng()
+        finished_trials = queue.Queue()
+        processes = min(self.n_jobs, self.iterations)
+        start_time = time.perf_counter()
+
+        # The objective (with the pipeline and the data) is sent once per worker
+        pool = Pool(processes=processes, initializer=_set_worker_function, initargs=(objective,))
+        try:
+            queued_trials = 0
+            running_trials = 0
+            while True:
+                # As hyperopt.fmin, at least one trial is started regardless of the timeout
+                is_timeout = queued_trials > 0 and time.perf_counter() - start_time >= self.max_seconds
+                while running_trials < processes and queued_trials < self.iterations and not is_timeout:
+                    trial = self._suggest_trial(domain, trials, random_state)
+                    if trial is None:
+                        # The search space is exhausted
+                        break
+                    parameters = space_eval(parameters_dict, base.spec_from_misc(trial['misc']))
+                    pool.apply_async(_call_worker_function, ((trial['tid'], parameters),),
+                                     callback=finished_trials.put,
+                                     error_callback=partial(_put_failed_trial, finished_trials, trial['tid']))
+                    queued_trials += 1
+                    running_trials += 1
+                if running_trials == 0:
+                    break
+
+                wait_seconds = self.max_seconds - (time.perf_counter() - start_time)
+                try:
+                    if trials.count_by_state_unsynced(base.JOB_STATE_DONE) == 0:
+                        # As hyperopt.fmin, at least one trial is finished regardless of the timeout
+                        tid, loss = finished_trials.get()
+                    else:
+                        tid, loss = finished_trials.get(timeout=max(wait_seconds, 0))
+                except queue.Empty:
+                    break
+                running_trials -= 1
+                self._record_trial_result(trials, tid, loss)
+        finally:
+            pool.terminate()
+            pool.join()
+
+        self.log.info(f'Hyperparameters optimization evaluated '
+                      f'{trials.count_by_state_unsynced(base.JOB_STATE_DONE)} trials in {processes} processes')
+        try:
+            return trials.argmin
+        except AllTrialsFailed:
+            return None
+
+    def _suggest_trial(self, domain: Domain, trials: Trials, random_state: np.random.Generator) -> Optional[dict]:
+        """ Asks the search algorithm for the next candidate and marks it as running """
+        new_ids = trials.new_trial_ids(1)
+        trials.refresh()
+        new_trials = self.algo(new_ids, domain, trials, random_state.integers(2 ** 31 - 1))
+        if not new_trials:
+            return None
+        trials.insert_trial_docs(new_trials[:1])
+        trials.refresh()
+        trial = trials.trials[-1]
+        trial['state'] = base.JOB_STATE_RUNNING
+        trial['book_time'] = trial['refresh_time'] = coarse_utcnow()
+        return trial
+
+    @staticmethod
+    def _record_trial_result(trials: Trials, tid: int, loss):
+        """ Passes the result of the finished trial to the trials history used by the search algorithm """
+        trial = next(trial for trial in trials.trials if trial['tid'] == tid)
+        if isinstance(loss, Exception):
+            trial['state'] = base.JOB_STATE_ERROR
+            trial['misc']['error'] = (str(type(loss)), str(loss))
+        else:
+            trial['state'] = base.JOB_STATE_DONE
+            trial['result'] = {'loss': loss, 'status': STATUS_OK}
+        trial['refresh_time'] = coarse_utcnow()
+        trials.refresh()
+
     @staticmethod
     def set_arg_pipeline(pipeline, parameters):
         """ Method for parameters setting to a pipeline
@@ -126,3 +239,7 @@ class PipelineTuner(HyperoptTuner):
                                              loss_function=loss_function,
                                              loss_params=loss_params)
         return metric_value
+
+
+def _put_failed_trial(finished_trials: queue.Queue, tid: int, exception: Exception):
+    finished_trials.put((tid, exception))
@@ -1,11 +1,10 @@
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 from fedot.core.dag.graph import Graph
-from fedot.core.dag.graph_node import GraphNode
 from fedot.core.repository.tasks import TaskTypesEnum
 from fedot.core.dag.validation_rules import DEFAULT_DAG_RULES, has_no_cycle, has_no_isolated_nodes, \
     has_no_self_cycled_nodes, has_one_root
-from fedot.core.optimisers.adapters import DirectAdapter
+from fedot.core.optimisers.adapters import BaseOptimizationAdapter, PipelineAdapter
 from fedot.core.optimisers.graph import OptGraph
 from fedot.core.pipelines.validation_rules import has_correct_data_connections, has_correct_data_sources, \
     has_correct_operation_positions, has_final_operation_as_model, has_no_conflicts_in_decompose, \
@@ -29,30 +28,61 @@ ts_rules = [is_pipeline_contains_ts_operations,
             has_no_data_flow_conflicts_in_ts_pipeline]
 
 
-def validate(graph: Graph, rules: List[Callable] = None, task=None):
+class ValidationContext:
+    """
+    The state shared by all the rules during the validation of the graph.
+    The structural rules (DAG rules) check the graph as it is, the other rules
+    get the graph restored by the adapter. The restoration is performed once
+    and only if at least one of the rules requires it
+
+    :param graph: graph to validate
+    :param adapter: adapter used to restore the graph if it is an OptGraph
+    """
+
+    def __init__(self, graph: Graph, adapter: Optional[BaseOptimizationAdapter] = None):
+        self.graph = graph
+        self.adapter = adapter
+        self.restorations_count = 0
+        self._restored_graph = None
+
+    @property
+    def restored_graph(self) -> Graph:
+        """ The graph restored from the optimisation representation """
+        if self._restored_graph is None:
+            if isinstance(self.graph, OptGraph):
+                adapter = self.adapter or PipelineAdapter()
+                self._restored_graph = adapter.restore(self.graph)
+                self.restorations_count += 1
+            else:
+                self._restored_graph = self.graph
+        return self._restored_graph
+
+    def graph_for_rule(self, rule_func: Callable) -> Graph:
+        """ Returns the graph in the representation required by the rule """
+        if rule_func in DEFAULT_DAG_RULES:
+            return self.graph
+        return self.restored_graph
+
+
+def validate(graph: Graph, rules: List[Callable] = None, task=None,
+             adapter: Optional[BaseOptimizationAdapter] = None):
     """ The graph is checked for compliance with the requirements
 
     :param graph: graph object
     :param rules: rules to check
     :param task: task which such a graph is solving
+    :param adapter: adapter used to restore the graph for the rules, if the graph is an OptGraph
     """
     if not rules:
         rules = common_rules
 
-    # Check common rules
-    for rule_func in rules:
-        _rule_check(graph, rule_func)
-
+    rules_to_check = list(rules)
     # Perform time series specific rules
     if task and task.task_type is TaskTypesEnum.ts_forecasting:
-        for rule_func in ts_rules:
-            _rule_check(graph, rule_func)
-    return True
-
+        rules_to_check.extend(ts_rules)
 
-def _rule_check(graph, rule_func):
-    """ Perform graph check by rule """
-    if rule_func in DEFAULT_DAG_RULES and isinstance(graph, OptGraph):
-        graph = DirectAdapter(base_graph_class=Graph,
-                              base_node_class=GraphNode).restore(graph)
-    rule_func(graph)
+    context = ValidationContext(graph, adapter)
+    # Each rule is checked once even if it is passed both in rules and in ts_rules
+    for rule_func in dict.fromkeys(rules_to_check):
+        rule_func(context.graph_for_rule(rule_func))
+    return True
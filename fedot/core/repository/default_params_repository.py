@@ -1,8 +1,12 @@
 import os
 import json
+from copy import deepcopy
 
 
 class DefaultOperationParamsRepository:
+    # The repositories are read from the disk once per process
+    __initialized_repositories__ = {}
+
     def __init__(self, repository_name: str = 'default_operation_params.json'):
         repo_folder_path = str(os.path.dirname(__file__))
         file = os.path.join('data', repository_name)
@@ -16,13 +20,16 @@ class DefaultOperationParamsRepository:
         self._repo_path = None
 
     def _initialise_repo(self) -> dict:
-        with open(self._repo_path) as repository_json_file:
-            repository_json = json.load(repository_json_file)
+        initialized_repositories = DefaultOperationParamsRepository.__initialized_repositories__
+        if self._repo_path not in initialized_repositories:
+            with open(self._repo_path) as repository_json_file:
+                initialized_repositories[self._repo_path] = json.load(repository_json_file)
 
-        return repository_json
+        return initialized_repositories[self._repo_path]
 
     def get_default_params_for_operation(self, model_name: str) -> dict:
         model_name = model_name.split('/')[0]
         if model_name in self._repo:
-            return self._repo[model_name]
+            # The params are changed in the nodes, so the shared repository is not exposed
+            return deepcopy(self._repo[model_name])
         return {}
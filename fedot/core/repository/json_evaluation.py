@@ -1,3 +1,4 @@
+from importlib import import_module
 from typing import Union
 
 # imports are required for the eval
@@ -31,7 +32,23 @@ def eval_field_str(field_value) -> Union[List[DataTypesEnum],
 
 
 def eval_strategy_str(field_value):
-    # TODO add docstring
-    namespace = field_value[0]
-    exec(f'from {namespace} import {field_value[1]}')
-    return eval(field_value[1])
+    """ Function imports the strategy class described in the repository json
+
+    :param field_value: list with the module path and the name of the class
+
+    :return : class of the strategy
+    """
+    namespace, class_name = field_value
+    return import_object(f'{namespace}.{class_name}')
+
+
+def import_object(path: str):
+    """ Function imports the object (e.g. class of the operation) by its full path.
+    It allows to postpone the import of heavy modules until the object is used
+
+    :param path: full path of the object, e.g. 'sklearn.linear_model.Ridge'
+
+    :return : imported object
+    """
+    module_name, object_name = path.rsplit('.', 1)
+    return getattr(import_module(module_name), object_name)
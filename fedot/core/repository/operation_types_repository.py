@@ -3,7 +3,7 @@ import os
 import warnings
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.json_evaluation import eval_field_str, eval_strategy_str, read_field
@@ -30,8 +30,53 @@ class OperationMetaInfo:
         """
 
         if isinstance(self.supported_strategies, dict):
-            return self.supported_strategies.get(task, None)
-        return self.supported_strategies
+            strategy = self.supported_strategies.get(task, None)
+        else:
+            strategy = self.supported_strategies
+        if isinstance(strategy, list):
+            # The strategies are imported on the first use
+            # to avoid loading of all the ML backends with the repository
+            strategy = eval_strategy_str(strategy)
+        return strategy
+
+
+class OperationsIndex:
+    """
+    Indexes of the operations from the repository by id, task type and tag.
+    The positions of the operations in the repository are stored,
+    so the results of the search preserve the order of the repository
+
+    :param operations: list with the operations from the repository
+    """
+
+    def __init__(self, operations: List[OperationMetaInfo]):
+        self.operations = operations
+        self.positions_by_id: Dict[str, List[int]] = defaultdict(list)
+        self.positions_by_task: Dict[TaskTypesEnum, List[int]] = defaultdict(list)
+        self.positions_by_tag: Dict[str, Set[int]] = defaultdict(set)
+        for position, operation in enumerate(operations):
+            self.positions_by_id[operation.id].append(position)
+            for task_type in set(operation.task_type):
+                self.positions_by_task[task_type].append(position)
+            for tag in operation.tags or []:
+                self.positions_by_tag[tag].add(position)
+
+    def positions_for_task(self, task_type: Optional[TaskTypesEnum]) -> List[int]:
+        if task_type is None:
+            return list(range(len(self.operations)))
+        if not isinstance(task_type, TaskTypesEnum):
+            # Only the task types are in the index, nothing is found for the other objects (e.g. Task)
+            return []
+        return self.positions_by_task.get(task_type, [])
+
+    def positions_with_tags(self, tags: List[str], is_full_match: bool) -> Set[int]:
+        """ Returns positions of the operations with all (is_full_match) or any of the tags """
+        tags_positions = [self.positions_by_tag.get(tag, set()) for tag in tags]
+        if not tags_positions:
+            return set(range(len(self.operations))) if is_full_match else set()
+        if is_full_match:
+            return set.intersection(*tags_positions)
+        return set.union(*tags_positions)
 
 
 def run_once(function):
@@ -49,6 +94,7 @@ class OperationTypesRepository:
     its descriptions and metadata"""
 
     __initialized_repositories__ = {}
+    __repositories_indexes__ = {}
 
     __repository_dict__ = {
         'model': {'file': 'model_repository.json', 'initialized_repo': None},
@@ -63,6 +109,7 @@ class OperationTypesRepository:
 
         self.repository_name = OperationTypesRepository.__repository_dict__[operation_type]['file']
         self._repo = OperationTypesRepository.__repository_dict__[operation_type]['initialized_repo']
+        self._index = OperationTypesRepository.__repositories_indexes__.get(self.repository_name)
 
     @classmethod
     def get_available_repositories(cls):
@@ -97,6 +144,7 @@ class OperationTypesRepository:
         repo_path = create_repository_path(repo_file)
         if repo_file not in cls.__initialized_repositories__.keys():
             cls.__initialized_repositories__[repo_file] = cls._initialise_repo(repo_path)
+            cls.__repositories_indexes__[repo_file] = OperationsIndex(cls.__initialized_repositories__[repo_file])
         cls.__repository_dict__[operation_type]['file'] = repo_file
         cls.__repository_dict__[operation_type]['initialized_repo'] = cls.__initialized_repositories__[repo_file]
 
@@ -176,22 +224,22 @@ class OperationTypesRepository:
 
     @staticmethod
     def get_strategies_by_metadata(metadata: dict):
-        """ Method allow obtain strategy instance by the metadata
+        """ Method allow obtain strategy description by the metadata.
+        The strategy classes are not imported here, see current_strategy method
+        of OperationMetaInfo
 
         :param metadata: information about meta of the operation
         :return supported_strategies: available strategies for current metadata
         """
         strategies_json = metadata['strategies']
         if isinstance(strategies_json, list):
-            supported_strategies = eval_strategy_str(strategies_json)
+            supported_strategies = strategies_json
         else:
             supported_strategies = {}
             for strategy_dict_key in strategies_json.keys():
-                # Convert string into class path for import
+                # Convert string into task type
                 import_path = eval_field_str(strategy_dict_key)
-                strategy_class = eval_strategy_str(strategies_json[strategy_dict_key])
-
-                supported_strategies.update({import_path: strategy_class})
+                supported_strategies.update({import_path: strategies_json[strategy_dict_key]})
         return supported_strategies
 
     def operation_info_by_id(self, operation_id: str) -> Optional[OperationMetaInfo]:
@@ -199,17 +247,21 @@ class OperationTypesRepository:
 
         operation_id = get_operation_type_from_id(operation_id)
 
-        operations_with_id = [m for m in self._repo if m.id == operation_id]
-        if len(operations_with_id) > 1:
+        positions = self._index.positions_by_id.get(operation_id, [])
+        if len(positions) > 1:
             raise ValueError('Several operations with same id in repository')
-        if len(operations_with_id) == 0:
+        if len(positions) == 0:
             warnings.warn(f'Operation {operation_id} not found in the repository')
             return None
-        return operations_with_id[0]
+        return self._repo[positions[0]]
+
+    def has_operation(self, operation_id: str) -> bool:
+        """ Check if the operation with the name (id) is in the repository """
+        return get_operation_type_from_id(operation_id) in self._index.positions_by_id
 
     def operations_with_tag(self, tags: List[str], is_full_match: bool = False):
-        operations_info = [m for m in self._repo if
-                           _is_tags_contains_in_operation(tags, m.tags, is_full_match)]
+        positions = self._index.positions_with_tags(tags, is_full_match)
+        operations_info = [self._repo[position] for position in sorted(positions)]
         return [m.id for m in operations_info], operations_info
 
     def suitable_operation(self, task_type: TaskTypesEnum = None,
@@ -233,16 +285,14 @@ class OperationTypesRepository:
                 # Forbidden tags by default
                 forbidden_tags.append(excluded_default_tag)
 
-        if task_type is None:
-            operations_info = [m for m in self._repo if
-                               (not tags or _is_tags_contains_in_operation(tags, m.tags, is_full_match)) and
-                               (not forbidden_tags or not _is_tags_contains_in_operation(forbidden_tags, m.tags,
-                                                                                         False))]
-        else:
-            operations_info = [m for m in self._repo if task_type in m.task_type and
-                               (not tags or _is_tags_contains_in_operation(tags, m.tags, is_full_match)) and
-                               (not forbidden_tags or not _is_tags_contains_in_operation(forbidden_tags, m.tags,
-                                                                                         False))]
+        positions = self._index.positions_for_task(task_type)
+        if tags:
+            positions_with_tags = self._index.positions_with_tags(tags, is_full_match)
+            positions = [position for position in positions if position in positions_with_tags]
+        if forbidden_tags:
+            forbidden_positions = self._index.positions_with_tags(forbidden_tags, False)
+            positions = [position for position in positions if position not in forbidden_positions]
+        operations_info = [self._repo[position] for position in positions]
 
         if data_type:
             operations_info = [o for o in operations_info if data_type in o.input_types]
@@ -254,28 +304,6 @@ class OperationTypesRepository:
         return self._repo
 
 
-def _is_tags_contains_in_operation(candidate_tags: List[str],
-                                   operation_tags: List[str],
-                                   is_full_match: bool) -> bool:
-    """
-    The function checks which operations are suitable for the selected tags
-
-    :param candidate_tags: list with tags that the operation must have in order
-    to fit the selected task
-    :param operation_tags: list with tags with names as in repository json file
-    which correspond to the considering operation
-    :param is_full_match: requires all tags to match, or at least one
-
-    :return : is there a match on the tags
-    """
-
-    matches = ([(tag in operation_tags) for tag in candidate_tags])
-    if is_full_match:
-        return all(matches)
-    else:
-        return any(matches)
-
-
 def atomized_model_type():
     return 'atomized_operation'
 
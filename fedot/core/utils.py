@@ -18,9 +18,10 @@ def default_fedot_data_dir() -> str:
     """ Returns the folder where all the output data
     is recorded to. Default: home/Fedot
     """
-    default_data_path = os.path.join(str(Path.home()), 'Fedot')
-    if 'Fedot' not in os.listdir(str(Path.home())):
-        os.mkdir(default_data_path)
+    default_data_path = os.path.join(os.path.expanduser('~'), 'Fedot')
+    # The function is called for every created log, so the home folder is not listed
+    if not os.path.isdir(default_data_path):
+        os.makedirs(default_data_path, exist_ok=True)
     return default_data_path
 
 
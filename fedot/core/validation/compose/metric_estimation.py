@@ -1,9 +1,14 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from fedot.core.composer.metrics_evaluator import MetricsEvaluator
 from fedot.core.data.data import InputData
-from fedot.core.repository.quality_metrics_repository import MetricsRepository
 
 
 def metric_evaluation(pipeline, train_data: InputData, test_data: InputData,
-                      metrics: list, evaluated_metrics: list, vb_number: int = None):
+                      metrics: list, evaluated_metrics: list, vb_number: int = None,
+                      metrics_evaluator: Optional[MetricsEvaluator] = None):
     """ Pipeline training and metrics assessment
 
     :param pipeline: pipeline for validation
@@ -12,14 +17,35 @@ def metric_evaluation(pipeline, train_data: InputData, test_data: InputData,
     :param metrics: list with metrics for evaluation
     :param evaluated_metrics: list with metrics values
     :param vb_number: number of validation blocks
+    :param metrics_evaluator: evaluator for the metrics reused between the folds
     """
     pipeline.fit_from_scratch(train_data)
 
-    for index, metric in enumerate(metrics):
-        if callable(metric):
-            metric_func = metric
-        else:
-            metric_func = MetricsRepository().metric_by_id(metric)
-        metric_value = metric_func(pipeline, reference_data=test_data, validation_blocks=vb_number)
+    metrics_evaluator = metrics_evaluator or MetricsEvaluator(metrics)
+    metric_values = metrics_evaluator.evaluate(pipeline, reference_data=test_data, validation_blocks=vb_number)
+    for index, metric_value in enumerate(metric_values):
         evaluated_metrics[index].extend([metric_value])
     return evaluated_metrics
+
+
+def fold_metric_evaluation(pipeline, train_data: InputData, test_data: InputData,
+                           vb_number: int = None, metrics: list = None) -> Tuple[Tuple[float, ...], int]:
+    """ Pipeline training and metrics assessment for one fold of cross validation
+
+    :param pipeline: pipeline for validation
+    :param train_data: InputData for train
+    :param test_data: InputData for validation
+    :param vb_number: number of validation blocks
+    :param metrics: list with metrics for evaluation
+    :return: values of the metrics and the number of the predictions avoided by sharing them between the metrics
+    """
+    pipeline.fit_from_scratch(train_data)
+
+    metrics_evaluator = MetricsEvaluator(metrics)
+    metric_values = metrics_evaluator.evaluate(pipeline, reference_data=test_data, validation_blocks=vb_number)
+    return metric_values, metrics_evaluator.avoided_predicts
+
+
+def folds_metrics_mean(folds_results: List[Tuple[Tuple[float, ...], int]]) -> Tuple[float, ...]:
+    """ Averages the values of the metrics obtained by fold_metric_evaluation over the folds """
+    return tuple(np.mean(metric_values) for metric_values in zip(*[values for values, _ in folds_results]))
@@ -1,17 +1,17 @@
+from functools import partial
 from typing import Callable, Optional, Tuple
 
-import numpy as np
-
 from fedot.core.data.data import InputData
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.tasks import TaskTypesEnum
-from fedot.core.validation.compose.metric_estimation import metric_evaluation
+from fedot.core.validation.compose.metric_estimation import fold_metric_evaluation, folds_metrics_mean
+from fedot.core.validation.folds import evaluate_folds
 from fedot.core.validation.split import tabular_cv_generator
 
 
 def table_metric_calculation(reference_data: InputData, cv_folds: int,
                              metrics: [str, Callable], pipeline: Optional[Pipeline],
-                             log=None) -> [Tuple[float, ...], None]:
+                             log=None, n_jobs: int = 1) -> [Tuple[float, ...], None]:
     """ Perform cross validation on tabular data for regression and classification tasks
 
     :param reference_data: InputData for validation
@@ -19,20 +19,19 @@ def table_metric_calculation(reference_data: InputData, cv_folds: int,
     :param metrics: name of metric or callable object
     :param pipeline: Pipeline for validation
     :param log: object for logging
+    :param n_jobs: number of folds evaluated simultaneously, -1 means using all the available cores
     """
     if reference_data.task.task_type is TaskTypesEnum.clustering:
         raise NotImplementedError(f"Tabular cross validation for {reference_data.task.task_type} is not supported")
 
     log.debug(f'Pipeline {pipeline.root_node.descriptive_id} fit for cross validation started')
     try:
-        evaluated_metrics = [[] for _ in range(len(metrics))]
-        for train_data, test_data in tabular_cv_generator(reference_data, cv_folds):
-            # Calculate metric value for every fold of data
-            evaluated_metrics = metric_evaluation(pipeline, train_data,
-                                                  test_data, metrics,
-                                                  evaluated_metrics)
-        evaluated_metrics = tuple(map(lambda x: np.mean(x), evaluated_metrics))
-        log.debug(f'Pipeline {pipeline.root_node.descriptive_id} with metrics: {list(evaluated_metrics)}')
+        # Calculate metric value for every fold of data
+        folds_results = evaluate_folds(partial(fold_metric_evaluation, metrics=metrics), pipeline,
+                                       tabular_cv_generator(reference_data, cv_folds), n_jobs)
+        evaluated_metrics = folds_metrics_mean(folds_results)
+        log.debug(f'Pipeline {pipeline.root_node.descriptive_id} with metrics: {list(evaluated_metrics)}, '
+                  f'predict calls avoided: {sum(avoided for _, avoided in folds_results)}')
 
     except Exception as ex:
         log.debug(f'{__name__}. Pipeline assessment warning: {ex}. Continue.')
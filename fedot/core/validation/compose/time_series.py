@@ -1,16 +1,16 @@
+from functools import partial
 from typing import Callable, Tuple
 
-import numpy as np
-
 from fedot.core.data.data import InputData
-from fedot.core.validation.compose.metric_estimation import metric_evaluation
+from fedot.core.validation.compose.metric_estimation import fold_metric_evaluation, folds_metrics_mean
+from fedot.core.validation.folds import evaluate_folds
 from fedot.core.validation.split import ts_cv_generator
 
 
 def ts_metric_calculation(reference_data: InputData, cv_folds: int,
                           validation_blocks: int,
                           metrics: [str, Callable] = None,
-                          pipeline=None, log=None) -> [Tuple[float, ...], None]:
+                          pipeline=None, log=None, n_jobs: int = 1) -> [Tuple[float, ...], None]:
     """ Determine metric value for time series forecasting pipeline based
     on data for validation
 
@@ -20,18 +20,17 @@ def ts_metric_calculation(reference_data: InputData, cv_folds: int,
     :param metrics: name of metric or callable object
     :param pipeline: Pipeline for validation
     :param log: object for logging
+    :param n_jobs: number of folds evaluated simultaneously, -1 means using all the available cores
     """
     log.debug(f'Pipeline {pipeline.root_node.descriptive_id} fit for cross validation started')
     try:
-        evaluated_metrics = [[] for _ in range(len(metrics))]
-        for train_data, test_data, vb_number in ts_cv_generator(reference_data, cv_folds, validation_blocks, log):
-            # Calculate metric value for every fold of data
-            evaluated_metrics = metric_evaluation(pipeline, train_data,
-                                                  test_data, metrics,
-                                                  evaluated_metrics,
-                                                  vb_number)
-        evaluated_metrics = tuple(map(lambda x: np.mean(x), evaluated_metrics))
-        log.debug(f'Pipeline {pipeline.root_node.descriptive_id} with metrics: {list(evaluated_metrics)}')
+        # Calculate metric value for every fold of data
+        folds_results = evaluate_folds(partial(fold_metric_evaluation, metrics=metrics), pipeline,
+                                       ts_cv_generator(reference_data, cv_folds, validation_blocks, log),
+                                       n_jobs)
+        evaluated_metrics = folds_metrics_mean(folds_results)
+        log.debug(f'Pipeline {pipeline.root_node.descriptive_id} with metrics: {list(evaluated_metrics)}, '
+                  f'predict calls avoided: {sum(avoided for _, avoided in folds_results)}')
     except Exception as ex:
         log.debug(f'{__name__}. Pipeline assessment warning: {ex}. Continue.')
         evaluated_metrics = None
@@ -0,0 +1,31 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import Any, Callable, Iterable, List
+
+
+def evaluate_folds(fold_function: Callable, pipeline, folds: Iterable[tuple], n_jobs: int = 1) -> List[Any]:
+    """
+    Applies the function to the pipeline and each fold of the data. If n_jobs is more than 1,
+    the folds are evaluated simultaneously in the pool of threads on the independent copies
+    of the pipeline. The last fold is always evaluated on the pipeline itself, so after
+    the evaluation the pipeline is fitted on the last fold as in the sequential case
+
+    :param fold_function: function with signature fold_function(pipeline, *fold)
+    :param pipeline: pipeline to evaluate
+    :param folds: parts of the data (e.g. pairs of train and test data) for each fold
+    :param n_jobs: number of folds evaluated simultaneously, -1 means using all the available cores
+    :return: results of the function in the order of the folds
+    """
+    n_jobs = os.cpu_count() if n_jobs == -1 else max(n_jobs, 1)
+    if n_jobs == 1:
+        return [fold_function(pipeline, *fold) for fold in folds]
+
+    folds = list(folds)
+    if len(folds) <= 1:
+        return [fold_function(pipeline, *fold) for fold in folds]
+
+    with ThreadPoolExecutor(max_workers=min(n_jobs, len(folds))) as pool:
+        futures = [pool.submit(fold_function, deepcopy(pipeline), *fold) for fold in folds[:-1]]
+        futures.append(pool.submit(fold_function, pipeline, *folds[-1]))
+        return [future.result() for future in futures]
@@ -5,6 +5,7 @@ from sklearn.model_selection import KFold, TimeSeriesSplit
 
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.shared_arrays import take_rows
 
 
 class OneFoldInputDataSplit:
@@ -136,15 +137,15 @@ def ts_cv_generator(data, folds: int, validation_blocks: int, log) -> Iterator[T
 
 def _table_data_by_index(index, values: InputData):
     """ Allow to get tabular data by indexes of elements """
-    features = values.features[index, :]
-    target = np.take(values.target, index)
+    features = take_rows(values.features, index)
+    target = take_rows(values.target, index) if np.ndim(values.target) == 1 else np.take(values.target, index)
 
     return features, target
 
 
 def _ts_data_by_index(train_ids, test_ids, data):
     """ Allow to get time series data by indexes of elements """
-    features = data.features[train_ids]
-    target = data.target[test_ids]
+    features = take_rows(data.features, train_ids)
+    target = take_rows(data.target, test_ids)
 
     return features, target
@@ -1,21 +1,46 @@
+from typing import TYPE_CHECKING, Optional
+
 import numpy as np
 
+from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.data_split import train_test_data_setup
 
+if TYPE_CHECKING:
+    from fedot.core.pipelines.tuning.frozen_nodes import FrozenNodesCache
+
 
-def fit_predict_one_fold(data, pipeline):
+def fit_predict_one_fold(data, pipeline, nodes_cache: Optional['FrozenNodesCache'] = None):
     """ Simple strategy for model evaluation based on one folder check
 
     :param data: InputData for validation
     :param pipeline: Chain to validate
+    :param nodes_cache: cache of the nodes which are not changed during the tuning
     """
 
     # Train test split
     train_input, predict_input = train_test_data_setup(data)
     test_target = np.array(predict_input.target)
 
-    pipeline.fit_from_scratch(train_input)
-    predicted_output = pipeline.predict(predict_input)
+    fit_from_scratch(pipeline, train_input, nodes_cache)
+    predicted_output = predict(pipeline, predict_input, nodes_cache)
     predictions = np.array(predicted_output.predict)
 
     return test_target, predictions
+
+
+def fit_from_scratch(pipeline, train_data: InputData, nodes_cache: Optional['FrozenNodesCache'] = None):
+    """ Fits the pipeline without using saved information. If the cache is passed,
+    the nodes which are not changed during the tuning are restored from the cache
+    (the cache is applicable to InputData only, the data of other types is processed without it) """
+    if nodes_cache is None or not isinstance(train_data, InputData):
+        pipeline.fit_from_scratch(train_data)
+    else:
+        nodes_cache.fit(pipeline, train_data)
+
+
+def predict(pipeline, test_data: InputData, nodes_cache: Optional['FrozenNodesCache'] = None) -> OutputData:
+    """ Predicts with the fitted pipeline. If the cache is passed, the outputs of the nodes
+    which are not changed during the tuning are restored from the cache """
+    if nodes_cache is None or not isinstance(test_data, InputData):
+        return pipeline.predict(test_data)
+    return nodes_cache.predict(pipeline, test_data)
@@ -1,21 +1,41 @@
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+
 import numpy as np
 
+from fedot.core.validation.folds import evaluate_folds
 from fedot.core.validation.split import tabular_cv_generator
+from fedot.core.validation.tune.simple import fit_from_scratch, predict
 from fedot.core.data.data import InputData
 
+if TYPE_CHECKING:
+    from fedot.core.pipelines.tuning.frozen_nodes import FrozenNodesCache
+
+
+def cv_tabular_predictions(pipeline, reference_data: InputData, cv_folds: int, n_jobs: int = 1,
+                           nodes_cache: Optional['FrozenNodesCache'] = None):
+    """ Provide K-fold cross validation for tabular data
 
-def cv_tabular_predictions(pipeline, reference_data: InputData, cv_folds: int):
-    """ Provide K-fold cross validation for tabular data"""
+    :param n_jobs: number of folds evaluated simultaneously, -1 means using all the available cores
+    :param nodes_cache: cache of the nodes which are not changed during the tuning
+    """
 
     predictions = []
     targets = []
 
-    for train_data, test_data in tabular_cv_generator(reference_data, cv_folds):
-        pipeline.fit_from_scratch(train_data)
-        predicted_values = pipeline.predict(test_data).predict
-        actual_values = test_data.target
+    folds_results = evaluate_folds(partial(_fold_predictions, nodes_cache=nodes_cache), pipeline,
+                                   tabular_cv_generator(reference_data, cv_folds), n_jobs)
+    for predicted_values, actual_values in folds_results:
         predictions.extend(predicted_values)
         targets.extend(actual_values)
 
     predictions, targets = np.ravel(np.array(predictions)), np.ravel(np.array(targets))
     return predictions, targets
+
+
+def _fold_predictions(pipeline, train_data: InputData, test_data: InputData,
+                      nodes_cache: Optional['FrozenNodesCache'] = None):
+    fit_from_scratch(pipeline, train_data, nodes_cache)
+    predicted_values = predict(pipeline, test_data, nodes_cache).predict
+    actual_values = test_data.target
+    return predicted_values, actual_values
@@ -1,40 +1,54 @@
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+
 import numpy as np
 
 from fedot.core.pipelines.ts_wrappers import in_sample_ts_forecast
 from fedot.core.data.data import InputData
+from fedot.core.validation.folds import evaluate_folds
 from fedot.core.validation.split import ts_cv_generator
+from fedot.core.validation.tune.simple import fit_from_scratch, predict
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.tuning.frozen_nodes import FrozenNodesCache
 
 
 def cv_time_series_predictions(pipeline, reference_data: InputData, log,
-                               cv_folds: int, validation_blocks=None):
+                               cv_folds: int, validation_blocks=None, n_jobs: int = 1,
+                               nodes_cache: Optional['FrozenNodesCache'] = None):
     """ Provide K-fold cross validation for time series with using in-sample
     forecasting on each step (fold)
+
+    :param n_jobs: number of folds evaluated simultaneously, -1 means using all the available cores
+    :param nodes_cache: cache of the nodes which are not changed during the tuning
     """
 
     # Place where predictions and actual values will be loaded
     predictions = []
     targets = []
-    for train_data, test_data, vb_number in ts_cv_generator(reference_data, cv_folds, validation_blocks, log):
-        if vb_number is None:
-            # One fold validation
-            pipeline.fit_from_scratch(train_data)
-            output_pred = pipeline.predict(test_data)
-            predictions = output_pred.predict
-            targets = output_pred.target
-            break
-        else:
-            # Cross validation: get number of validation blocks per each fold
-            horizon = test_data.task.task_params.forecast_length * vb_number
-
-            pipeline.fit_from_scratch(train_data)
-
-            predicted_values = in_sample_ts_forecast(pipeline=pipeline,
-                                                     input_data=test_data,
-                                                     horizon=horizon)
-            # Clip actual data by the forecast horizon length
-            actual_values = test_data.target[-horizon:]
-            predictions.extend(predicted_values)
-            targets.extend(actual_values)
+    folds_results = evaluate_folds(partial(_fold_predictions, nodes_cache=nodes_cache), pipeline,
+                                   ts_cv_generator(reference_data, cv_folds, validation_blocks, log), n_jobs)
+    for predicted_values, actual_values in folds_results:
+        predictions.extend(predicted_values)
+        targets.extend(actual_values)
 
     predictions, targets = np.ravel(np.array(predictions)), np.ravel(np.array(targets))
     return predictions, targets
+
+
+def _fold_predictions(pipeline, train_data: InputData, test_data: InputData, vb_number=None,
+                      nodes_cache: Optional['FrozenNodesCache'] = None):
+    fit_from_scratch(pipeline, train_data, nodes_cache)
+    if vb_number is None:
+        # One fold validation
+        output_pred = predict(pipeline, test_data, nodes_cache)
+        return output_pred.predict, output_pred.target
+
+    # Cross validation: get number of validation blocks per each fold
+    horizon = test_data.task.task_params.forecast_length * vb_number
+    predicted_values = in_sample_ts_forecast(pipeline=pipeline,
+                                             input_data=test_data,
+                                             horizon=horizon)
+    # Clip actual data by the forecast horizon length
+    actual_values = test_data.target[-horizon:]
+    return predicted_values, actual_values
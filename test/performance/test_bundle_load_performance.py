@@ -0,0 +1,62 @@
+import os
+import time
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_ensemble_pipeline(models_amount: int = 12) -> Pipeline:
+    """ Ensemble of the models with the large fitted arrays (trees and training sets) """
+    models = [PrimaryNode('rf') if model_num % 2 == 0 else PrimaryNode('knn')
+              for model_num in range(models_amount)]
+    return Pipeline(SecondaryNode('logit', nodes_from=models))
+
+
+def load_time(load, repeats: int = 3) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_bundle_load_faster_than_directory(tmp_path):
+    features = np.random.rand(5000, 20)
+    data = InputData(idx=np.arange(len(features)), features=features, target=(features[:, 0] > 0.5).astype(int),
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+    pipeline = get_ensemble_pipeline()
+    pipeline.fit(data)
+
+    pipeline.save(os.path.join(tmp_path, 'ensemble'))
+    json_path = [os.path.join(root, file_name) for root, _, files in os.walk(tmp_path)
+                 for file_name in files if file_name.endswith('.json')][0]
+    bundle_path = os.path.join(tmp_path, 'ensemble.bundle')
+    pipeline.save_bundle(bundle_path)
+
+    def load_directory():
+        loaded_pipeline = Pipeline()
+        loaded_pipeline.load(json_path)
+        return loaded_pipeline
+
+    def load_bundle(lazy: bool = True):
+        loaded_pipeline = Pipeline()
+        loaded_pipeline.load_bundle(bundle_path, lazy=lazy)
+        return loaded_pipeline
+
+    directory_time = load_time(load_directory)
+    lazy_bundle_time = load_time(load_bundle)
+    bundle_time = load_time(lambda: load_bundle(lazy=False))
+    directory_predict_time = load_time(lambda: load_directory().predict(data))
+    bundle_predict_time = load_time(lambda: load_bundle().predict(data))
+    print(f'Directory load: {directory_time:.3f} s, bundle load: {bundle_time:.3f} s, '
+          f'lazy bundle load: {lazy_bundle_time:.3f} s')
+    print(f'Load and predict, directory: {directory_predict_time:.3f} s, bundle: {bundle_predict_time:.3f} s')
+
+    assert lazy_bundle_time < directory_time
+    assert np.array_equal(load_bundle().predict(data).predict, load_directory().predict(data).predict)
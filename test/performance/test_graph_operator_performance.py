@@ -0,0 +1,52 @@
+import random
+import timeit
+
+import pytest
+
+from fedot.core.dag.graph import Graph
+from fedot.core.dag.graph_node import GraphNode
+
+
+def get_random_graph(nodes_num: int) -> Graph:
+    random.seed(1)
+    nodes = [GraphNode('node_0')]
+    for node_num in range(1, nodes_num - 1):
+        parents = random.sample(nodes, min(len(nodes), 2))
+        nodes.append(GraphNode(f'node_{node_num}', nodes_from=parents))
+    leaves = [node for node in nodes if not any(node in (other.nodes_from or []) for other in nodes)]
+    return Graph(GraphNode('root', nodes_from=leaves))
+
+
+def naive_root_node(graph: Graph):
+    """ Root search by the scan of all the nodes for each node """
+    return [node for node in graph.nodes
+            if not any(other_node.nodes_from and node in other_node.nodes_from for other_node in graph.nodes)]
+
+
+@pytest.mark.parametrize('nodes_num', [10, 50, 100, 200])
+def test_root_node_lookup_performance(nodes_num):
+    graph = get_random_graph(nodes_num)
+    assert naive_root_node(graph) == [graph.root_node]
+
+    repeats = 100
+    naive_time = timeit.timeit(lambda: naive_root_node(graph), number=repeats) / repeats
+    indexed_time = timeit.timeit(lambda: graph.root_node, number=repeats) / repeats
+    print(f'{nodes_num} nodes: naive root lookup {naive_time * 1e6:.1f} us, '
+          f'indexed root lookup {indexed_time * 1e6:.1f} us')
+
+    if nodes_num >= 50:
+        assert indexed_time < naive_time
+
+
+@pytest.mark.parametrize('nodes_num', [10, 200])
+def test_node_children_lookup_performance(nodes_num):
+    graph = get_random_graph(nodes_num)
+    repeats = 10
+    indexed_time = timeit.timeit(lambda: [graph.operator.node_children(node) for node in graph.nodes],
+                                 number=repeats) / repeats
+    print(f'{nodes_num} nodes: children lookup for all the nodes {indexed_time * 1e6:.1f} us')
+
+    for node in graph.nodes:
+        expected_children = [other_node for other_node in graph.nodes
+                             if other_node.nodes_from and node in other_node.nodes_from]
+        assert graph.operator.node_children(node) == expected_children
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+# Backends imported only by the operations which require them
+HEAVY_BACKENDS = ['catboost', 'lightgbm', 'xgboost', 'h2o', 'tpot',
+                  'tensorflow', 'torch', 'statsmodels', 'nltk', 'matplotlib']
+
+RIDGE_SCRIPT = '''
+import numpy as np
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+features = np.random.rand(50, 3)
+data = InputData(idx=np.arange(50), features=features, target=features[:, 0],
+                 task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+pipeline = Pipeline(PrimaryNode('ridge'))
+pipeline.fit(data)
+pipeline.predict(data)
+'''
+
+
+def import_times(script: str) -> dict:
+    """ Runs the script in the new interpreter with -X importtime and returns
+    self and cumulative import times in microseconds for each imported module """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', script],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def test_pipeline_import_does_not_load_backends():
+    times = import_times('import fedot.core.pipelines.pipeline')
+    print(f'fedot.core.pipelines.pipeline import: '
+          f'{times["fedot.core.pipelines.pipeline"][1] / 1e6:.2f} s')
+
+    assert not [backend for backend in HEAVY_BACKENDS if backend in times]
+
+
+def test_ridge_pipeline_does_not_load_backends():
+    times = import_times(RIDGE_SCRIPT)
+    print(f'Total import time for ridge pipeline: {sum(self_time for self_time, _ in times.values()) / 1e6:.2f} s')
+
+    assert not [backend for backend in HEAVY_BACKENDS if backend in times]
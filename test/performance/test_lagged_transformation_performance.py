@@ -0,0 +1,72 @@
+import timeit
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
+    _sparse_matrix, prepare_target, ts_to_table
+from fedot.core.log import default_log
+
+
+def concat_ts_to_table(idx, time_series: np.array, window_size: int):
+    """ Previous implementation of the lagged transformation with pandas concatenation for each lag """
+    lagged_dataframe = pd.DataFrame({'t_id': time_series})
+    vals = lagged_dataframe['t_id']
+    for i in range(1, window_size + 1):
+        frames = [lagged_dataframe, vals.shift(i)]
+        lagged_dataframe = pd.concat(frames, axis=1)
+    lagged_dataframe.dropna(inplace=True)
+    transformed = np.array(lagged_dataframe)
+    features_columns = np.fliplr(transformed[:, 1:])
+    return idx[window_size:], features_columns
+
+
+def concat_prepare_target(idx, features_columns: np.array, target, forecast_length: int):
+    """ Previous implementation of the target transformation with pandas concatenation for each step """
+    ts_target = target[idx]
+    df = pd.DataFrame({'t_id': ts_target})
+    vals = df['t_id']
+    for i in range(1, forecast_length):
+        frames = [df, vals.shift(-i)]
+        df = pd.concat(frames, axis=1)
+    df.dropna(inplace=True)
+    threshold = -forecast_length + 1
+    return idx[: threshold], features_columns[: threshold], np.array(df)
+
+
+@pytest.mark.parametrize('window_size', [10, 100, 500])
+def test_lagged_transformation_performance(window_size):
+    time_series = np.sin(np.arange(10000) / 10) + np.random.rand(10000)
+    idx = np.arange(len(time_series))
+    forecast_length = 50
+
+    def concat_transformation():
+        new_idx, features = concat_ts_to_table(idx, time_series, window_size)
+        return concat_prepare_target(new_idx, features, time_series, forecast_length)
+
+    def view_transformation():
+        new_idx, features = ts_to_table(idx, time_series, window_size)
+        return prepare_target(new_idx, features, time_series, forecast_length)
+
+    for expected, obtained in zip(concat_transformation(), view_transformation()):
+        assert np.array_equal(expected, obtained)
+
+    repeats = 3
+    concat_time = timeit.timeit(concat_transformation, number=repeats) / repeats
+    view_time = timeit.timeit(view_transformation, number=repeats) / repeats
+    print(f'window size {window_size}: pandas concat {concat_time * 1e3:.2f} ms, '
+          f'strided view {view_time * 1e3:.2f} ms')
+
+    assert view_time < concat_time
+
+
+def test_sparse_lagged_transformation_performance():
+    time_series = np.random.rand(10000)
+    _, features = ts_to_table(np.arange(len(time_series)), time_series, window_size=300)
+
+    expected = np.take(features, np.arange(1, features.shape[1], 2), 1)
+    sparse_features = _sparse_matrix(default_log(__name__), features)
+
+    assert np.array_equal(expected, sparse_features)
+    assert np.shares_memory(sparse_features, time_series)
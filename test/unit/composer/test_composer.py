@@ -1,7 +1,6 @@
 import datetime
 import os
 import random
-import shelve
 
 import numpy as np
 import pandas as pd
@@ -306,12 +305,10 @@ def test_gp_composer_saving_info_from_process(data_fixture, request):
     train_data, test_data = train_test_data_setup(data,
                                                   sample_split_ratio_for_tasks[data.task.task_type])
     composer.compose_pipeline(data=dataset_to_compose, is_visualise=True)
-    with shelve.open(composer.cache.db_path) as cache:
-        global_cache_len_before = len(cache.dict)
+    global_cache_len_before = len(composer.cache)
     new_pipeline = pipeline_first()
     composer.composer_metric([quality_metric], dataset_to_compose, test_data, new_pipeline)
-    with shelve.open(composer.cache.db_path) as cache:
-        global_cache_len_after = len(cache.dict)
+    global_cache_len_after = len(composer.cache)
     assert global_cache_len_before < global_cache_len_after
     assert new_pipeline.computation_time is not None
     assert new_pipeline.fitted_on_data is not None
@@ -367,3 +364,45 @@ def test_gp_composer_random_graph_generation_looping():
         assert primary_node in nodes_name
         assert nodes_name.count(primary_node) == 1
     assert constraint_function(graph, params) is True
+
+
+@pytest.mark.parametrize('data_fixture', ['file_data_setup'])
+def test_gp_composer_multi_fidelity_evaluation(data_fixture, request):
+    data = request.getfixturevalue(data_fixture)
+    req = GPComposerRequirements(primary=['logit', 'scaling'], secondary=['logit', 'knn'],
+                                 max_arity=2, max_depth=2, pop_size=6, num_of_generations=2,
+                                 fidelity_levels=[0.25, 0.5])
+    composer = GPComposerBuilder(task=Task(TaskTypesEnum.classification)).with_requirements(req). \
+        with_metrics(ClassificationMetricsEnum.ROCAUC).build()
+    pipeline = composer.compose_pipeline(data=data)
+
+    assert pipeline is not None
+    all_fidelity = [fidelity for generation in composer.history.historical_fidelity for fidelity in generation]
+    assert set(all_fidelity) <= {0.25, 0.5, 1.0}
+    assert 1.0 in all_fidelity and min(all_fidelity) < 1.0
+    with pytest.raises(ValueError):
+        GPComposerRequirements(primary=['logit'], secondary=['logit'], fidelity_levels=[0])
+
+
+@pytest.mark.parametrize('data_fixture', ['file_data_setup'])
+def test_gp_composer_fitness_cache(data_fixture, request):
+    data = request.getfixturevalue(data_fixture)
+    train_data, test_data = train_test_data_setup(data)
+    quality_metric = ClassificationMetricsEnum.ROCAUC
+    req = GPComposerRequirements(primary=['logit', 'knn'], secondary=['logit', 'knn'])
+    composer = GPComposerBuilder(task=Task(TaskTypesEnum.classification)).with_requirements(req). \
+        with_metrics(quality_metric).with_fitness_cache(max_size=1).build()
+
+    first_fitness = composer.composer_metric([quality_metric], train_data, test_data, pipeline_first())
+    second_fitness = composer.composer_metric([quality_metric], train_data, test_data, pipeline_first())
+
+    assert first_fitness == second_fitness
+    assert composer.history.fitness_cache_hits == 1
+    assert composer.history.fitness_cache_misses == 1
+
+    # the least recently used fitness is removed from the cache
+    composer.composer_metric([quality_metric], train_data, test_data, baseline_pipeline())
+    composer.composer_metric([quality_metric], train_data, test_data, pipeline_first())
+
+    assert len(composer.fitness_cache) == 1
+    assert composer.history.fitness_cache_misses == 3
@@ -1,11 +1,19 @@
 import os
 
+import pytest
+
 from fedot.api.main import Fedot
+from fedot.core.composer.gp_composer.gp_composer import GPComposerBuilder, GPComposerRequirements
+from fedot.core.data.data import InputData
+from fedot.core.optimisers.gp_comp.gp_optimiser import GPGraphOptimiserParameters
 from fedot.core.optimisers.gp_comp.operators.mutation import MutationTypesEnum
 from fedot.core.optimisers.opt_history import ParentOperator
+from fedot.core.optimisers.opt_history_log import HISTORY_LOG_FILE, HistoryLogWriter, pipeline_from_record
 from fedot.core.pipelines.node import PrimaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.template import PipelineTemplate
+from fedot.core.repository.quality_metrics_repository import ClassificationMetricsEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
 from fedot.core.utils import fedot_project_root
 
 
@@ -34,3 +42,47 @@ def test_operators_in_history():
     assert 1 <= len(auto_model.history.parent_operators) <= 3
 
     # TODO extend test
+
+
+def test_compact_history_log(tmp_path):
+    data = InputData.from_csv(os.path.join(str(fedot_project_root()), 'test/data/simple_classification.csv'))
+    req = GPComposerRequirements(primary=['logit', 'scaling'], secondary=['logit', 'knn'],
+                                 max_arity=2, max_depth=2, pop_size=4, num_of_generations=3)
+    optimiser_parameters = GPGraphOptimiserParameters(history_folder=str(tmp_path / 'history'),
+                                                      compact_history=True)
+    composer = GPComposerBuilder(task=Task(TaskTypesEnum.classification)).with_requirements(req). \
+        with_metrics(ClassificationMetricsEnum.ROCAUC).with_optimiser_parameters(optimiser_parameters).build()
+    composer.compose_pipeline(data=data)
+
+    history = composer.history
+    # The templates are neither stored nor exported
+    assert not history.individuals
+    assert os.listdir(tmp_path / 'history') == [HISTORY_LOG_FILE]
+
+    reader = history.log_reader()
+    assert 1 <= len(reader.generations) <= 3
+    record = reader.generations[-1][0]
+    assert record['fitness'] is not None and record['computation_time'] is not None
+    template = reader.pipeline_template(record)
+    assert len(template.operation_templates) == len(record['nodes'])
+    assert pipeline_from_record(record).root_node.descriptive_digest == record['struct_id']
+
+    history.write_composer_history_to_csv()
+    with open(tmp_path / 'history' / 'history.csv') as csv_file:
+        assert len(csv_file.readlines()) == len(reader) + 1
+
+
+def test_history_log_writer_errors_raised(tmp_path):
+    with pytest.raises(OSError):
+        HistoryLogWriter(os.path.join('/proc', 'history', HISTORY_LOG_FILE))
+
+    log_writer = HistoryLogWriter(os.path.join(tmp_path, HISTORY_LOG_FILE))
+    # The closed file imitates the failure of the writing
+    log_writer._log_file.close()
+    log_writer.write([{'generation': 0}])
+    with pytest.raises(ValueError):
+        log_writer.flush()
+    with pytest.raises(ValueError):
+        log_writer.write([{'generation': 1}])
+    with pytest.raises(ValueError):
+        log_writer.close()
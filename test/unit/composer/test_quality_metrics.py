@@ -6,6 +6,7 @@ import pytest
 from sklearn.datasets import load_breast_cancer
 
 from fedot.core.composer.metrics import QualityMetric
+from fedot.core.composer.metrics_evaluator import MetricsEvaluator
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
@@ -104,3 +105,26 @@ def test_data_preparation_for_multi_target_correct(multi_target_data_setup):
     results, new_test = QualityMetric()._simple_prediction(simple_pipeline, test)
     number_elements = len(new_test.target)
     assert source_shape[0] * source_shape[1] == number_elements
+
+
+def test_metrics_evaluator_shares_prediction(data_setup):
+    train, test = data_setup
+    pipeline = default_valid_pipeline()
+    pipeline.fit(input_data=train)
+    metrics = [ClassificationMetricsEnum.ROCAUC, ClassificationMetricsEnum.f1,
+               ClassificationMetricsEnum.accuracy, ClassificationMetricsEnum.ROCAUC_penalty,
+               ComplexityMetricsEnum.structural]
+
+    expected_values = tuple(MetricsRepository().metric_by_id(metric)(pipeline, reference_data=test)
+                            for metric in metrics)
+
+    metrics_evaluator = MetricsEvaluator(metrics)
+    actual_values = metrics_evaluator.evaluate(pipeline, reference_data=test)
+
+    assert actual_values == expected_values
+    # four quality metrics are calculated with the single prediction
+    assert metrics_evaluator.avoided_predicts == 3
+    # the root node is executed for both probabilities and labels, the other nodes once
+    assert pipeline.execution_counts[pipeline.root_node] == 2
+    assert all(count == 1 for node, count in pipeline.execution_counts.items()
+               if node is not pipeline.root_node)
@@ -90,3 +90,42 @@ def test_node_children():
     # then
     assert len(children) == 1
     assert children[0] is pipeline.nodes[1]
+
+
+def test_node_children_after_structure_change():
+    # given
+    pipeline = get_pipeline()
+    selected_node = pipeline.nodes[2]
+    first_level_node = pipeline.nodes[1]
+    assert pipeline.operator.node_children(selected_node) == [first_level_node]
+
+    # when
+    new_node = SecondaryNode('knn', nodes_from=[selected_node])
+    pipeline.root_node.nodes_from.append(new_node)
+    pipeline.add_node(new_node)
+
+    # then
+    assert pipeline.operator.node_children(selected_node) == [first_level_node, new_node]
+    assert pipeline.operator.node_children(new_node) == [pipeline.root_node]
+    assert pipeline.root_node.operation.operation_type == 'logit'
+
+
+def test_root_node_after_structure_change():
+    # given
+    pipeline = get_pipeline()
+    old_root = pipeline.root_node
+
+    # when
+    new_root = SecondaryNode('rf', nodes_from=[old_root])
+    pipeline.add_node(new_root)
+
+    # then
+    assert pipeline.root_node is new_root
+
+    # when
+    other_root = SecondaryNode('dt')
+    pipeline.update_node(new_root, other_root)
+
+    # then
+    assert pipeline.root_node is other_root
+    assert other_root.nodes_from == [old_root]
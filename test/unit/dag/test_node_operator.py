@@ -44,3 +44,42 @@ def test_node_operator_distance_to_primary_level():
     distance = root._operator.distance_to_primary_level()
 
     assert distance == 2
+
+
+def test_node_operator_descriptive_id_actualisation():
+    # given
+    root, third_node, first_node, _ = get_nodes()
+    initial_id = root.descriptive_id
+    initial_digest = root.descriptive_digest
+
+    # then
+    assert root.descriptive_id is initial_id
+    assert len(initial_digest) == 32
+
+    # when
+    first_node.custom_params = {'n_neighbors': 3}
+
+    # then
+    assert root.descriptive_id != initial_id
+    assert root.descriptive_digest != initial_digest
+    assert 'n_neighbors' in root.descriptive_id
+
+    # when
+    third_node.nodes_from.remove(first_node)
+
+    # then
+    assert root.descriptive_id == '((/n_knn_default_params;)/n_lda_default_params;)/n_logit_default_params'
+
+
+def test_node_operator_descriptive_id_with_shared_parents():
+    # given
+    shared_node = PrimaryNode('scaling')
+    nodes = [shared_node]
+    for _ in range(30):
+        nodes.append(SecondaryNode('ridge', nodes_from=[nodes[-1], shared_node]))
+
+    # when
+    descriptive_id = nodes[-1].descriptive_id
+
+    # then
+    assert descriptive_id.count('ridge') == 30
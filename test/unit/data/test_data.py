@@ -6,7 +6,9 @@ import pandas as pd
 import pytest
 from sklearn.datasets import load_iris
 
-from fedot.core.data.data import InputData, OutputData
+from fedot.core.data.data import InputData, OutputData, data_has_categorical_features, data_has_missing_values, \
+    table_schema
+from fedot.core.data.data_split import data_subsample
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
@@ -207,3 +209,89 @@ def test_table_data_shuffle():
     assert not np.array_equal(data.target, shuffled_data.target)
 
     assert np.array_equal(data.idx, sorted(shuffled_data.idx))
+
+
+def test_data_subsample_correct():
+    test_file_path = str(os.path.dirname(__file__))
+    data = InputData.from_csv(os.path.join(test_file_path, '../../data/advanced_classification.csv'))
+
+    subsample = data_subsample(data, 0.2)
+    assert len(subsample.idx) == len(subsample.features) == len(subsample.target) == np.ceil(len(data.idx) * 0.2)
+    # The proportion of the classes is kept
+    assert np.isclose(np.mean(subsample.target), np.mean(data.target), atol=0.01)
+    assert data_subsample(data, 1.0) is data
+
+    time_series = np.arange(100, dtype=float)
+    ts_data = InputData(idx=np.arange(100), features=time_series, target=time_series,
+                        task=Task(TaskTypesEnum.ts_forecasting), data_type=DataTypesEnum.ts)
+    ts_subsample = data_subsample(ts_data, 0.3)
+    assert np.array_equal(ts_subsample.features, time_series[-30:])
+    assert np.array_equal(ts_subsample.idx, np.arange(70, 100))
+
+
+def test_data_fingerprint_correct(data_setup):
+    features_hash, target_hash = data_setup.fingerprint()
+    same_data = deepcopy(data_setup)
+    assert same_data.fingerprint() == (features_hash, target_hash)
+
+    # non-contiguous array with the same content has the same fingerprint
+    same_data.features = np.asfortranarray(data_setup.features)
+    assert same_data.fingerprint() == (features_hash, target_hash)
+
+    # the cached fingerprint is updated when the array is replaced
+    same_data.features = data_setup.features[::-1]
+    assert same_data.fingerprint()[0] != features_hash
+    assert same_data.fingerprint()[1] == target_hash
+
+    # in-place modification is taken into account after the reset
+    changed_data = deepcopy(data_setup)
+    changed_data.fingerprint()
+    changed_data.features[0, 0] += 1
+    changed_data.reset_fingerprint()
+    assert changed_data.fingerprint()[0] != features_hash
+
+
+def test_data_fingerprint_with_object_columns():
+    features = np.array([[1, 'a', None], [2, 'b', np.nan]], dtype=object)
+    data = InputData(idx=np.arange(2), features=features, target=None,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+    features_hash, target_hash = data.fingerprint()
+
+    assert target_hash is None
+    assert features_hash == deepcopy(data).fingerprint()[0]
+    changed_features = features.copy()
+    changed_features[1, 1] = 'c'
+    data.features = changed_features
+    assert data.fingerprint()[0] != features_hash
+
+
+def test_table_schema_inferred_once():
+    rows_amount = 50
+    numeric_with_string = np.arange(rows_amount).astype(object)
+    numeric_with_string[3] = 'unknown'
+    mixed = np.arange(rows_amount).astype(object)
+    mixed[:rows_amount // 2] = 'a'
+    features = np.column_stack([np.random.rand(rows_amount), numeric_with_string, mixed,
+                                np.array(['a', 'b'] * (rows_amount // 2), dtype=object)])
+    features[0, 0] = np.nan
+    target = np.random.rand(rows_amount)
+    target[5] = np.nan
+    data = InputData(idx=np.arange(rows_amount), features=features, target=target,
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+
+    schema = table_schema(data)
+    assert schema.converted_columns == [1]
+    assert schema.mixed_columns == [2]
+    assert schema.categorical_columns == [3]
+    assert list(schema.missing_counts) == [1, 0, 0, 0]
+    assert list(schema.target_missing_rows) == [5]
+    assert data_has_categorical_features(data)
+    assert data_has_missing_values(data)
+
+    # The schema is reused while the arrays are the same
+    assert table_schema(data) is schema
+    assert table_schema(deepcopy(data)) is not schema
+    data.features = np.random.rand(rows_amount, 4)
+    assert table_schema(data) is not schema
+    assert not data_has_categorical_features(data)
+    assert not data_has_missing_values(data)
@@ -0,0 +1,93 @@
+import datetime
+import gc
+import os
+import pickle
+from copy import deepcopy
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.shared_arrays import is_shared, share_array, shared_array_reference
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.validation.split import tabular_cv_generator
+
+
+def get_table_data(rows: int = 10000, columns: int = 10) -> InputData:
+    features = np.random.rand(rows, columns)
+    target = (features[:, 0] > 0.5).astype(int)
+    return InputData(idx=np.arange(rows), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def test_shared_data_pickled_as_references():
+    data = get_table_data()
+    shared_data = data.to_shared()
+
+    assert is_shared(shared_data.features) and is_shared(shared_data.target)
+    assert not shared_data.features.flags.writeable
+    assert np.array_equal(shared_data.features, data.features)
+    assert shared_data.fingerprint() == data.fingerprint()
+
+    pickled_data = pickle.dumps(shared_data)
+    assert len(pickled_data) < data.features.nbytes / 100
+    unpickled_data = pickle.loads(pickled_data)
+    assert np.array_equal(unpickled_data.features, data.features)
+    assert np.array_equal(unpickled_data.target, data.target)
+
+    copied_data = deepcopy(shared_data)
+    assert np.array_equal(copied_data.features, data.features)
+
+
+def test_shared_data_split_to_views():
+    shared_data = get_table_data().to_shared()
+
+    train_data, test_data = train_test_data_setup(shared_data)
+    assert np.shares_memory(train_data.features, shared_data.features)
+    assert np.shares_memory(test_data.features, shared_data.features)
+    assert np.array_equal(pickle.loads(pickle.dumps(test_data)).features, test_data.features)
+
+    for fold_num, (train_data, test_data) in enumerate(tabular_cv_generator(shared_data, 4)):
+        # Test part of each fold is a contiguous range of rows
+        assert np.shares_memory(test_data.features, shared_data.features)
+        assert np.array_equal(test_data.features, shared_data.features[fold_num * 2500:(fold_num + 1) * 2500])
+
+
+def test_writable_shared_data_changes_visible():
+    shared_data = get_table_data().to_shared(writable=True)
+    unpickled_data = pickle.loads(pickle.dumps(shared_data))
+    shared_data.features[0, 0] = -1
+
+    assert unpickled_data.features[0, 0] == -1
+
+    objects_array = np.array(['a', None], dtype=object)
+    assert share_array(objects_array) is objects_array
+
+
+def test_shared_array_file_removed():
+    shared_array = share_array(np.arange(100, dtype=float))
+    view = shared_array[10:]
+    path = shared_array_reference(view).mapped_file.path
+
+    del shared_array
+    gc.collect()
+    # The file is still used by the view
+    assert os.path.exists(path)
+
+    del view
+    gc.collect()
+    assert not os.path.exists(path)
+
+
+def test_pipeline_fit_with_time_limit_on_shared_data():
+    data = get_table_data()
+    train_data, test_data = train_test_data_setup(data.to_shared())
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(train_data, time_constraint=datetime.timedelta(minutes=1))
+
+    reference_pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')]))
+    reference_pipeline.fit(train_data)
+    assert np.allclose(pipeline.predict(test_data).predict, reference_pipeline.predict(test_data).predict)
@@ -4,6 +4,7 @@ import os
 import pytest
 
 from fedot.core.operations.evaluation.classification import SkLearnClassificationStrategy
+from fedot.core.repository.default_params_repository import DefaultOperationParamsRepository
 from fedot.core.repository.json_evaluation import eval_field_str, \
     eval_strategy_str, read_field
 from fedot.core.repository.operation_types_repository import (OperationTypesRepository,
@@ -95,3 +96,41 @@ def test_operation_types_repository_repr():
     repository = OperationTypesRepository().assign_repo('model', 'model_repository.json')
 
     assert repository.__repr__() == 'OperationTypesRepository for model_repository.json'
+
+
+@pytest.mark.parametrize('task_type', [None, TaskTypesEnum.regression, TaskTypesEnum.ts_forecasting])
+@pytest.mark.parametrize('tags, is_full_match', [(None, False), (['linear'], False),
+                                                 (['simple', 'linear'], True), (['simple', 'linear'], False)])
+def test_indexed_search_equal_to_full_scan(task_type, tags, is_full_match):
+    for operation_type in ['model', 'data_operation']:
+        repo = OperationTypesRepository(operation_type)
+        # default forbidden tags are used if the tags are not passed
+        forbidden_tags = ['non-default', 'expensive'] if not tags else ['non_lagged']
+
+        expected_names = [operation.id for operation in repo.operations
+                          if (task_type is None or task_type in operation.task_type) and
+                          (not tags or (all if is_full_match else any)(tag in operation.tags for tag in tags)) and
+                          not any(tag in operation.tags for tag in forbidden_tags)]
+        model_names, _ = repo.suitable_operation(task_type=task_type, tags=tags, is_full_match=is_full_match,
+                                                 forbidden_tags=None if not tags else ['non_lagged'])
+
+        assert model_names == expected_names
+
+
+def test_operation_info_by_id_correct():
+    repo = OperationTypesRepository()
+
+    assert repo.operation_info_by_id('ridge/custom_postfix').id == 'ridge'
+    assert repo.has_operation('ridge')
+    assert not repo.has_operation('scaling')
+    with pytest.warns(UserWarning):
+        assert repo.operation_info_by_id('non_existing_operation') is None
+
+
+def test_default_params_are_not_shared():
+    with DefaultOperationParamsRepository() as repo:
+        params = repo.get_default_params_for_operation('lgbm')
+        params['n_estimators'] = -1
+
+    with DefaultOperationParamsRepository() as repo:
+        assert repo.get_default_params_for_operation('lgbm')['n_estimators'] != -1
@@ -0,0 +1,61 @@
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.graph import OptGraph, OptNode
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from test.unit.pipelines.test_node_cache import data_setup  # noqa: F401
+
+
+def pipeline_with_custom_params():
+    first = PrimaryNode('scaling')
+    second = SecondaryNode('logit', nodes_from=[first])
+    third = SecondaryNode('knn', nodes_from=[first])
+    third.custom_params = {'n_neighbors': 3}
+    root = SecondaryNode('logit', nodes_from=[second, third])
+    return Pipeline(root)
+
+
+def test_adapt_and_restore_keep_structure():
+    pipeline = pipeline_with_custom_params()
+    adapter = PipelineAdapter()
+
+    opt_graph = adapter.adapt(pipeline)
+    assert isinstance(opt_graph, OptGraph)
+    assert all(isinstance(node, OptNode) for node in opt_graph.nodes)
+    assert opt_graph.root_node.descriptive_id == pipeline.root_node.descriptive_id
+    assert opt_graph.uid == pipeline.uid
+
+    restored_pipeline = adapter.restore(opt_graph)
+    assert isinstance(restored_pipeline, Pipeline)
+    assert restored_pipeline.root_node.descriptive_id == pipeline.root_node.descriptive_id
+    assert restored_pipeline.length == pipeline.length
+    assert restored_pipeline.uid == pipeline.uid
+    # The shared parent is still shared after the restoration
+    assert restored_pipeline.root_node.nodes_from[0].nodes_from[0] is \
+           restored_pipeline.root_node.nodes_from[1].nodes_from[0]
+
+    # The restored pipeline and the graph do not share mutable content
+    restored_knn = [node for node in restored_pipeline.nodes if str(node) == 'knn'][0]
+    restored_knn.custom_params = {'n_neighbors': 5}
+    opt_knn = [node for node in opt_graph.nodes if str(node) == 'knn'][0]
+    assert opt_knn.content['params']['n_neighbors'] == 3
+
+
+def test_adapt_and_restore_do_not_copy_fitted_state(data_setup):  # noqa: F811
+    train_data, _ = data_setup
+    pipeline = pipeline_with_custom_params()
+    pipeline.fit(train_data)
+    adapter = PipelineAdapter()
+
+    opt_graph = adapter.adapt(pipeline)
+    for node in opt_graph.nodes:
+        assert node.content['name'].fitted_operation is None
+        assert not hasattr(node, '_fitted_operation')
+        assert not hasattr(node, '_node_data')
+
+    restored_pipeline = adapter.restore(opt_graph)
+    assert all(node.fitted_operation is None for node in restored_pipeline.nodes)
+
+    # The fitting of the restored pipeline does not affect the source objects
+    restored_pipeline.fit(train_data)
+    assert all(node.content['name'].fitted_operation is None for node in opt_graph.nodes)
+    assert all(node.fitted_operation is not None for node in pipeline.nodes)
@@ -14,9 +14,12 @@ from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.log import default_log
 from fedot.core.optimisers.adapters import DirectAdapter, PipelineAdapter
+from fedot.core.optimisers.gp_comp.evaluation import MultiprocessingEvaluationBackend, SequentialEvaluationBackend
 from fedot.core.optimisers.gp_comp.gp_operators import evaluate_individuals, filter_duplicates
 from fedot.core.optimisers.gp_comp.gp_optimiser import GraphGenerationParams
 from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.multi_fidelity import MultiFidelityObjective, evaluate_with_successive_halving, \
+    fully_evaluated
 from fedot.core.optimisers.gp_comp.operators.crossover import CrossoverTypesEnum, crossover
 from fedot.core.optimisers.gp_comp.operators.mutation import MutationTypesEnum, mutation, reduce_mutation, \
     single_drop_mutation, _adapt_and_apply_mutations
@@ -100,6 +103,58 @@ def pipeline_with_custom_parameters(alpha_value):
     return pipeline
 
 
+def test_evaluate_with_successive_halving():
+    population = [Individual(OptGraph(OptNode({'name': f'operation_{ind_num}'}))) for ind_num in range(9)]
+    full_budget_evaluations = []
+
+    def fitness_on_subsample(graph):
+        ind_num = int(graph.root_node.content['name'].split('_')[1])
+        # The last individual can not be evaluated on the small part of the data
+        return None if ind_num == 8 else (float(ind_num),)
+
+    def fitness_on_full_data(graph):
+        ind_num = int(graph.root_node.content['name'].split('_')[1])
+        full_budget_evaluations.append(ind_num)
+        return (float(ind_num),)
+
+    objective = MultiFidelityObjective([(0.1, fitness_on_subsample), (1.0, fitness_on_full_data)],
+                                       promotion_rate=1 / 3)
+    evaluated = evaluate_with_successive_halving(population, objective,
+                                                 graph_generation_params=GraphGenerationParams(),
+                                                 is_multi_objective=False)
+
+    assert evaluated == population
+    # The best third and the failed individual are promoted
+    assert sorted(full_budget_evaluations) == [0, 1, 2, 8]
+    assert [ind.fidelity for ind in evaluated] == [1.0] * 3 + [0.1] * 5 + [1.0]
+    # The rejected individuals are not ranked better than the promoted ones
+    assert [ind.fitness for ind in evaluated] == [0, 1, 2] + [8] * 6
+
+
+def test_evaluate_with_successive_halving_multi_objective():
+    population = [Individual(OptGraph(OptNode({'name': f'operation_{ind_num}'}))) for ind_num in range(6)]
+
+    def fitness_on_subsample(graph):
+        ind_num = int(graph.root_node.content['name'].split('_')[1])
+        # The complexity of the rejected individuals is better than the one of the promoted ones
+        return float(ind_num), float(-ind_num)
+
+    def fitness_on_full_data(graph):
+        ind_num = int(graph.root_node.content['name'].split('_')[1])
+        return float(ind_num + 10), float(-ind_num)
+
+    objective = MultiFidelityObjective([(0.1, fitness_on_subsample), (1.0, fitness_on_full_data)],
+                                       promotion_rate=1 / 3)
+    evaluated = evaluate_with_successive_halving(population, objective,
+                                                 graph_generation_params=GraphGenerationParams(),
+                                                 is_multi_objective=True)
+
+    assert [ind.fidelity for ind in evaluated] == [1.0] * 2 + [0.1] * 4
+    # The primary objective of the rejected individuals is bounded by the worst promoted one
+    assert [ind.fitness.values[0] for ind in evaluated] == [10, 11] + [11] * 4
+    assert fully_evaluated(evaluated) == evaluated[:2]
+
+
 def test_nodes_from_height():
     graph = graph_example()
     found_nodes = graph.operator.nodes_from_layer(1)
@@ -153,6 +208,39 @@ def test_evaluate_individuals():
     assert all([ind.fitness is not None for ind in evaluated])
 
 
+def test_evaluate_individuals_in_parallel():
+    task = Task(TaskTypesEnum.classification)
+    dataset_to_compose = file_data()
+    available_model_types, _ = OperationTypesRepository().suitable_operation(task_type=task.task_type)
+    composer_requirements = GPComposerRequirements(primary=available_model_types,
+                                                   secondary=available_model_types)
+    composer = GPComposerBuilder(task=task).with_requirements(composer_requirements). \
+        with_metrics(ClassificationMetricsEnum.ROCAUC_penalty).build()
+
+    pipelines_to_evaluate = [pipeline_first(), pipeline_second(),
+                             pipeline_third(), pipeline_fourth()]
+    train_data, test_data = train_test_data_setup(dataset_to_compose)
+    metric_function_for_nodes = partial(composer.composer_metric, composer.metrics, train_data, test_data)
+    adapter = PipelineAdapter()
+    params = GraphGenerationParams(adapter=PipelineAdapter(), advisor=PipelineChangeAdvisor())
+
+    evaluated_by_backend = []
+    for backend in [SequentialEvaluationBackend(), MultiprocessingEvaluationBackend(n_jobs=2)]:
+        population = [Individual(adapter.adapt(c)) for c in pipelines_to_evaluate]
+        with OptimisationTimer(timeout=datetime.timedelta(minutes=5)) as t:
+            evaluated = evaluate_individuals(individuals_set=population,
+                                             objective_function=metric_function_for_nodes,
+                                             graph_generation_params=params,
+                                             is_multi_objective=False, timer=t,
+                                             evaluation_backend=backend)
+        evaluated_by_backend.append(evaluated)
+
+    sequential, parallel = evaluated_by_backend
+    assert len(parallel) == len(sequential) == 4
+    assert all([ind.computation_time > 0 for ind in parallel])
+    assert np.allclose([ind.fitness for ind in parallel], [ind.fitness for ind in sequential])
+
+
 def test_filter_duplicates():
     archive = tools.ParetoFront()
     archive_items = [pipeline_first(), pipeline_second(), pipeline_third()]
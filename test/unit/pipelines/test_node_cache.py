@@ -8,6 +8,7 @@ from sklearn.datasets import load_breast_cancer
 from fedot.core.composer.cache import OperationsCache
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.optimisers.utils.population_utils import data_characteristics
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -296,4 +297,53 @@ def test_multi_pipeline_caching_with_cache(data_setup):
     assert not any([cache.get(node) for node in nodes_with_non_actual_cache])
     assert all([cache.get(node) for node in nodes_with_actual_cache])
 
-# TODO Add changed data case for cache
+
+def test_cache_actuality_after_data_change(data_setup):
+    """ The operations fitted on other data are not restored from the cache """
+    cache = OperationsCache()
+    train, test = data_setup
+    pipeline = pipeline_first()
+    pipeline.fit(input_data=train)
+    cache.save_pipeline(pipeline, data_characteristics(train, pipeline.log))
+
+    assert all([cache.get(node, data_characteristics(train, pipeline.log)) for node in pipeline.nodes])
+    assert not any([cache.get(node, data_characteristics(test, pipeline.log)) for node in pipeline.nodes])
+
+    new_pipeline = pipeline_first()
+    new_pipeline.fit_from_cache(cache, test)
+    assert not any([node.fitted_operation for node in new_pipeline.nodes])
+    new_pipeline.fit_from_cache(cache, train)
+    assert new_pipeline.is_fitted
+    assert cache.hits > 0 and cache.misses > 0
+
+
+def test_cache_eviction_to_disk(data_setup):
+    """ The operations evicted from the memory are available from the on-disk storage """
+    train, _ = data_setup
+    pipeline = pipeline_first()
+    pipeline.fit(input_data=train)
+
+    memory_only_cache = OperationsCache(max_bytes=1)
+    memory_only_cache.save_pipeline(pipeline)
+    assert len(memory_only_cache) == 0
+    assert not any([memory_only_cache.get(node) for node in pipeline.nodes])
+
+    cache = OperationsCache(db_path='test_eviction_cache', max_bytes=1)
+    cache.save_node(pipeline.root_node)
+    cache.save_node(pipeline.root_node.nodes_from[0])
+    assert cache.bytes_held == 0
+    assert all([cache.get(node) for node in (pipeline.root_node, pipeline.root_node.nodes_from[0])])
+    cache.clear()
+
+    max_state_size = 0
+    for node in pipeline.nodes:
+        node_cache = OperationsCache()
+        node_cache.save_node(node)
+        max_state_size = max(max_state_size, node_cache.bytes_held)
+
+    cache = OperationsCache(db_path='test_eviction_cache', max_bytes=max_state_size)
+    cache.save_pipeline(pipeline)
+    assert cache.evictions > 0
+    assert cache.bytes_held <= cache.max_bytes
+    assert all([cache.get(node) for node in pipeline.nodes])
+    cache.clear()
@@ -1,10 +1,11 @@
 import datetime
 import os
 import platform
-import time
 from copy import copy, deepcopy
 from multiprocessing import set_start_method
+from multiprocessing.connection import Connection
 from random import seed
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -14,6 +15,8 @@ from sklearn.metrics import roc_auc_score as roc
 
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.operations.operation import Operation
+from fedot.core.pipelines.fit_workers import fit_workers_pool
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline, pipeline_encoders_validation
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -116,6 +119,74 @@ def test_pipeline_hierarchy_fit_correct(data_setup):
     assert final.fitted_operation is not None
 
 
+def test_pipeline_shared_parent_executed_once(data_setup):
+    train, test = train_test_data_setup(data_setup)
+
+    first = PrimaryNode(operation_type='scaling')
+    second = SecondaryNode(operation_type='logit', nodes_from=[first])
+    third = SecondaryNode(operation_type='lda', nodes_from=[first])
+    final = SecondaryNode(operation_type='logit', nodes_from=[second, third])
+    pipeline = Pipeline(final)
+
+    with patch.object(Operation, 'fit', autospec=True, side_effect=Operation.fit) as operation_fit:
+        pipeline.fit(input_data=train)
+
+    assert operation_fit.call_count == pipeline.length
+    assert len(pipeline.execution_counts) == pipeline.length
+    assert all(count == 1 for count in pipeline.execution_counts.values())
+
+    predicted = pipeline.predict(input_data=test)
+    assert all(count == 1 for count in pipeline.execution_counts.values())
+
+    # result must be the same as for the recursive execution of the nodes
+    recursive_predicted = final.predict(input_data=test)
+    assert np.array_equal(predicted.predict, recursive_predicted.predict)
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_pipeline_parallel_fit_predict_correct(data_setup, backend):
+    train, test = train_test_data_setup(data_setup)
+
+    branches = [PrimaryNode(operation_type) for operation_type in ['logit', 'lda', 'knn', 'qda']]
+    pipeline = Pipeline(SecondaryNode(operation_type='logit', nodes_from=branches))
+    parallel_pipeline = deepcopy(pipeline)
+
+    pipeline.fit(input_data=train)
+    parallel_pipeline.fit(input_data=train, n_jobs=2, backend=backend)
+
+    assert parallel_pipeline.is_fitted
+    assert all(count == 1 for count in parallel_pipeline.execution_counts.values())
+
+    predicted = pipeline.predict(input_data=test)
+    parallel_predicted = parallel_pipeline.predict(input_data=test, n_jobs=2, backend=backend)
+
+    assert np.array_equal(predicted.predict, parallel_predicted.predict)
+
+
+@pytest.mark.parametrize('chunk_size', [7, 1000])
+def test_pipeline_predict_iter_equal_to_predict(data_setup, chunk_size):
+    train, test = train_test_data_setup(data_setup)
+
+    first = PrimaryNode(operation_type='scaling')
+    branches = [SecondaryNode(operation_type, nodes_from=[first]) for operation_type in ['logit', 'lda', 'knn']]
+    pipeline = Pipeline(SecondaryNode(operation_type='logit', nodes_from=branches))
+    pipeline.fit(input_data=train)
+
+    for output_mode in ['default', 'labels']:
+        predicted = pipeline.predict(input_data=test, output_mode=output_mode)
+        chunks = list(pipeline.predict_iter(input_data=test, chunk_size=chunk_size, output_mode=output_mode))
+
+        assert len(chunks) == int(np.ceil(len(test.idx) / chunk_size))
+        assert all(len(chunk.predict) <= chunk_size for chunk in chunks)
+        chunks_predict = np.concatenate([chunk.predict for chunk in chunks])
+        if output_mode == 'labels':
+            assert np.array_equal(chunks_predict, predicted.predict)
+        else:
+            # the matrix products for the different numbers of rows may differ in the last bits
+            assert np.allclose(chunks_predict, predicted.predict, rtol=0, atol=1e-12)
+        assert np.array_equal(np.concatenate([chunk.idx for chunk in chunks]), predicted.idx)
+
+
 def test_pipeline_sequential_fit_correct(data_setup):
     data = data_setup
     train, _ = train_test_data_setup(data)
@@ -364,7 +435,7 @@ def test_delete_subtree():
 
 
 @pytest.mark.parametrize('data_fixture', ['classification_dataset'])
-def test_pipeline_fit_time_constraint(data_fixture, request):
+def test_pipeline_fit_time_constraint(data_fixture, request, monkeypatch):
     system = platform.system()
     if system == 'Linux':
         set_start_method("spawn", force=True)
@@ -374,30 +445,44 @@ def test_pipeline_fit_time_constraint(data_fixture, request):
     time_constraint = datetime.timedelta(minutes=0.01)
     predicted_first = None
     computation_time_first = None
-    process_start_time = time.time()
-    try:
-        predicted_first = test_pipeline_first.fit(input_data=train_data, time_constraint=time_constraint)
-    except Exception as ex:
-        received_ex = ex
-        computation_time_first = test_pipeline_first.computation_time
-        assert type(received_ex) is TimeoutError
-    comp_time_proc_with_first_constraint = (time.time() - process_start_time)
-    time_constraint = datetime.timedelta(minutes=0.05)
-    process_start_time = time.time()
-    try:
-        test_pipeline_first.fit(input_data=train_data, time_constraint=time_constraint)
-    except Exception as ex:
-        received_ex = ex
-        assert type(received_ex) is TimeoutError
-    comp_time_proc_with_second_constraint = (time.time() - process_start_time)
+    with monkeypatch.context() as patch:
+        # The result of the worker is never ready in time, so the time limit is expired on any machine
+        patch.setattr(Connection, 'poll', lambda self, timeout=0.0: False)
+        try:
+            predicted_first = test_pipeline_first.fit(input_data=train_data, time_constraint=time_constraint)
+        except Exception as ex:
+            received_ex = ex
+            computation_time_first = test_pipeline_first.computation_time
+            assert type(received_ex) is TimeoutError
+    time_constraint = datetime.timedelta(minutes=1)
+    predicted_constrained = test_pipeline_first.fit(input_data=train_data, time_constraint=time_constraint)
     test_pipeline_second = pipeline_first()
     predicted_second = test_pipeline_second.fit(input_data=train_data)
     computation_time_second = test_pipeline_second.computation_time
-    assert comp_time_proc_with_first_constraint < comp_time_proc_with_second_constraint
     assert computation_time_first is None
     assert predicted_first is None
     assert computation_time_second is not None
     assert predicted_second is not None
+    assert test_pipeline_first.is_fitted
+    assert test_pipeline_first.computation_time is not None
+    assert np.allclose(predicted_constrained.predict, predicted_second.predict)
+    assert np.allclose(test_pipeline_first.predict(test_data).predict,
+                       test_pipeline_second.predict(test_data).predict)
+
+
+def test_pipeline_fit_time_constraint_reuses_workers(classification_dataset):
+    train_data, _ = train_test_data_setup(data=classification_dataset)
+    time_constraint = datetime.timedelta(minutes=1)
+    pool = fit_workers_pool()
+
+    pipeline_first().fit(input_data=train_data, time_constraint=time_constraint)
+    started_workers = pool.started_workers
+
+    pipeline = pipeline_first()
+    pipeline.fit(input_data=train_data, time_constraint=time_constraint)
+    # The warm worker fitted the second pipeline, no new process was started
+    assert pool.started_workers == started_workers
+    assert pipeline.is_fitted
 
 
 def test_pipeline_fine_tune_all_nodes_correct(classification_dataset):
@@ -473,3 +558,24 @@ def test_pipeline_encoder_validation():
 
     assert has_imputer == True
     assert has_encoder == False
+
+
+def test_pipeline_preprocessing_of_table_with_strings():
+    rows_amount = 40
+    features = np.column_stack([np.arange(rows_amount), np.random.rand(rows_amount)]).astype(object)
+    features[3, 0] = 'unknown'
+    target = np.random.rand(rows_amount)
+    target[5] = np.nan
+    data = InputData(idx=np.arange(rows_amount), features=features, target=target,
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+
+    pipeline = Pipeline(PrimaryNode('ridge'))
+    pipeline.fit(data)
+    prediction = pipeline.predict(data)
+
+    # The row with the missing target is removed, the column is converted to numeric
+    assert len(prediction.predict) == rows_amount - 1
+    assert np.isnan(data.features[3, 0])
+    schema = data.supplementary_data.table_schema
+    assert not schema.converted_columns
+    assert schema.describes(data.features, data.target)
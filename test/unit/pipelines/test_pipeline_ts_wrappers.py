@@ -102,3 +102,34 @@ def test_fitted_values_correct():
         fitted_ts_values = fitted_func(train_predicted)
 
         assert len(fitted_ts_values.predict) == len(ts_input.target) - 4
+
+
+def test_in_sample_batch_forecast_equal_to_iterative():
+    forecast_length = 2
+    horizon = 10
+    train_input, predict_input = prepare_input_data(forecast_length, horizon)
+
+    first_lagged = PrimaryNode('lagged')
+    first_lagged.custom_params = {'window_size': 4}
+    second_lagged = PrimaryNode('lagged')
+    second_lagged.custom_params = {'window_size': 6}
+    scaling = SecondaryNode('scaling', nodes_from=[second_lagged])
+    ridge = SecondaryNode('ridge', nodes_from=[first_lagged])
+    pipeline = Pipeline(SecondaryNode('linear', nodes_from=[ridge, scaling]))
+    pipeline.fit(train_input)
+
+    batch_predicted = in_sample_ts_forecast(pipeline=pipeline,
+                                            input_data=predict_input,
+                                            horizon=horizon)
+
+    # Forecast for each step separately using the actual values as history
+    time_series = np.array(predict_input.features)
+    iterative_predicted = []
+    for history_len in range(len(time_series) - horizon, len(time_series), forecast_length):
+        step_input = InputData(idx=np.arange(history_len, history_len + forecast_length),
+                               features=time_series[:history_len], target=None,
+                               task=predict_input.task, data_type=DataTypesEnum.ts)
+        iterative_predicted.extend(np.ravel(pipeline.predict(step_input).predict))
+
+    assert len(batch_predicted) == horizon
+    assert np.allclose(batch_predicted, iterative_predicted[:horizon])
@@ -1,5 +1,7 @@
 import os
+from datetime import timedelta
 from random import seed
+from unittest.mock import patch
 
 import numpy as np
 from hyperopt import hp, tpe, rand
@@ -8,12 +10,18 @@ from sklearn.metrics import mean_squared_error as mse, roc_auc_score as roc
 
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.multi_modal import MultiModalData
+from fedot.core.operations.operation import Operation
+from fedot.core.pipelines.execution import nodes_in_topological_order
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.tuning.frozen_nodes import FrozenNodesCache
 from fedot.core.pipelines.tuning.sequential import SequentialTuner
+from fedot.core.pipelines.tuning.tuner_interface import HyperoptTuner, MAX_METRIC_VALUE
 from fedot.core.pipelines.tuning.unified import PipelineTuner
 from fedot.core.pipelines.tuning.search_space import SearchSpace
 from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.validation.tune.simple import fit_from_scratch, predict
 from test.unit.tasks.test_forecasting import get_ts_data
 
 seed(1)
@@ -167,6 +175,31 @@ def test_pipeline_tuner_classification_correct(data_fixture, request):
     assert is_tuning_finished
 
 
+def test_pipeline_tuner_parallel_trials(classification_dataset):
+    train_data, _ = train_test_data_setup(data=classification_dataset)
+    pipeline = get_complex_class_pipeline()
+
+    iterations = 8
+    pipeline_tuner = PipelineTuner(pipeline=pipeline, task=train_data.task,
+                                   iterations=iterations, n_jobs=2)
+    with patch.object(PipelineTuner, '_record_trial_result',
+                      side_effect=PipelineTuner._record_trial_result) as record_trial_result:
+        tuned_pipeline = pipeline_tuner.tune_pipeline(input_data=train_data, loss_function=roc)
+    assert record_trial_result.call_count == iterations
+    assert tuned_pipeline.is_fitted
+
+    # The trials are not started after the timeout, but at least one trial is finished
+    pipeline_tuner = PipelineTuner(pipeline=pipeline, task=train_data.task,
+                                   iterations=10000, timeout=timedelta(seconds=2), n_jobs=2)
+    with patch.object(PipelineTuner, '_suggest_trial', autospec=True,
+                      side_effect=PipelineTuner._suggest_trial) as suggest_trial, \
+            patch.object(PipelineTuner, '_record_trial_result',
+                         side_effect=PipelineTuner._record_trial_result) as record_trial_result:
+        pipeline_tuner.tune_pipeline(input_data=train_data, loss_function=roc)
+    assert 0 < suggest_trial.call_count < 10000
+    assert record_trial_result.call_count > 0
+
+
 @pytest.mark.parametrize('data_fixture', ['regression_dataset'])
 def test_sequential_tuner_regression_correct(data_fixture, request):
     """ Test SequentialTuner for pipeline based on hyperopt library """
@@ -334,3 +367,75 @@ def test_search_space_get_operation_parameter_range():
     assert default_operations == gbr_operations
     assert custom_without_replace_operations == gbr_operations
     assert custom_with_replace_operations == ['max_depth']
+
+
+@pytest.mark.parametrize('tuned_node_id', [0, 1, 3])
+def test_frozen_nodes_cache_fits_only_changed_nodes(regression_dataset, tuned_node_id):
+    train_data, test_data = train_test_data_setup(regression_dataset)
+    pipeline = get_complex_regr_pipeline()
+    reference_pipeline = get_complex_regr_pipeline()
+    tuned_node = pipeline.nodes[tuned_node_id]
+    changed_nodes_amount = len([node for node in pipeline.nodes
+                                if tuned_node in nodes_in_topological_order(node)])
+
+    nodes_cache = FrozenNodesCache(pipeline, tuned_node_id)
+    assert len(nodes_cache.frozen_ids) == pipeline.length - changed_nodes_amount
+
+    for trial in range(3):
+        params = {'ridge': {'alpha': trial + 1.0},
+                  'linear': {'fit_intercept': trial % 2 == 0},
+                  'scaling': {'with_mean': trial % 2 == 0},
+                  'xgbreg': {'n_estimators': 10 + trial}}[str(tuned_node)]
+        for tuned_pipeline in [pipeline, reference_pipeline]:
+            tuned_pipeline.nodes[tuned_node_id].custom_params = params
+
+        with patch.object(Operation, 'fit', autospec=True, side_effect=Operation.fit) as operation_fit:
+            fit_from_scratch(pipeline, train_data, nodes_cache)
+        predicted = predict(pipeline, test_data, nodes_cache)
+
+        expected_fits = pipeline.length if trial == 0 else changed_nodes_amount
+        assert operation_fit.call_count == expected_fits
+        assert pipeline.is_fitted
+
+        reference_pipeline.fit_from_scratch(train_data)
+        assert np.allclose(predicted.predict, reference_pipeline.predict(test_data).predict)
+
+
+def test_sequential_tuner_with_cv_uses_frozen_nodes(regression_dataset):
+    pipeline = get_complex_regr_pipeline()
+    tuner = SequentialTuner(pipeline=pipeline, task=regression_dataset.task, iterations=6)
+
+    with patch.object(Operation, 'fit', autospec=True, side_effect=Operation.fit) as operation_fit:
+        tuned_pipeline = tuner.tune_node(input_data=regression_dataset, node_index=0,
+                                         loss_function=mse, cv_folds=2)
+
+    # The init and final checks fit the whole pipeline, the trials fit only the root node after the first one
+    cv_folds = 2
+    iterations = 6
+    full_fits = 3
+    assert operation_fit.call_count == full_fits * cv_folds * pipeline.length + (iterations - 1) * cv_folds
+    assert tuned_pipeline is not None
+
+
+def test_sequential_tuner_multi_modal_data(regression_dataset):
+    data = MultiModalData({'data_source_table/first': regression_dataset,
+                           'data_source_table/second': regression_dataset})
+    first = SecondaryNode('ridge', nodes_from=[PrimaryNode('data_source_table/first')])
+    second = SecondaryNode('scaling', nodes_from=[PrimaryNode('data_source_table/second')])
+    pipeline = Pipeline(SecondaryNode('linear', nodes_from=[first, second]))
+    tuner = SequentialTuner(pipeline=pipeline, task=regression_dataset.task, iterations=4)
+
+    metric_values = []
+
+    def get_metric_value(*args, **kwargs):
+        metric_values.append(HyperoptTuner.get_metric_value(tuner, *args, **kwargs))
+        return metric_values[-1]
+
+    with patch.object(tuner, 'get_metric_value', side_effect=get_metric_value):
+        tuned_pipeline = tuner.tune_node(input_data=data, node_index=pipeline.nodes.index(first),
+                                         loss_function=mse)
+
+    # The trials on the multi-modal data are evaluated without the cache of the frozen nodes
+    assert metric_values
+    assert all(metric_value < MAX_METRIC_VALUE for metric_value in metric_values)
+    assert tuned_pipeline.is_fitted
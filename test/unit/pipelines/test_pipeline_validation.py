@@ -2,9 +2,10 @@ import pytest
 
 from fedot.core.dag.validation_rules import has_no_cycle, has_no_isolated_components, has_no_isolated_nodes, \
     has_no_self_cycled_nodes
+from fedot.core.optimisers.adapters import PipelineAdapter
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
-from fedot.core.pipelines.validation import (validate)
+from fedot.core.pipelines.validation import common_rules, validate
 from fedot.core.pipelines.validation_rules import has_correct_operation_positions, has_final_operation_as_model, \
     has_no_conflicts_in_decompose, has_no_conflicts_with_data_flow, has_no_data_flow_conflicts_in_ts_pipeline, \
     has_primary_nodes, is_pipeline_contains_ts_operations, only_non_lagged_operations_are_primary, \
@@ -404,3 +405,29 @@ def test_pipeline_with_resample_node():
         has_parent_contain_single_resample(incorrect_pipeline)
 
     assert str(exc.value) == f'{PIPELINE_ERROR_PREFIX} Resample node is not single parent node for child operation'
+
+
+class RestorationsCountingAdapter(PipelineAdapter):
+    def __init__(self):
+        super().__init__()
+        self.restorations_count = 0
+
+    def restore(self, opt_graph, computation_time=None):
+        self.restorations_count += 1
+        return super().restore(opt_graph, computation_time)
+
+
+def test_validation_restores_graph_once():
+    adapter = RestorationsCountingAdapter()
+    opt_graph = adapter.adapt(valid_pipeline())
+
+    assert validate(opt_graph, rules=common_rules, task=Task(TaskTypesEnum.classification), adapter=adapter)
+    assert adapter.restorations_count == 1
+
+    # The structural rules do not require the restoration
+    assert validate(opt_graph, rules=[has_no_cycle, has_no_self_cycled_nodes], adapter=adapter)
+    assert adapter.restorations_count == 1
+
+    with pytest.raises(ValueError) as exc:
+        validate(adapter.adapt(pipeline_with_cycle()), rules=[has_no_cycle], adapter=adapter)
+    assert str(exc.value) == f'{GRAPH_ERROR_PREFIX} Graph has cycles'
@@ -5,6 +5,8 @@ import shutil
 import numpy as np
 import pytest
 
+from fedot.core.pipelines import bundle
+from fedot.core.pipelines.bundle import LazyFittedOperation
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.template import PipelineTemplate, extract_subtree_root
@@ -402,3 +404,50 @@ def test_save_pipeline_with_np_int_type():
     pipeline = get_simple_ts_pipeline()
     pipeline.nodes[1].custom_params["test"] = np.int32(42)
     pipeline.save(path='test_save_pipeline_with_np_int_type')
+
+
+def test_pipeline_bundle_export_import_correctly(tmp_path):
+    train_data, test_data = get_classification_data()
+    pipeline = create_classification_pipeline_with_preprocessing()
+    pipeline.fit(train_data)
+    prediction_before_export = pipeline.predict(test_data)
+
+    path = os.path.join(tmp_path, 'pipeline.bundle')
+    pipeline.save_bundle(path)
+
+    pipeline_after = Pipeline()
+    pipeline_after.load_bundle(path)
+    assert pipeline_after.root_node.descriptive_id == pipeline.root_node.descriptive_id
+    # The fitted operations are loaded only on the first use
+    assert all(isinstance(node._fitted_operation, LazyFittedOperation) for node in pipeline_after.nodes)
+
+    prediction_after_export = pipeline_after.predict(test_data)
+    assert np.array_equal(prediction_before_export.predict, prediction_after_export.predict)
+    assert not any(isinstance(node._fitted_operation, LazyFittedOperation) for node in pipeline_after.nodes)
+
+    # The training set of the root knn is large enough to be mapped from the bundle
+    fitted_features = pipeline_after.root_node.fitted_operation.model._fit_X
+    while fitted_features.base is not None and not isinstance(fitted_features, np.memmap):
+        fitted_features = fitted_features.base
+    assert isinstance(fitted_features, np.memmap)
+
+    eager_pipeline = Pipeline()
+    eager_pipeline.load_bundle(path, lazy=False)
+    assert not any(isinstance(node._fitted_operation, LazyFittedOperation) for node in eager_pipeline.nodes)
+    assert np.array_equal(eager_pipeline.predict(test_data).predict, prediction_before_export.predict)
+
+
+def test_pipeline_bundle_without_mapped_arrays(tmp_path, monkeypatch):
+    # Before Python 3.8 the arrays are stored inside the pickled operations
+    monkeypatch.setattr(bundle, '_IS_OUT_OF_BAND_SUPPORTED', False)
+    train_data, test_data = get_classification_data()
+    pipeline = create_classification_pipeline_with_preprocessing()
+    pipeline.fit(train_data)
+
+    path = os.path.join(tmp_path, 'pipeline.bundle')
+    pipeline.save_bundle(path)
+    pipeline_after = Pipeline()
+    pipeline_after.load_bundle(path)
+
+    assert all(not node._fitted_operation.section['buffers'] for node in pipeline_after.nodes)
+    assert np.array_equal(pipeline.predict(test_data).predict, pipeline_after.predict(test_data).predict)
@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+import numpy as np
 import pytest
 from sklearn.metrics import roc_auc_score as roc_auc
 
@@ -104,6 +105,28 @@ def test_cv_tabular_predictions_correct():
     assert dataset_size == target_size
 
 
+def test_cv_parallel_folds_equal_to_sequential():
+    dataset = get_iris_data()
+    metrics = [ClassificationMetricsEnum.accuracy, ClassificationMetricsEnum.logloss]
+    log = default_log(__name__)
+
+    sequential_pipeline = pipeline_simple()
+    sequential_metrics = table_metric_calculation(pipeline=sequential_pipeline, reference_data=dataset,
+                                                  cv_folds=3, metrics=metrics, log=log, n_jobs=1)
+    parallel_pipeline = pipeline_simple()
+    parallel_metrics = table_metric_calculation(pipeline=parallel_pipeline, reference_data=dataset,
+                                                cv_folds=3, metrics=metrics, log=log, n_jobs=3)
+
+    assert parallel_metrics == pytest.approx(sequential_metrics)
+    assert parallel_pipeline.is_fitted
+
+    sequential_predictions, sequential_target = cv_tabular_predictions(pipeline_simple(), dataset, cv_folds=3)
+    parallel_predictions, parallel_target = cv_tabular_predictions(pipeline_simple(), dataset, cv_folds=3,
+                                                                   n_jobs=3)
+    assert np.array_equal(parallel_target, sequential_target)
+    assert len(parallel_predictions) == len(sequential_predictions)
+
+
 def test_composer_with_cv_optimization_correct():
     task = Task(task_type=TaskTypesEnum.classification)
     dataset_to_compose, dataset_to_validate = get_data(task)